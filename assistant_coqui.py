@@ -5,13 +5,16 @@ Utilise des modèles TTS plus récents et compatibles
 """
 
 import speech_recognition as sr
-import requests
 import json
 import time
-import os
 import sys
 from datetime import datetime
 
+from client_ollama import get_client
+from synthese_vocale import coqui_synthesize, get_synthese
+from sortie_audio import get_sortie_audio
+from pipeline_synthese import PipelineSynthese
+
 # Import TTS avec gestion d'erreur
 try:
     from TTS.api import TTS
@@ -25,6 +28,9 @@ class AssistantVocalCoqui:
         # Configuration Ollama
         self.ollama_url = "http://127.0.0.1:11434"
         self.model_name = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
+        self.synthese = get_synthese()  # Processus SAPI persistant pour le fallback
+        self.audio_output = get_sortie_audio()  # Lecture en mémoire de l'audio Coqui
         
         # Configuration reconnaissance vocale
         self.recognizer = sr.Recognizer()
@@ -92,30 +98,14 @@ class AssistantVocalCoqui:
             return self.speak_sapi(text)
     
     def speak_coqui(self, text):
-        """Synthèse avec Coqui TTS"""
+        """Synthèse avec Coqui TTS (en mémoire, sans fichier temporaire)"""
         try:
-            # Fichier temporaire
-            output_file = "temp_tts.wav"
-            
-            # Générer l'audio
-            start_time = time.time()
-            self.tts_engine.tts_to_file(text=text, file_path=output_file)
-            duration = time.time() - start_time
-            
-            # Lire l'audio avec Windows
-            import subprocess
-            subprocess.run([
-                "powershell", "-Command", 
-                f"(New-Object Media.SoundPlayer '{output_file}').PlaySync()"
-            ], capture_output=True)
-            
-            # Nettoyer
-            try:
-                os.remove(output_file)
-            except:
-                pass
+            # Générer l'audio phrase par phrase et le lire directement depuis la mémoire
+            pipeline = PipelineSynthese(lambda sentence: coqui_synthesize(self.tts_engine, sentence),
+                                        lambda audio: self.audio_output.play(*audio))
+            stats = pipeline.speak(text)
             
-            print(f"✅ Coqui TTS réussi ({duration:.2f}s)")
+            print(f"✅ Coqui TTS réussi (premier son {stats['premier_son']:.2f}s, total {stats['total']:.2f}s)")
             return True
             
         except Exception as e:
@@ -125,23 +115,14 @@ class AssistantVocalCoqui:
             return self.speak_sapi(text)
     
     def speak_sapi(self, text):
-        """Synthèse avec Windows SAPI (fallback)"""
+        """Synthèse avec Windows SAPI (fallback, processus de synthèse persistant)"""
         try:
             # Nettoyer le texte
-            safe_text = text.replace('"', "'").replace('\\', '')
-            if len(safe_text) > 500:
-                safe_text = safe_text[:497] + "..."
-            
-            # Commande PowerShell SAPI
-            cmd = f'powershell -Command "Add-Type -AssemblyName System.Speech; $s = New-Object System.Speech.Synthesis.SpeechSynthesizer; $s.SetOutputToDefaultAudioDevice(); $s.Speak(\\"{safe_text}\\"); $s.Dispose()"'
+            safe_text = text.replace('\n', ' ').replace('\r', ' ')
             
-            result = os.system(cmd)
-            if result == 0:
-                print("✅ SAPI TTS réussi")
-                return True
-            else:
-                print(f"❌ Erreur SAPI: {result}")
-                return False
+            self.synthese.speak(safe_text)
+            print("✅ SAPI TTS réussi")
+            return True
                 
         except Exception as e:
             print(f"❌ Erreur SAPI: {e}")
@@ -259,8 +240,6 @@ class AssistantVocalCoqui:
     
     def query_mistral(self, prompt):
         """Requête Mistral"""
-        url = f"{self.ollama_url}/api/generate"
-        
         payload = {
             "model": self.model_name,
             "prompt": f"Réponds en français de manière concise : {prompt}",
@@ -268,7 +247,7 @@ class AssistantVocalCoqui:
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.client.post("/api/generate", payload)
             response.raise_for_status()
             result = response.json()
             return result.get('response', '').strip()
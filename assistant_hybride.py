@@ -11,6 +11,8 @@ import time
 import sys
 from datetime import datetime
 
+from client_ollama import get_client
+
 # Tentative d'import des composants audio
 AUDIO_AVAILABLE = False
 try:
@@ -27,6 +29,7 @@ class AssistantVocalHybride:
         # Configuration Ollama
         self.ollama_url = "http://127.0.0.1:11434"
         self.model_name = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
         
         # Mode de fonctionnement
         self.audio_mode = AUDIO_AVAILABLE and not force_text_mode
@@ -122,8 +125,6 @@ class AssistantVocalHybride:
     
     def query_mistral(self, prompt):
         """Envoie une requête à l'API Ollama Mistral"""
-        url = f"{self.ollama_url}/api/generate"
-        
         payload = {
             "model": self.model_name,
             "prompt": f"Réponds en français de manière concise et naturelle à cette question ou demande : {prompt}",
@@ -134,7 +135,7 @@ class AssistantVocalHybride:
             print(f"🤖 Envoi à Mistral...")
             start_time = time.time()
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.client.post("/api/generate", payload)
             response.raise_for_status()
             
             end_time = time.time()
@@ -215,7 +216,7 @@ class AssistantVocalHybride:
         
         # Test Ollama
         try:
-            response = requests.get(f"{self.ollama_url}", timeout=5)
+            response = self.client.get(timeout=5)
             if response.status_code == 200:
                 print("✅ Ollama accessible")
             else:
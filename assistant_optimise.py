@@ -7,17 +7,20 @@ Version optimisée pour éviter les conflits TTS
 
 import speech_recognition as sr
 import pyttsx3
-import requests
 import json
 import time
 import threading
 from datetime import datetime
 
+from client_ollama import get_client
+from synthese_vocale import get_synthese
+
 class AssistantVocalOptimise:
     def __init__(self):
         # Configuration API
-        self.api_url = "http://127.0.0.1:11434/api/generate"
+        self.ollama_url = "http://127.0.0.1:11434"
         self.model = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
         
         # Initialisation différée des composants
         self.tts_engine = None
@@ -124,11 +127,8 @@ class AssistantVocalOptimise:
         
         # Méthode 3: Fallback système
         try:
-            import os
-            # Utiliser PowerShell SAPI comme dernière option
-            safe_text = text.replace('"', "'")
-            cmd = f'powershell -Command "Add-Type -AssemblyName System.Speech; $synth = New-Object System.Speech.Synthesis.SpeechSynthesizer; $synth.SetOutputToDefaultAudioDevice(); $synth.Speak(\\"{safe_text}\\")"'
-            os.system(cmd)
+            # Processus SAPI persistant comme dernière option
+            get_synthese().speak(text)
             print("✅ TTS réussie (méthode système)")
             return True
             
@@ -199,12 +199,7 @@ class AssistantVocalOptimise:
                 }
             }
             
-            response = requests.post(
-                self.api_url,
-                json=data,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
+            response = self.client.post("/api/generate", data)
             
             if response.status_code == 200:
                 result = response.json()
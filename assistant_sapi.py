@@ -5,18 +5,24 @@ Version corrigée pour éviter les conflits audio
 """
 
 import speech_recognition as sr
-import requests
 import json
 import time
-import os
 import sys
 from datetime import datetime
 
+from client_ollama import get_client
+from synthese_vocale import get_synthese
+
 class AssistantVocalSAPI:
     def __init__(self):
         # Configuration Ollama
         self.ollama_url = "http://127.0.0.1:11434"
         self.model_name = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
+        
+        # Processus de synthèse SAPI persistant (au lieu d'un PowerShell par phrase)
+        self.synthese = get_synthese()
+        self.synthese.preload()
         
         # Configuration reconnaissance vocale
         self.recognizer = sr.Recognizer()
@@ -44,43 +50,19 @@ class AssistantVocalSAPI:
         print(f"🔊 Assistant: {text}")
         
         try:
-            # Nettoyer le texte pour éviter les problèmes PowerShell
-            safe_text = text.replace('"', "'").replace('\\', '').replace('`', "'")
-            safe_text = safe_text.replace('\n', ' ').replace('\r', ' ')
+            safe_text = text.replace('\n', ' ').replace('\r', ' ')
             
             # Limiter la longueur pour éviter les timeouts
             if len(safe_text) > 500:
                 safe_text = safe_text[:497] + "..."
             
-            # Commande PowerShell pour Windows SAPI
-            cmd = f"""powershell -Command "
-            Add-Type -AssemblyName System.Speech;
-            $synth = New-Object System.Speech.Synthesis.SpeechSynthesizer;
-            $synth.SetOutputToDefaultAudioDevice();
-            $synth.Rate = 0;
-            $synth.Volume = 100;
-            $voices = $synth.GetInstalledVoices();
-            foreach($voice in $voices) {{
-                if($voice.VoiceInfo.Name -like '*Hortense*') {{
-                    $synth.SelectVoice($voice.VoiceInfo.Name);
-                    break;
-                }}
-            }}
-            $synth.Speak('{safe_text}');
-            $synth.Dispose();"
-            """
-            
-            # Exécution avec timeout
+            # Processus SAPI persistant (voix Hortense sélectionnée au démarrage)
             start_time = time.time()
-            result = os.system(cmd)
+            self.synthese.speak(safe_text, rate=0)
             duration = time.time() - start_time
             
-            if result == 0:
-                print(f"✅ Synthèse SAPI réussie ({duration:.2f}s)")
-                return True
-            else:
-                print(f"⚠️ Code retour SAPI: {result}")
-                return False
+            print(f"✅ Synthèse SAPI réussie ({duration:.2f}s)")
+            return True
                 
         except Exception as e:
             print(f"❌ Erreur synthèse SAPI: {e}")
@@ -94,18 +76,9 @@ class AssistantVocalSAPI:
         print(f"🔊 Assistant: {text}")
         
         try:
-            safe_text = text.replace('"', "'").replace('\\', '')
-            
-            # Version simplifiée pour les phrases courtes
-            cmd = f'powershell -Command "Add-Type -AssemblyName System.Speech; $s = New-Object System.Speech.Synthesis.SpeechSynthesizer; $s.SetOutputToDefaultAudioDevice(); $s.Speak(\\"{safe_text}\\"); $s.Dispose()"'
-            
-            result = os.system(cmd)
-            if result == 0:
-                print("✅ Synthèse rapide réussie")
-                return True
-            else:
-                print(f"⚠️ Erreur synthèse rapide: {result}")
-                return False
+            self.synthese.speak(text)
+            print("✅ Synthèse rapide réussie")
+            return True
                 
         except Exception as e:
             print(f"❌ Erreur synthèse rapide: {e}")
@@ -234,8 +207,6 @@ class AssistantVocalSAPI:
     
     def query_mistral(self, prompt):
         """Envoie une requête à Mistral"""
-        url = f"{self.ollama_url}/api/generate"
-        
         payload = {
             "model": self.model_name,
             "prompt": f"Réponds en français de manière concise et naturelle : {prompt}",
@@ -246,7 +217,7 @@ class AssistantVocalSAPI:
             print(f"🤖 Envoi: {prompt}")
             start_time = time.time()
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.client.post("/api/generate", payload)
             response.raise_for_status()
             
             duration = time.time() - start_time
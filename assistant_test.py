@@ -11,11 +11,14 @@ import json
 import time
 from datetime import datetime
 
+from client_ollama import get_client
+
 class AssistantVocalTest:
     def __init__(self):
         # Configuration Ollama
         self.ollama_url = "http://127.0.0.1:11434"
         self.model_name = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
         
         print("🤖 Assistant Vocal (Mode Test) initialisé")
         print("💡 Tapez vos questions ou 'quit' pour quitter")
@@ -23,8 +26,6 @@ class AssistantVocalTest:
     
     def query_mistral(self, prompt):
         """Envoie une requête à l'API Ollama Mistral"""
-        url = f"{self.ollama_url}/api/generate"
-        
         payload = {
             "model": self.model_name,
             "prompt": f"Réponds en français de manière concise et naturelle à cette question ou demande : {prompt}",
@@ -35,7 +36,7 @@ class AssistantVocalTest:
             print(f"🤖 Envoi à Mistral...")
             start_time = time.time()
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.client.post("/api/generate", payload)
             response.raise_for_status()
             
             end_time = time.time()
@@ -95,7 +96,7 @@ class AssistantVocalTest:
         
         # Test ping Ollama
         try:
-            response = requests.get(f"{self.ollama_url}", timeout=5)
+            response = self.client.get(timeout=5)
             if response.status_code == 200:
                 print("✅ Ollama accessible")
             else:
@@ -106,7 +107,7 @@ class AssistantVocalTest:
         
         # Test liste des modèles
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self.client.get("/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 print(f"✅ {len(models)} modèle(s) disponible(s)")
@@ -12,6 +12,8 @@ import time
 import sys
 from datetime import datetime
 
+from client_ollama import get_client
+
 # Import de la synthèse vocale
 try:
     import pyttsx3
@@ -26,6 +28,7 @@ class AssistantVocalTTS:
         # Configuration Ollama
         self.ollama_url = "http://127.0.0.1:11434"
         self.model_name = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
         
         # Configuration de la synthèse vocale
         self.tts_enabled = TTS_AVAILABLE
@@ -79,8 +82,6 @@ class AssistantVocalTTS:
     
     def query_mistral(self, prompt):
         """Envoie une requête à l'API Ollama Mistral"""
-        url = f"{self.ollama_url}/api/generate"
-        
         payload = {
             "model": self.model_name,
             "prompt": f"Réponds en français de manière concise et naturelle à cette question ou demande : {prompt}",
@@ -91,7 +92,7 @@ class AssistantVocalTTS:
             print(f"🤖 Envoi à Mistral...")
             start_time = time.time()
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.client.post("/api/generate", payload)
             response.raise_for_status()
             
             end_time = time.time()
@@ -174,7 +175,7 @@ class AssistantVocalTTS:
         
         # Test Ollama
         try:
-            response = requests.get(f"{self.ollama_url}", timeout=5)
+            response = self.client.get(timeout=5)
             if response.status_code == 200:
                 print("✅ Ollama accessible")
             else:
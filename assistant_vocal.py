@@ -28,6 +28,29 @@ import subprocess
 import re
 from datetime import datetime
 
+from client_ollama import get_client
+from cache_reponses import ReponseCache, make_key
+from index_applications import APP_SEARCH_PROMPT, POPULAR_APP_KEYWORDS, CatalogueIndex
+from automate_motscles import AutomateMotsCles
+from competences import MoteurCompetences
+from synthese_vocale import SAPI_VOICE, coqui_synthesize, get_synthese
+from cache_audio import CacheAudio, audio_key
+from sortie_audio import get_sortie_audio
+from pipeline_synthese import PipelineSynthese, split_sentences
+from mot_reveil import DetecteurMotReveil
+from detection_voix import DetecteurActiviteVocale
+from fin_de_phrase import NOISE_HISTORY_SECONDS, DetecteurFinDePhrase
+from capture_audio import CaptureMicro
+from interruption import BARGE_IN_ENABLED, EcouteInterruption, JetonAnnulation, NiveauEcho, OperationAnnulee
+from file_parole import FileParole
+from classifieur_intentions import ClassifieurIntentions, MIN_PROBABILITY as INTENT_CLASSIFIER_MIN_PROBABILITY, log_command
+from recherche_semantique import MIN_SIMILARITY as SEMANTIC_MIN_SIMILARITY, IndexSemantique, app_document
+
+try:
+    import config
+except ImportError:
+    config = None
+
 # Import Coqui TTS avec gestion d'erreur
 try:
     from TTS.api import TTS
@@ -35,15 +58,69 @@ try:
 except ImportError:
     COQUI_AVAILABLE = False
 
+# Schéma JSON imposé à Mistral pour l'analyse d'intention (format Ollama)
+INTENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intention": {
+            "type": "string",
+            "enum": ["ouvrir_application", "fermer_application", "lister_applications", "rechercher_web", "question"]
+        },
+        "application": {"type": ["string", "null"]},
+        "recherche": {"type": ["string", "null"]},
+        "confiance": {"type": "number"}
+    },
+    "required": ["intention", "application", "recherche", "confiance"]
+}
+
+# En dessous de ce seuil, une intention d'action est traitée comme une question
+INTENT_MIN_CONFIDENCE = 0.5
+
+# Phrases fixes rendues une fois puis rejouées depuis le cache audio
+FIXED_PHRASES = [
+    "Présent ! Je vous écoute.",
+    "Tâche terminée ! Que puis-je faire d'autre pour vous ?",
+    "Traitement terminé avec succès !",
+    "Question détectée. Je consulte Mistral pour vous répondre.",
+    "Conversation terminée. Redites 'Assistant' pour me réveiller.",
+    "Désolé, je n'ai pas compris votre parole. Pouvez-vous répéter plus clairement ?",
+    "Je n'ai rien entendu pendant 15 secondes. Je retourne en mode veille. Redites 'Assistant' pour me réveiller.",
+]
+SAPI_RATE = 1
+
+# Confiance de la résolution locale d'application en dessous de laquelle l'IA est consultée
+APP_MATCH_THRESHOLD = getattr(config, "SEUIL_CORRESPONDANCE_APP", 0.7)
+
+# Délai pour enchaîner la commande sans pause après le mot de réveil (sinon : "Présent !")
+WAKE_FOLLOW_UP_SECONDS = 0.6
+
+# Mots qui terminent le mode conversation
+CONVERSATION_END_WORDS = ['fini', 'terminé', 'stop conversation', 'pause']
+
+# Intentions de contrôle dont la commande est complète dès qu'elles sont reconnues (pas "aide" : "comment..." continue)
+COMPLETE_CONTROL_INTENTS = {"arret", "silence", "test_voix", "voix_naturelle", "voix_classique", "actualiser"}
+
 class AssistantVocal:
     def __init__(self):
+        self.startup_time = time.time()
+        self.first_reply_time = None
+        
         # Configuration Ollama
         self.ollama_url = "http://127.0.0.1:11434"
         self.model_name = "mistral:instruct"
+        self.client = get_client(self.ollama_url)  # Session HTTP partagée (keep-alive)
+        self.response_cache = ReponseCache()  # Cache des prompts d'aide déterministes
+        
+        # Préchargement du modèle en arrière-plan pendant le reste de l'initialisation
+        self._warmup_lock = threading.Lock()  # Tenu pendant un préchargement : jamais deux en parallèle
+        self.warm_up_model("démarrage")
         
         # Configuration de la reconnaissance vocale
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        # Micro ouvert une seule fois : un thread le lit en continu dans un tampon circulaire
+        self.capture = CaptureMicro(sr.Microphone()).start()
+        self.microphone = self.capture.reader()
+        self.speech_end_position = 0  # Trame du micro où l'assistant a fini de parler
         
         # Configuration optimisée pour éviter les coupures de parole
         self.recognizer.energy_threshold = 4000  # Seuil d'énergie plus élevé
@@ -51,8 +128,23 @@ class AssistantVocal:
         self.recognizer.pause_threshold = 1.5  # Attendre 1.5 secondes de silence avant de s'arrêter
         self.recognizer.phrase_time_limit = None  # Pas de limite de temps pour une phrase
         self.recognizer.non_speaking_duration = 0.8  # Durée de silence pour considérer que la phrase est finie
+        # (pause_threshold ne sert plus qu'au repli Google du mot de réveil : les commandes passent par listen_utterance)
+        self.vad = DetecteurActiviteVocale()  # Segments sans parole écartés avant la reconnaissance
+        
+        # Interruption vocale : second lecteur du tampon micro, écouté pendant la génération et la lecture
+        self.barge_in_microphone = self.capture.reader() if BARGE_IN_ENABLED else None
+        self.echo_level = NiveauEcho()  # Niveau du micro pendant que l'assistant parle, mesuré une fois
+        self.current_token = None  # Jeton d'annulation de la commande en cours
+        self.pending_audio = None  # Phrase déjà enregistrée (interruption, commande enchaînée), à traiter ensuite
+        self.pending_transcript = None  # Sa transcription, si elle est déjà faite
         
         # Configuration de la synthèse vocale
+        self.synthese = get_synthese()  # Processus SAPI persistant (au lieu d'un PowerShell par phrase)
+        self.synthese.preload()
+        self.audio_output = get_sortie_audio()
+        self.audio_cache = CacheAudio()
+        self.prerender_phrases()
+        self.speech_queue = FileParole(self._speak_now)  # Les phrases sont prononcées pendant le traitement
         self.tts_engine = pyttsx3.init()
         self.setup_tts()
         
@@ -68,9 +160,37 @@ class AssistantVocal:
         # Système de fonctions d'actions
         self.setup_action_system()
         
-        print("🤖 Assistant Vocal initialisé")
+        print(f"🤖 Assistant Vocal initialisé en {time.time() - self.startup_time:.2f}s")
         self.speak("Bonjour ! Je suis votre assistant vocal. Dites 'Assistant' pour me réveiller.")
     
+    def warm_up_model(self, reason):
+        """Précharge le modèle Ollama en arrière-plan pour éviter le load_duration au premier appel"""
+        if not self._warmup_lock.acquire(blocking=False):
+            return  # Préchargement déjà en cours (thread du mot de réveil ou commande)
+        
+        def _warmup():
+            try:
+                start_time = time.time()
+                result = self.client.warmup(self.model_name)
+                load_duration = result.get('load_duration', 0) / 1e9
+                print(f"🔥 Modèle prêt ({reason}) en {time.time() - start_time:.2f}s - chargement: {load_duration:.2f}s")
+            except Exception as e:
+                print(f"⚠️ Préchargement du modèle impossible: {e}")
+            finally:
+                self._warmup_lock.release()
+        
+        threading.Thread(target=_warmup, daemon=True).start()
+    
+    def _log_model_timing(self, result):
+        """Affiche le temps de chargement du modèle et le délai de la première réponse"""
+        load_duration = result.get('load_duration', 0) / 1e9
+        if load_duration > 0.5:
+            print(f"⏳ Chargement du modèle: {load_duration:.2f}s")
+        
+        if self.first_reply_time is None:
+            self.first_reply_time = time.time() - self.startup_time
+            print(f"⏱️ Première réponse {self.first_reply_time:.2f}s après le démarrage")
+    
     def setup_action_system(self):
         """Configure le système de fonctions d'actions"""
         # Dictionnaire des fonctions d'actions disponibles
@@ -91,6 +211,31 @@ class AssistantVocal:
             "naviguer": ["va sur", "navigue", "visite", "site"]
         }
         
+        # Commandes de contrôle de l'assistant, testées avant les actions (par ordre de priorité)
+        self.control_keywords = {
+            "arret": ['arrêt', 'stop', 'au revoir', 'fermer assistant', 'arrête toi'],
+            "silence": ['silence', 'tais-toi', 'chut'],
+            "test_voix": ['test voix', 'test audio'],
+            "voix_naturelle": ['voix naturelle', 'coqui', 'meilleure voix'],
+            "voix_classique": ['voix française', 'voix windows', 'voix classique', 'sapi', 'hortense'],
+            "actualiser": ['actualise les applications', 'recharge les applications', 'mets à jour les applications'],
+            "aide": ['aide', 'help', 'comment', 'que puis-je', 'guide']
+        }
+        self.build_keyword_automaton()
+        
+        # Compétences locales (heure, date, calcul, conversion) consultées avant le LLM
+        self.skills = MoteurCompetences()
+        
+        # Classifieur d'intentions local, consulté avant le LLM quand aucun mot-clé ne correspond
+        self.intent_classifier = None
+        self.train_intent_classifier()
+        
+        # Résolution d'applications : l'IA n'est consultée que sous ce seuil de confiance locale
+        self.app_match_threshold = APP_MATCH_THRESHOLD
+        self.semantic_match_threshold = SEMANTIC_MIN_SIMILARITY  # Similarité cosinus minimale de la recherche sémantique
+        self.semantic_index = IndexSemantique(self.client)  # Un seul magasin d'embeddings, reconstruit en place
+        self.app_resolution_stats = {"locale": 0, "semantique": 0, "ia": 0}
+        
         # Charger les applications scannées
         self.load_scanned_applications()
         
@@ -109,11 +254,11 @@ class AssistantVocal:
                 print(f"📱 {len(scanned_apps)} applications chargées depuis le scan")
                 
                 # Convertir au format interne
-                self.applications = {}
-                self.app_commands_map = {}  # Mapping commandes vocales -> app key
+                applications = {}
+                app_commands_map = {}  # Mapping commandes vocales -> app key
                 
                 for app_key, app_data in scanned_apps.items():
-                    self.applications[app_key] = {
+                    applications[app_key] = {
                         "nom": app_data["nom"],
                         "chemin": app_data["chemin"],
                         "processus": app_data["processus"]
@@ -121,9 +266,15 @@ class AssistantVocal:
                     
                     # Créer le mapping des commandes vocales
                     for command in app_data.get("commandes", []):
-                        self.app_commands_map[command.lower()] = app_key
+                        app_commands_map[command.lower()] = app_key
                 
-                print(f"🎯 {len(self.app_commands_map)} commandes vocales mappées")
+                print(f"🎯 {len(app_commands_map)} commandes vocales mappées")
+                if getattr(self, "catalog_index", None) is None:
+                    self.applications = applications
+                    self.app_commands_map = app_commands_map
+                    self.build_catalog_index()
+                else:
+                    self.update_catalog_index(applications, app_commands_map)
                 return True
                 
         except Exception as e:
@@ -182,6 +333,50 @@ class AssistantVocal:
             for word in name_words:
                 if len(word) > 2:
                     self.app_commands_map[word] = app_key
+        
+        self.build_catalog_index()
+    
+    def build_catalog_index(self):
+        """Construit l'index du catalogue (une seule fois par chargement d'applications)"""
+        start_time = time.perf_counter()
+        self.catalog_index = CatalogueIndex(self.applications, self.app_commands_map)
+        self.popular_app_keys = self.catalog_index.popular_apps(POPULAR_APP_KEYWORDS)
+        print(f"🗂️ Index du catalogue construit en {(time.perf_counter() - start_time) * 1000:.0f} ms")
+        self.build_semantic_index()
+    
+    def update_catalog_index(self, applications, app_commands_map):
+        """Applique un nouveau scan application par application, sans reconstruire l'index"""
+        start_time = time.perf_counter()
+        index = self.catalog_index
+        new_commands = {}
+        for command, app_key in app_commands_map.items():
+            new_commands.setdefault(app_key, []).append(command)
+        
+        removed = [app_key for app_key in index.applications if app_key not in applications]
+        changed = [app_key for app_key, app_data in applications.items()
+                   if index.applications.get(app_key) != app_data
+                   or sorted(index.commands_by_app.get(app_key, [])) != sorted(new_commands.get(app_key, []))]
+        for app_key in removed:
+            index.remove_application(app_key)
+        for app_key in changed:
+            index.add_application(app_key, applications[app_key], new_commands.get(app_key, []))
+        
+        self.applications = index.applications
+        self.app_commands_map = index.commands
+        self.popular_app_keys = index.popular_apps(POPULAR_APP_KEYWORDS)
+        print(f"🗂️ Index du catalogue mis à jour en {(time.perf_counter() - start_time) * 1000:.0f} ms "
+              f"({len(changed)} ajoutée(s) ou modifiée(s), {len(removed)} retirée(s))")
+        if removed or changed:
+            self.build_semantic_index()  # Seuls les documents modifiés sont recalculés
+        return len(changed), len(removed)
+    
+    def build_semantic_index(self):
+        """Calcule les embeddings du catalogue en arrière-plan (rechargés depuis le disque si inchangés)"""
+        documents = {
+            app_key: app_document(app_data, self.catalog_index.commands_by_app.get(app_key, []))
+            for app_key, app_data in self.applications.items()
+        }
+        self.semantic_index.build_async(documents)  # Un seul thread de construction, dernière version appliquée
     
     def setup_tts(self):
         """Configure les paramètres de synthèse vocale avec gestion robuste"""
@@ -249,103 +444,197 @@ class AssistantVocal:
             print("🔧 Utilisation de Windows SAPI")
             self.current_tts_method = "sapi"
     
-    def speak(self, text):
-        """Synthèse vocale intelligente - Coqui TTS puis SAPI"""
+    def speak(self, text, wait=True):
+        """Synthèse vocale intelligente - Coqui TTS puis SAPI
+        
+        La phrase passe par la file de parole : avec wait=False, retour
+        immédiat et le traitement continue pendant qu'elle est prononcée.
+        """
         if not text or not text.strip():
             return False
+        if self.current_token and self.current_token.cancelled:
+            return False  # Commande interrompue : plus rien à dire
         
+        enonce = self.speech_queue.put(text)
+        return enonce.wait() if wait else True
+    
+    def wait_speech(self):
+        """Attend la fin des phrases en file (avant de réécouter le micro)"""
+        self.speech_queue.wait()
+        # Ne pas s'écouter soi-même : l'audio capté pendant la lecture est sauté
+        self.microphone.skip_to(self.speech_end_position)
+    
+    def flush_speech(self):
+        """Abandonne les phrases pas encore prononcées"""
+        dropped = self.speech_queue.flush()
+        if dropped:
+            print(f"🔇 {dropped} phrase(s) abandonnée(s)")
+    
+    def interrupt_speech(self):
+        """Coupe la parole en cours et abandonne les phrases en attente"""
+        self.flush_speech()
+        self.audio_output.stop()
+        self.synthese.interrupt()
+    
+    def process_with_barge_in(self, command):
+        """Traite une commande en surveillant le micro : si l'utilisateur parle, tout s'arrête
+        
+        La nouvelle phrase est gardée dans pending_audio pour la boucle d'écoute.
+        """
+        token = JetonAnnulation()
+        token.on_cancel(self.interrupt_speech)
+        listener = None
+        if self.barge_in_microphone is not None:
+            listener = EcouteInterruption(self.barge_in_microphone, self.recognizer.energy_threshold, self.on_barge_in,
+                                          is_playing=lambda: self.speech_queue.pending() > 0, echo=self.echo_level)
+            listener.start(token)
+        
+        self.current_token = token
+        try:
+            self.process_command(command)
+            self.wait_speech()  # La lecture reste interruptible
+        except OperationAnnulee as e:
+            print(f"✋ {e}")
+        finally:
+            if listener is not None:
+                listener.stop()
+            self.current_token = None
+        return token.cancelled
+    
+    def _check_cancelled(self):
+        """Lève OperationAnnulee si la commande en cours a été interrompue"""
+        if self.current_token:
+            self.current_token.check()
+    
+    def on_barge_in(self, pcm, sample_rate, sample_width):
+        """Phrase enregistrée par l'écoute d'interruption"""
+        self.pending_audio = sr.AudioData(pcm, sample_rate, sample_width)
+        self.microphone.skip_to(self.barge_in_microphone.position)  # Ne pas la réentendre dans la boucle d'écoute
+    
+    def _speak_now(self, text):
+        """Prononce text immédiatement (thread de la file de parole)"""
         print(f"🔊 Assistant: {text}")
         
-        # Méthode 1: Coqui TTS (voix naturelle)
-        if self.current_tts_method in ["auto", "coqui"] and self.coqui_engine:
-            if self.speak_coqui(text):
-                return True
-            else:
-                print("🔄 Basculement vers SAPI...")
-                self.current_tts_method = "sapi"
-        
-        # Méthode 2: Windows SAPI (fallback)
-        return self.speak_sapi(text)
+        try:
+            # Méthode 1: Coqui TTS (voix naturelle)
+            if self.current_tts_method in ["auto", "coqui"] and self.coqui_engine:
+                if self.speak_coqui(text):
+                    return True
+                else:
+                    print("🔄 Basculement vers SAPI...")
+                    self.current_tts_method = "sapi"
+            
+            # Méthode 2: Windows SAPI (fallback)
+            return self.speak_sapi(text)
+        finally:
+            self.speech_end_position = self.capture.written
     
     def speak_coqui(self, text):
-        """Synthèse avec Coqui TTS (voix naturelle)"""
+        """Synthèse avec Coqui TTS (voix naturelle), en mémoire jusqu'à la sortie audio"""
         try:
-            # Fichier temporaire
-            output_file = "temp_coqui_tts.wav"
-            
-            # Générer l'audio avec Coqui
-            start_time = time.time()
-            self.coqui_engine.tts_to_file(text=text, file_path=output_file)
-            duration = time.time() - start_time
-            
-            # Lire avec PowerShell (plus stable)
-            result = subprocess.run(
-                ['powershell', '-Command', f"(New-Object Media.SoundPlayer '{output_file}').PlaySync()"],
-                capture_output=True,
-                text=True,
-                timeout=15  # Timeout étendu à 15 secondes
-            )
-            
-            # Nettoyer
-            try:
-                os.remove(output_file)
-            except:
-                pass
+            # Phrase N+1 synthétisée pendant que la phrase N est jouée ;
+            # échantillons envoyés directement à la carte son (ni fichier temporaire, ni PowerShell)
+            pipeline = PipelineSynthese(lambda sentence: coqui_synthesize(self.coqui_engine, sentence),
+                                        lambda audio: self.audio_output.play(*audio))
+            stats = pipeline.speak(text, self.current_token)
             
-            if result.returncode == 0:
-                print(f"✅ Coqui TTS réussi ({duration:.2f}s)")
-                return True
-            else:
-                print(f"⚠️ Erreur lecture audio: {result.returncode}")
-                return False
+            print(f"✅ Coqui TTS réussi ({stats['phrases']} phrase(s), premier son {stats['premier_son']:.2f}s, total {stats['total']:.2f}s)")
+            return True
+        
+        except OperationAnnulee:
+            print("🔇 Lecture Coqui interrompue")
+            return True  # Pas de bascule vers SAPI
                 
         except Exception as e:
             print(f"⚠️ Erreur Coqui TTS: {e}")
             return False
     
     def speak_sapi(self, text):
-        """Synthèse avec Windows SAPI (voix française optimisée)"""
+        """Synthèse avec Windows SAPI (voix française, processus de synthèse persistant)"""
         try:
-            # Nettoyer le texte pour PowerShell - éliminer tous les caractères problématiques
-            safe_text = text.replace('"', "").replace("'", "").replace('\\', '').replace('`', '')
-            safe_text = safe_text.replace('\n', ' ').replace('\r', ' ')
-            safe_text = safe_text.replace(':', ' ').replace(';', ' ')
-            
-            # Limiter la longueur
-            if len(safe_text) > 400:
-                safe_text = safe_text[:397] + "..."
-            
-            # Commande PowerShell SAPI simplifiée et robuste
-            cmd = f'powershell -Command "Add-Type -AssemblyName System.Speech; $s = New-Object System.Speech.Synthesis.SpeechSynthesizer; $s.SetOutputToDefaultAudioDevice(); $s.Rate = 1; $s.Volume = 100; $s.Speak(\\"{safe_text}\\"); $s.Dispose()"'
+            # Texte complet : le processus persistant le reçoit en base64, sans limite de ligne de commande
+            safe_text = text.replace('\n', ' ').replace('\r', ' ')
             
             start_time = time.time()
-            result = os.system(cmd)
+            if safe_text in FIXED_PHRASES:
+                try:
+                    self.audio_output.play_wav(self.fixed_phrase_audio(safe_text))
+                    print(f"✅ SAPI réussi (cache audio, {time.time() - start_time:.2f}s)")
+                    return True
+                except OperationAnnulee:
+                    raise  # Interrompue pendant le rendu : ne pas la prononcer quand même
+                except Exception as e:
+                    print(f"⚠️ Cache audio indisponible ({e}) - synthèse directe")
+            
+            self.synthese.speak(safe_text, rate=SAPI_RATE)
             duration = time.time() - start_time
             
-            if result == 0:
-                print(f"✅ SAPI réussi ({duration:.2f}s)")
-                return True
-            else:
-                print(f"❌ Erreur SAPI: {result}")
-                return False
-                
+            print(f"✅ SAPI réussi ({duration:.2f}s)")
+            return True
+        
+        except OperationAnnulee:
+            print("🔇 Lecture SAPI interrompue")
+            return True
         except Exception as e:
             print(f"❌ Erreur SAPI: {e}")
             return False
     
+    def fixed_phrase_audio(self, text):
+        """WAV d'une phrase fixe : cache mémoire, puis disque, sinon rendu par le processus de synthèse"""
+        key = audio_key(text, SAPI_VOICE, SAPI_RATE, self.synthese.engine)
+        return self.audio_cache.get_or_render(key, lambda: self.synthese.render(text, rate=SAPI_RATE)[0])
+    
+    def prerender_phrases(self):
+        """Remplit le cache audio des phrases fixes en arrière-plan"""
+        def _prerender():
+            start_time = time.perf_counter()
+            try:
+                for phrase in FIXED_PHRASES:
+                    self.fixed_phrase_audio(phrase)
+                print(f"🔈 {len(FIXED_PHRASES)} phrases fixes prêtes en {time.perf_counter() - start_time:.2f}s")
+            except OperationAnnulee:
+                print("🔇 Pré-rendu des phrases fixes interrompu - rendu à la première lecture")
+            except Exception as e:
+                print(f"⚠️ Pré-rendu des phrases fixes impossible: {e}")
+        
+        threading.Thread(target=_prerender, daemon=True).start()
+    
     # ========================================
     # SYSTÈME DE FONCTIONS D'ACTIONS
     # ========================================
     
-    def categorize_request(self, command):
-        """Catégorise une demande : ACTION ou QUESTION"""
-        command_lower = command.lower()
+    def train_intent_classifier(self):
+        """Entraîne le classifieur d'intentions en arrière-plan (corpus livré + journal des commandes)"""
+        def _train():
+            try:
+                self.intent_classifier = ClassifieurIntentions.from_files()
+            except Exception as e:
+                print(f"⚠️ Classifieur d'intentions indisponible: {e}")
+        
+        threading.Thread(target=_train, daemon=True).start()
+    
+    def build_keyword_automaton(self):
+        """Compile les tables de mots-clés en un seul automate (contrôle puis actions)"""
+        self.keyword_automaton = AutomateMotsCles({**self.control_keywords, **self.action_keywords})
+    
+    def add_keywords(self, intent, keywords, control=False):
+        """Ajoute des mots-clés à une intention et recompile l'automate"""
+        table = self.control_keywords if control else self.action_keywords
+        table.setdefault(intent, []).extend(keywords)
+        self.build_keyword_automaton()
+    
+    def categorize_request(self, command, matched=None):
+        """Catégorise une demande : ACTION ou QUESTION
+        
+        matched : intentions déjà reconnues par l'automate (évite un second parcours)
+        """
+        if matched is None:
+            matched = self.keyword_automaton.match(command)
         
         # Vérifier les mots-clés d'action
-        for category, keywords in self.action_keywords.items():
-            for keyword in keywords:
-                if keyword in command_lower:
-                    return "ACTION", category, command
+        for category in matched:
+            if category in self.action_keywords:
+                return "ACTION", category, command
         
         # Si aucun mot-clé d'action trouvé, c'est une question
         return "QUESTION", None, command
@@ -369,9 +658,9 @@ class AssistantVocal:
         
         elif action_type == "fermer":
             # Chercher quelle application fermer
-            for app_key, app_info in self.applications.items():
-                if app_key in command_lower or app_info["nom"].lower() in command_lower:
-                    return "fermer_application", {"application": app_key}
+            app_key = self.catalog_index.first_contained_in(command_lower)
+            if app_key:
+                return "fermer_application", {"application": app_key}
             
             return "fermer_application", {"application": "inconnue", "command": command}
         
@@ -393,23 +682,75 @@ class AssistantVocal:
         
         return None, None
     
-    def find_application(self, query):
-        """Trouve une application correspondant à la requête avec IA directe intelligente"""
+    def find_application(self, query, allow_ai=True):
+        """Trouve une application : recherche locale d'abord, IA seulement si la confiance est faible
+        
+        allow_ai=False quand la commande a déjà été analysée par l'IA (ai_parse_intent) :
+        seules les recherches locale et sémantique sont faites, sans nouvel appel.
+        """
         query = query.lower().strip()
         
         print(f"🔍 Recherche d'application pour: '{query}'")
         
-        # 🤖 NOUVELLE APPROCHE: Demander directement à l'IA ce que l'utilisateur veut
-        print("🤖 Analyse IA directe de la demande...")
-        ai_result = self.ai_smart_app_search("", query)  # Pas d'extraction, analyse directe
-        if ai_result:
-            return ai_result
+        start_time = time.perf_counter()
+        app_key, app_data, confidence = self.resolve_application_locally(query)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        
+        if app_key and confidence >= self.app_match_threshold:
+            self.app_resolution_stats["locale"] += 1
+            print(f"⚡ Résolution locale en {elapsed_ms:.2f} ms (confiance {confidence:.2f}) - IA évitée "
+                  f"({self.app_resolution_stats['locale']}/{sum(self.app_resolution_stats.values())})")
+            return app_key, app_data
+        
+        # 🧭 Phrase d'intention sans nom d'application : recherche par embeddings
+        semantic_result = self.semantic_app_search(query)
+        if semantic_result:
+            return semantic_result
+        
+        # 🤖 Confiance insuffisante : demander à l'IA ce que l'utilisateur veut
+        if allow_ai:
+            self.app_resolution_stats["ia"] += 1
+            print(f"🤖 Confiance locale insuffisante ({confidence:.2f} < {self.app_match_threshold}) - analyse IA...")
+            ai_result = self.ai_smart_app_search("", query)
+            if ai_result:
+                return ai_result
+        
+        # Rien de plus sûr : garder la meilleure correspondance locale, même faible
+        if app_key:
+            print(f"↩️ Correspondance locale conservée: {app_data['nom']}")
+            return app_key, app_data
         
-        # ======================================================================
-        # FALLBACK: Méthodes classiques seulement si l'IA échoue
-        # ======================================================================
+        return None, None
+    
+    def semantic_app_search(self, query):
+        """Application la plus proche par similarité d'embeddings, si elle est assez sûre"""
+        start_time = time.perf_counter()
+        try:
+            matches = self.semantic_index.search(query, k=3)
+        except Exception as e:
+            print(f"⚠️ Recherche sémantique impossible: {e}")
+            return None
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        
+        if not matches or matches[0][1] < self.semantic_match_threshold:
+            return None
         
-        # Extraire le nom de l'application avec plusieurs patterns (fallback uniquement)
+        app_key, score = matches[0]
+        app_data = self.applications.get(app_key)
+        if not app_data:
+            return None
+        self.app_resolution_stats["semantique"] += 1
+        print(f"🧭 Résolution sémantique en {elapsed_ms:.1f} ms: {app_data['nom']} "
+              f"(similarité {score:.2f}) - IA générative évitée")
+        return app_key, app_data
+    
+    def resolve_application_locally(self, query):
+        """Recherche déterministe (exacte, mappings, fuzzy) sans appel réseau
+        
+        Retourne (app_key, app_data, confiance) avec une confiance entre 0 et 1,
+        ou (None, None, 0.0) si rien ne correspond.
+        """
+        # Extraire le nom de l'application avec plusieurs patterns
         app_name = query
         
         # Pattern 1: "ouvre/lance [l'application] <nom>"
@@ -432,116 +773,48 @@ class AssistantVocal:
                     continue
                 break
         
-        print(f"🎯 Nom d'application extrait (fallback): '{app_name}'")
+        print(f"🎯 Nom d'application extrait: '{app_name}'")
+        
+        index = self.catalog_index
         
         # Recherche 1: Dans les commandes vocales mappées (recherche exacte d'abord)
-        if hasattr(self, 'app_commands_map'):
-            # Recherche exacte
-            if app_name in self.app_commands_map:
-                app_key = self.app_commands_map[app_name]
-                print(f"✅ Trouvé via commande exacte: '{app_name}' → {app_key}")
-                return app_key, self.applications[app_key]
-            
-            # Recherche contient avec critères stricts
-            for command, app_key in self.app_commands_map.items():
-                # Éviter les matches trop courts et mots courants pour réduire faux positifs
-                excluded_words = {'de', 'le', 'la', 'un', 'une', 'me', 'ai', 'et', 'ou', 'du'}
-                if len(app_name) > 4 and app_name.lower() not in excluded_words and (app_name in command or command in app_name):
-                    print(f"✅ Trouvé via commande: '{command}' → {app_key}")
-                    return app_key, self.applications[app_key]
+        app_key = index.exact_command(app_name)
+        if app_key:
+            print(f"✅ Trouvé via commande exacte: '{app_name}' → {app_key}")
+            return app_key, self.applications[app_key], 1.0
+        
+        # Recherche contient avec critères stricts
+        command = index.command_containing(app_name)
+        if command:
+            app_key = self.app_commands_map[command]
+            print(f"✅ Trouvé via commande: '{command}' → {app_key}")
+            return app_key, self.applications[app_key], 0.8
         
         # Recherche 2: Recherche spécifique pour applications populaires
-        specific_mappings = {
-            "netflix": ["netflix", "4df9e0f8.netflix"],
-            "chrome": ["chrome", "google chrome"],
-            "firefox": ["firefox", "mozilla firefox"],
-            "word": ["word", "microsoft word", "winword"],
-            "excel": ["excel", "microsoft excel"],
-            "powerpoint": ["powerpoint", "microsoft powerpoint"],
-            "outlook": ["outlook", "microsoft outlook"],
-            "notepad": ["notepad", "bloc-notes", "bloc notes"],
-            "calculator": ["calc", "calculatrice"],
-            "paint": ["paint", "peinture"],
-            "skype": ["skype"],
-            "discord": ["discord"],
-            "spotify": ["spotify"],
-            "vlc": ["vlc", "vlc media player"],
-            "steam": ["steam"],
-            "adobe": ["adobe"],
-            "photoshop": ["photoshop"]
-        }
-        
-        for app_type, keywords in specific_mappings.items():
-            for keyword in keywords:
-                if keyword in app_name or app_name in keyword:
-                    # Priorité aux correspondances exactes
-                    exact_matches = []
-                    partial_matches = []
-                    
-                    for app_key, app_data in self.applications.items():
-                        app_key_lower = app_key.lower()
-                        app_nom_lower = app_data["nom"].lower()
-                        
-                        # Correspondance exacte prioritaire
-                        if (keyword == app_key_lower or 
-                            keyword in app_key_lower.split() or 
-                            app_type in app_key_lower):
-                            exact_matches.append((app_key, app_data))
-                        # Correspondance partielle
-                        elif keyword in app_key_lower or keyword in app_nom_lower:
-                            partial_matches.append((app_key, app_data))
-                    
-                    # Prioriser les correspondances exactes
-                    best_matches = exact_matches if exact_matches else partial_matches
-                    
-                    if best_matches:
-                        app_key, app_data = best_matches[0]  # Prendre la première
-                        print(f"✅ Trouvé via mapping spécifique: '{keyword}' → {app_key}")
-                        return app_key, app_data
-        
-        # Recherche 3: Dans les noms d'applications (recherche contient)
-        # Recherche 3: Dans les noms d'applications (recherche contient)
-        for app_key, app_data in self.applications.items():
-            nom_lower = app_data["nom"].lower()
-            app_key_lower = app_key.lower()
-            
-            # Recherche bidirectionnelle - mais éviter les correspondances trop courtes
-            if len(app_name) > 3:  # Éviter les matches sur "de", "le", etc.
-                if (app_name in nom_lower or nom_lower in app_name or 
-                    app_name in app_key_lower or app_key_lower in app_name):
-                    print(f"✅ Trouvé via nom: '{app_data['nom']}' (clé: {app_key})")
-                    return app_key, app_data
-        
-        # Recherche 4: Recherche partielle dans les mots du nom (plus stricte)
-        for app_key, app_data in self.applications.items():
-            nom_mots = app_data["nom"].lower().split()
-            for mot in nom_mots:
-                if len(mot) > 3 and len(app_name) > 3:  # Mots plus longs uniquement
-                    if (app_name in mot or mot in app_name) and abs(len(app_name) - len(mot)) <= 3:
-                        print(f"✅ Trouvé via mot: '{mot}' dans '{app_data['nom']}'")
-                        return app_key, app_data
-        
-        # Recherche 5: Recherche fuzzy pour les noms similaires (plus stricte)
-        for app_key, app_data in self.applications.items():
-            nom_clean = ''.join(c for c in app_data["nom"].lower() if c.isalnum())
-            app_name_clean = ''.join(c for c in app_name if c.isalnum())
-            
-            if len(app_name_clean) > 3 and len(nom_clean) > 3:
-                if app_name_clean in nom_clean or nom_clean in app_name_clean:
-                    # Vérifier que c'est une correspondance raisonnable (pas trop de différence de taille)
-                    if abs(len(app_name_clean) - len(nom_clean)) <= max(len(app_name_clean), len(nom_clean)) // 2:
-                        print(f"✅ Trouvé via recherche fuzzy: '{app_data['nom']}'")
-                        return app_key, app_data
-        
-        print(f"❌ Aucune application trouvée pour: '{app_name}'")
-        
-        # 🤖 NOUVELLE FONCTIONNALITÉ IA : Recherche intelligente avec Mistral
-        print("🤖 Activation de la recherche IA intelligente...")
-        ai_result = self.ai_smart_app_search(app_name, query)
-        if ai_result:
-            return ai_result
-        
-        return None, None
+        specific = index.specific_mapping(app_name)
+        if specific:
+            app_key, keyword, exact = specific
+            print(f"✅ Trouvé via mapping spécifique: '{keyword}' → {app_key}")
+            return app_key, self.applications[app_key], 0.9 if exact else 0.7
+        
+        # Recherche 3: Homophones de la reconnaissance vocale ("spotifaille", "discorde")
+        app_key, phonetic = index.phonetic_match(app_name)
+        if app_key:
+            app_data = self.applications[app_key]
+            print(f"✅ Trouvé via phonétique: '{app_name}' [{phonetic}] → {app_data['nom']}")
+            return app_key, app_data, 0.85
+        
+        # Recherche 4: Correspondance approchée (trigrammes), candidats classés par score
+        matches = index.fuzzy_matches(app_name, k=3)
+        if matches:
+            app_key, score = matches[0]
+            app_data = self.applications[app_key]
+            candidates = ", ".join(f"{key} ({value:.2f})" for key, value in matches)
+            print(f"✅ Trouvé via trigrammes: '{app_data['nom']}' - candidats: {candidates}")
+            return app_key, app_data, score
+        
+        print(f"❌ Aucune application trouvée localement pour: '{app_name}'")
+        return None, None, 0.0
     
     def generate_uwp_variants(self, base_id, app_key):
         """Génère des variantes d'ID UWP pour maximiser les chances d'ouverture"""
@@ -587,52 +860,29 @@ class AssistantVocal:
         
         return unique_variants
 
+    def _app_candidates_for_prompt(self, query, k=10):
+        """Liste des applications (une par ligne) injectée dans les prompts IA
+        
+        Seules les k applications les plus proches de la requête selon l'index
+        local sont proposées, complétées par les applications courantes.
+        """
+        selected = [app_key for app_key, _ in self.catalog_index.retrieve(query, k)]
+        for app_key in self.popular_app_keys:
+            if app_key not in selected:
+                selected.append(app_key)
+        
+        return "\n".join(f"- {self.applications[app_key]['nom']} (clé: {app_key})" for app_key in selected)
+    
     def ai_smart_app_search(self, app_name, original_query):
         """Utilise l'IA pour une recherche intelligente directe d'applications"""
         try:
-            # Créer une liste des applications disponibles pour l'IA avec les plus importantes en premier
-            important_apps = []
-            other_apps = []
-            
-            for app_key, app_data in self.applications.items():
-                app_line = f"- {app_data['nom']} (clé: {app_key})"
-                
-                # Prioriser les applications importantes
-                if any(keyword in app_key.lower() for keyword in ['netflix', 'chrome', 'firefox', 'edge', 'vlc', 'spotify', 'word', 'excel']):
-                    important_apps.append(app_line)
-                else:
-                    other_apps.append(app_line)
-            
-            # Limiter la liste pour éviter une requête trop longue
-            selected_apps = important_apps[:20] + other_apps[:40]
-            apps_list = "\n".join(selected_apps)
+            apps_list = self._app_candidates_for_prompt(original_query)
             
             # 🤖 REQUÊTE IA AMÉLIORÉE avec exemples concrets
-            ai_prompt = f"""
-ANALYSE DIRECTE DE LA DEMANDE UTILISATEUR:
-
-PHRASE COMPLÈTE: "{original_query}"
-
-APPLICATIONS DISPONIBLES:
-{apps_list}
-
-INSTRUCTIONS PRÉCISES:
-1. Analyse la phrase complète de l'utilisateur
-2. Identifie EXACTEMENT quelle application il veut ouvrir
-3. EXEMPLES CONCRETS:
-   - "je veux que tu ouvres Netflix" → cherche "netflix" dans la liste → réponse: "4df9e0f8.netflix"
-   - "lance le navigateur" → cherche "chrome" ou "firefox" ou "edge" → réponse: "google chrome" ou "firefox"
-   - "je veux regarder un film" → cherche "netflix" ou "vlc" → réponse: "4df9e0f8.netflix" ou "vlc media player"
-   - "ouvre Word" → cherche "word" → réponse: "microsoft word"
-
-4. Réponds UNIQUEMENT avec la clé exacte de l'application (ce qui est entre parenthèses)
-5. Si aucune correspondance évidente, réponds "AUCUNE"
-6. Ne te laisse pas tromper par des mots parasites
-
-RÉPONSE (clé exacte uniquement):"""
+            ai_prompt = APP_SEARCH_PROMPT.format(original_query=original_query, apps_list=apps_list)
             
             print("🤖 Consultation IA directe...")
-            ai_response = self.query_mistral(ai_prompt)
+            ai_response = self.query_mistral(ai_prompt, cache_type="recherche_app")
             
             if ai_response and ai_response.strip().lower() != "aucune":
                 # Nettoyer la réponse IA
@@ -656,6 +906,13 @@ RÉPONSE (clé exacte uniquement):"""
             print(f"❌ Erreur recherche IA: {e}")
             return None
     
+    def suggest_alternatives(self, failed_app_name, k=3):
+        """Applications proches selon l'index local, sans appel IA"""
+        names = [self.applications[app_key]["nom"] for app_key, _ in self.catalog_index.retrieve(failed_app_name, k)]
+        if not names:
+            return "Dites 'liste les applications' pour connaître celles que je peux ouvrir."
+        return f"Voici quelques alternatives : {', '.join(names)}."
+    
     def ai_suggest_alternatives(self, failed_app_name):
         """L'IA suggère des applications alternatives"""
         try:
@@ -677,7 +934,7 @@ Réponds de manière concise et naturelle en français.
 Format: "Voici quelques alternatives : [app1], [app2], [app3]"
 """
             
-            response = self.query_mistral(ai_prompt)
+            response = self.query_mistral(ai_prompt, cache_type="suggestions")
             return response if response else "Je n'ai pas pu trouver d'alternatives appropriées."
             
         except Exception as e:
@@ -695,38 +952,93 @@ Explique ce que l'utilisateur peut faire ou comment reformuler sa demande.
 Sois concis (max 2 phrases).
 """
             
-            response = self.query_mistral(ai_prompt)
+            response = self.query_mistral(ai_prompt, cache_type="aide")
             return response if response else "Je peux vous aider avec l'ouverture d'applications, des recherches web, ou répondre à vos questions."
             
         except Exception as e:
             print(f"❌ Erreur aide IA: {e}")
             return "Aide non disponible pour le moment."
     
-    def ai_analyze_command(self, command):
-        """L'IA analyse une commande ambiguë pour mieux la catégoriser"""
+    def ai_parse_intent(self, command):
+        """Analyse complète d'une commande en un seul appel IA (sortie JSON structurée)
+        
+        Retourne un dict {intention, application, recherche, confiance} où
+        application est une clé de self.applications, le nom donné par l'IA
+        quand il ne correspond à aucune clé (find_application le résoudra),
+        ou None.
+        """
         try:
+            apps_list = self._app_candidates_for_prompt(command)
             ai_prompt = f"""
 Analyse cette commande utilisateur: "{command}"
 
-CATÉGORIES POSSIBLES:
-- ACTION_OUVRIR: ouvrir/lancer une application
-- ACTION_FERMER: fermer une application
-- ACTION_LISTER: lister les applications
-- ACTION_RECHERCHER: recherche web
-- QUESTION: question générale
+INTENTIONS POSSIBLES:
+- ouvrir_application: ouvrir/lancer une application
+- fermer_application: fermer une application
+- lister_applications: lister les applications
+- rechercher_web: recherche web
+- question: question générale
 
-Réponds UNIQUEMENT avec une des catégories ci-dessus.
-Si c'est ambigü, choisis la catégorie la plus probable.
+APPLICATIONS DISPONIBLES:
+{apps_list}
 
-RÉPONSE:"""
+Réponds en JSON:
+- intention: une des intentions ci-dessus
+- application: la clé exacte (entre parenthèses) de l'application concernée, ou null
+- recherche: le texte à rechercher sur le web, ou null
+- confiance: ta confiance entre 0 et 1
+"""
+            
+            response = self.query_mistral(ai_prompt, cache_type="analyse", response_format=INTENT_SCHEMA)
+            intent = json.loads(response) if response else {}
             
-            response = self.query_mistral(ai_prompt)
-            return response.strip() if response else "QUESTION"
+            intention = intent.get("intention")
+            if intention not in INTENT_SCHEMA["properties"]["intention"]["enum"]:
+                intention = "question"
+            
+            app_key = intent.get("application")
+            if isinstance(app_key, str) and app_key.strip():
+                app_key = app_key.strip().lower()
+                if app_key not in self.applications:
+                    # Nom affiché ("Google Chrome") au lieu de la clé : résolution locale, sinon nom brut
+                    resolved, _, confidence = self.resolve_application_locally(app_key)
+                    if resolved and confidence >= self.app_match_threshold:
+                        app_key = resolved
+            else:
+                app_key = None
+            
+            try:
+                confidence = min(max(float(intent.get("confiance", 0)), 0.0), 1.0)
+            except (TypeError, ValueError):
+                confidence = 0.0
+            
+            return {
+                "intention": intention,
+                "application": app_key,
+                "recherche": intent.get("recherche") or None,
+                "confiance": confidence
+            }
             
         except Exception as e:
-            print(f"❌ Erreur analyse IA: {e}")
-            return "QUESTION"
-
+            print(f"❌ Erreur analyse d'intention IA: {e}")
+            return None
+    
+    def intent_to_action(self, intent, command):
+        """Convertit une intention structurée en (fonction d'action, paramètres)"""
+        intention = intent["intention"]
+        
+        if intention in ("ouvrir_application", "fermer_application"):
+            # analyse_ia : la commande a déjà coûté son appel IA, la résolution reste locale
+            return intention, {"application": intent["application"] or "inconnue", "command": command, "analyse_ia": True}
+        
+        if intention == "lister_applications":
+            return intention, {}
+        
+        if intention == "rechercher_web":
+            return intention, {"query": intent["recherche"] or "inconnue", "command": command}
+        
+        return None, None
+    
     def action_ouvrir_application(self, params):
         """Ouvre une application avec gestion spéciale pour les apps UWP"""
         app_name = params.get("application", "inconnue")
@@ -734,16 +1046,16 @@ RÉPONSE:"""
         if app_name == "inconnue":
             return False, "Je n'ai pas compris quelle application vous voulez ouvrir. Essayez : 'Ouvre Chrome' ou 'Lance le bloc-notes'"
         
-        # Utiliser la nouvelle fonction de recherche améliorée
-        app_key, app_data = self.find_application(app_name)
+        # Clé déjà résolue (analyse d'intention ou recherche précédente) : pas de nouvelle recherche
+        if app_name in self.applications:
+            app_key, app_data = app_name, self.applications[app_name]
+        else:
+            # Utiliser la nouvelle fonction de recherche améliorée (sans IA si l'intention vient déjà d'elle)
+            app_key, app_data = self.find_application(app_name, allow_ai=not params.get("analyse_ia"))
         
         if not app_key or not app_data:
-            # 🤖 AMÉLIORATION IA : Suggestions intelligentes d'alternatives
-            print("🤖 Génération de suggestions IA...")
-            ai_suggestions = self.ai_suggest_alternatives(app_name)
-            
-            # Retourner le message avec suggestions IA
-            return False, f"L'application '{app_name}' n'a pas été trouvée. {ai_suggestions}"
+            # Suggestions tirées de l'index local : pas d'appel IA supplémentaire
+            return False, f"L'application '{app_name}' n'a pas été trouvée. {self.suggest_alternatives(app_name)}"
         
         try:
             print(f"🚀 Tentative d'ouverture de {app_data['nom']}...")
@@ -852,7 +1164,11 @@ RÉPONSE:"""
             return False, "Je n'ai pas compris quelle application vous voulez fermer."
         
         if app_name not in self.applications:
-            return False, f"L'application '{app_name}' n'est pas dans ma liste d'applications connues."
+            # Nom donné par l'IA plutôt qu'une clé : seule une correspondance sûre est fermée
+            app_key, _, confidence = self.resolve_application_locally(app_name.lower())
+            if not app_key or confidence < self.app_match_threshold:
+                return False, f"L'application '{app_name}' n'est pas dans ma liste d'applications connues."
+            app_name = app_key
         
         app_info = self.applications[app_name]
         
@@ -902,71 +1218,155 @@ RÉPONSE:"""
             print("🔧 Calibration du microphone pour le bruit ambiant...")
             self.recognizer.adjust_for_ambient_noise(source, duration=2)
             print(f"✅ Seuil d'énergie ajusté à: {self.recognizer.energy_threshold}")
+            sample_rate = source.SAMPLE_RATE
+        
+        # Détection locale si des modèles du mot ont été enregistrés, sinon Google sur chaque morceau
+        detector = DetecteurMotReveil.from_directory(sample_rate=sample_rate)
+        if detector:
+            print(f"✅ Mot de réveil détecté localement ({len(detector.templates)} modèles, seuil {detector.threshold:.2f})")
+        else:
+            print("💡 Enregistrez le mot de réveil (python mot_reveil.py enregistrer) pour le détecter sans réseau")
         
         while self.active:
             try:
-                with self.microphone as source:
-                    # Écoute passive pour le mot de réveil avec timeout plus court
-                    audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=4)
-                
-                try:
+                self.wait_speech()
+                if detector:
+                    heard = self.wait_for_wake_word_locally(detector)
+                else:
+                    # Écoute passive pour le mot de réveil avec timeout plus court (le micro reste ouvert)
+                    audio = self.recognizer.listen(self.microphone, timeout=1, phrase_time_limit=4)
+                    if not self.contains_speech(audio):
+                        continue
                     text = self.recognizer.recognize_google(audio, language='fr-FR').lower()
                     print(f"🎤 Détecté: {text}")
-                    
-                    if 'assistant' in text:
-                        self.speak("Présent ! Je vous écoute.")
-                        # Entrer en mode conversation continue
-                        self.conversation_mode()
+                    heard = 'assistant' in text
                 
-                except sr.UnknownValueError:
-                    pass  # Rien compris, continuer l'écoute
+                if heard:
+                    # Le modèle se recharge pendant que l'utilisateur formule sa commande
+                    self.warm_up_model("mot de réveil")
+                    if not self.listen_follow_up():
+                        self.speak("Présent ! Je vous écoute.")
+                    # Entrer en mode conversation continue
+                    self.conversation_mode()
                 
-            except sr.WaitTimeoutError:
-                pass  # Timeout normal, continuer
+            except (sr.WaitTimeoutError, sr.UnknownValueError):
+                pass  # Timeout normal ou rien compris, continuer
             except Exception as e:
                 print(f"❌ Erreur d'écoute: {e}")
                 time.sleep(1)
     
+    def contains_speech(self, audio):
+        """Filtre de détection de voix avant toute reconnaissance (bruit de ventilateur, claquements...)"""
+        if self.vad.is_speech(audio.frame_data, audio.sample_rate, audio.sample_width):
+            return True
+        print("🔇 Bruit sans parole ignoré - reconnaissance évitée")
+        return False
+    
+    def listen_follow_up(self):
+        """Commande dite d'une traite après le mot de réveil : elle est déjà dans le tampon du micro
+        
+        True si une phrase a commencé dans les WAKE_FOLLOW_UP_SECONDS ; elle
+        est gardée dans pending_audio pour conversation_mode.
+        """
+        try:
+            self.pending_audio, self.pending_transcript = self.listen_utterance(
+                self.microphone, timeout=WAKE_FOLLOW_UP_SECONDS, phrase_time_limit=30)
+        except sr.WaitTimeoutError:
+            return False
+        return True
+    
+    def listen_utterance(self, source, timeout, phrase_time_limit):
+        """Enregistre une phrase avec fin adaptative au lieu des 1.5 s fixes de pause_threshold
+        
+        Retourne (audio, transcription anticipée ou None) ; la transcription est
+        déjà faite quand la phrase s'est terminée sur une commande complète.
+        """
+        rate, width = source.SAMPLE_RATE, source.SAMPLE_WIDTH
+        endpoint = DetecteurFinDePhrase(
+            rate, width,
+            transcribe=lambda pcm: self.recognizer.recognize_google(sr.AudioData(pcm, rate, width), language='fr-FR'),
+            is_complete=self.is_complete_command,
+            max_seconds=phrase_time_limit,
+            history=source.history(NOISE_HISTORY_SECONDS),
+        )
+        deadline = time.time() + timeout
+        while not endpoint.feed(source.stream.read(source.CHUNK)):
+            if not endpoint.started and time.time() > deadline:
+                raise sr.WaitTimeoutError("Aucune parole avant le délai")
+        pcm, transcript = endpoint.result()
+        print(f"⏱️ Fin de phrase ({endpoint.reason}) après {endpoint.silence_seconds * 1000:.0f} ms de silence")
+        return sr.AudioData(pcm, rate, width), transcript
+    
+    def is_complete_command(self, text):
+        """True si la transcription partielle est déjà une commande exécutable telle quelle"""
+        text = text.lower()
+        if any(word in text for word in CONVERSATION_END_WORDS):
+            return True
+        matched = self.keyword_automaton.match(text)
+        if any(intent in COMPLETE_CONTROL_INTENTS for intent in matched):
+            return True
+        if "ouvrir" in matched:
+            app_key, _, confidence = self.resolve_application_locally(text)
+            return bool(app_key) and confidence >= self.app_match_threshold
+        if "fermer" in matched:
+            return self.catalog_index.first_contained_in(text) is not None
+        return False
+    
+    def wait_for_wake_word_locally(self, detector):
+        """Lit le tampon du micro trame par trame jusqu'à ce que le détecteur local entende le mot de réveil"""
+        source = self.microphone
+        while self.active:
+            if detector.feed(source.stream.read(source.CHUNK)):
+                print(f"🎤 Mot de réveil détecté localement (score {detector.last_score:.2f}, {detector.last_check_ms:.1f} ms)")
+                return True
+        return False
+    
     def conversation_mode(self):
         """Mode conversation continue après le mot de réveil"""
         print("💬 Mode conversation activé - Parlez naturellement ou dites 'fini' pour arrêter")
-        print("⏱️  Configuration: Pause de 1.5s avant traitement, pas de limite de temps")
+        print("⏱️  Configuration: fin de phrase adaptative (commande courte ~0.5s, question longue jusqu'à 1.2s de pause)")
         
         while self.active:
             try:
-                with self.microphone as source:
+                if self.pending_audio is not None:
+                    # Phrase déjà enregistrée (interruption de la réponse précédente ou commande enchaînée)
+                    audio, self.pending_audio = self.pending_audio, None
+                    transcript, self.pending_transcript = self.pending_transcript, None
+                else:
+                    self.wait_speech()  # Ne pas s'écouter soi-même
                     print("🎤 Parlez maintenant... (Prenez votre temps, je vous laisse finir)")
-                    # Paramètres optimisés pour laisser le temps de parler
-                    audio = self.recognizer.listen(
-                        source, 
-                        timeout=15,  # Timeout plus long pour commencer à parler
-                        phrase_time_limit=30  # Limite de 30 secondes pour une phrase complète
-                    )
+                    # 15 s pour commencer à parler, 30 s maximum pour une phrase complète
+                    audio, transcript = self.listen_utterance(self.microphone, timeout=15, phrase_time_limit=30)
+                
+                if not self.contains_speech(audio):
+                    continue
                 
                 try:
                     print("🔄 Traitement de votre parole... (cela peut prendre quelques secondes)")
-                    command = self.recognizer.recognize_google(audio, language='fr-FR')
+                    command = transcript or self.recognizer.recognize_google(audio, language='fr-FR')
                     print(f"🎤 Commande reçue: {command}")
                     
                     # Vérifier les commandes de sortie de conversation
                     command_lower = command.lower()
-                    if any(word in command_lower for word in ['fini', 'terminé', 'stop conversation', 'pause']):
+                    if any(word in command_lower for word in CONVERSATION_END_WORDS):
                         self.speak("Conversation terminée. Redites 'Assistant' pour me réveiller.")
                         print("👂 Retour au mode d'écoute du mot de réveil...")
                         break
                     
                     # FEEDBACK : Confirmer qu'on a compris et qu'on commence
-                    self.speak(f"Compris ! Je traite votre demande : {command}")
+                    self.speak(f"Compris ! Je traite votre demande : {command}", wait=False)
                     
-                    # Traiter la commande
-                    self.process_command(command)
+                    # Traiter la commande (interruptible à la voix)
+                    interrupted = self.process_with_barge_in(command)
                     
                     # Si l'assistant doit s'arrêter complètement, sortir
                     if not self.active:
                         break
+                    if interrupted:
+                        continue  # La nouvelle phrase est dans pending_audio
                     
                     # Confirmer que la tâche est terminée
-                    self.speak("Tâche terminée ! Que puis-je faire d'autre pour vous ?")
+                    self.speak("Tâche terminée ! Que puis-je faire d'autre pour vous ?", wait=False)
                     print("💬 Continuez la conversation ou dites 'fini'...")
                     
                 except sr.UnknownValueError:
@@ -986,25 +1386,24 @@ RÉPONSE:"""
         print("👂 En attente de votre commande...")
         
         try:
-            with self.microphone as source:
-                # Écoute active pour la commande avec plus de patience
-                print("🎤 Parlez maintenant... (Prenez votre temps)")
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=12,  # Plus de temps pour commencer
-                    phrase_time_limit=25  # Plus de temps pour finir
-                )
+            self.wait_speech()
+            # Écoute active pour la commande : 12 s pour commencer, 25 s pour finir
+            print("🎤 Parlez maintenant... (Prenez votre temps)")
+            audio, transcript = self.listen_utterance(self.microphone, timeout=12, phrase_time_limit=25)
+            
+            if not self.contains_speech(audio):
+                return
             
             try:
                 print("🔄 Traitement de votre parole...")
-                command = self.recognizer.recognize_google(audio, language='fr-FR')
+                command = transcript or self.recognizer.recognize_google(audio, language='fr-FR')
                 print(f"🎤 Commande reçue: {command}")
                 
                 # FEEDBACK IMPORTANT : Confirmer qu'on a compris
-                self.speak(f"J'ai compris: {command}. Je traite votre demande.")
+                self.speak(f"J'ai compris: {command}. Je traite votre demande.", wait=False)
                 
-                # Traiter la commande
-                self.process_command(command)
+                # Traiter la commande (interruptible à la voix)
+                self.process_with_barge_in(command)
                 
             except sr.UnknownValueError:
                 print("❌ Parole non comprise")
@@ -1019,20 +1418,23 @@ RÉPONSE:"""
     
     def process_command(self, command):
         """Traite une commande vocale avec système de catégorisation intelligent"""
-        command_lower = command.lower()
+        # Un seul parcours de la commande pour toutes les tables de mots-clés
+        matched = self.keyword_automaton.match(command)
+        control = matched[0] if matched and matched[0] in self.control_keywords else None
         
         # Commandes spéciales de contrôle de l'assistant (priorité absolue)
-        if any(word in command_lower for word in ['arrêt', 'stop', 'au revoir', 'fermer assistant', 'arrête toi']):
+        if control == "arret":
             self.speak("Commande d'arrêt reçue. Au revoir ! À bientôt.")
             self.active = False
             return
         
-        if any(word in command_lower for word in ['silence', 'tais-toi', 'chut']):
+        if control == "silence":
+            self.flush_speech()
             self.speak("Commande de silence reçue. D'accord, je me tais.")
             return
         
         # Commandes de test et configuration voix
-        if any(word in command_lower for word in ['test voix', 'test audio']):
+        if control == "test_voix":
             self.speak("Test de la synthèse vocale en cours.")
             time.sleep(0.5)
             if self.current_tts_method == "coqui":
@@ -1041,7 +1443,7 @@ RÉPONSE:"""
                 self.speak("Vous entendez actuellement la voix française Hortense Windows. Dites 'voix naturelle' pour essayer Coqui TTS si disponible.")
             return
         
-        if any(word in command_lower for word in ['voix naturelle', 'coqui', 'meilleure voix']):
+        if control == "voix_naturelle":
             if COQUI_AVAILABLE and self.coqui_engine:
                 self.current_tts_method = "coqui"
                 self.speak("Basculement vers la voix Coqui TTS. Attention, cette voix peut avoir un léger accent anglais.")
@@ -1049,18 +1451,35 @@ RÉPONSE:"""
                 self.speak("La voix Coqui TTS n'est pas disponible. Utilisation de la voix française Windows.")
             return
         
-        if any(word in command_lower for word in ['voix française', 'voix windows', 'voix classique', 'sapi', 'hortense']):
+        if control == "voix_classique":
             self.current_tts_method = "sapi"
             self.speak("Basculement vers la voix française Windows Hortense.")
             return
         
+        # Nouveau scan du catalogue (scanner_applications.py) : index mis à jour sans redémarrer
+        if control == "actualiser":
+            if self.load_scanned_applications():
+                self.speak(f"Liste des applications actualisée : {len(self.applications)} applications.")
+            else:
+                self.speak("Je n'ai pas pu recharger la liste des applications.")
+            return
+        
         # 🤖 NOUVELLE COMMANDE IA : Aide contextuelle
-        if any(word in command_lower for word in ['aide', 'help', 'comment', 'que puis-je', 'guide']):
+        if control == "aide":
             print("🤖 Génération d'aide contextuelle par l'IA...")
             ai_help = self.ai_help_context(command)
             self.speak(ai_help)
             return
         
+        # ⚡ Compétences locales : réponse immédiate sans appel au LLM
+        start_time = time.perf_counter()
+        skill_answer = self.skills.repondre(command)
+        if skill_answer:
+            skill_name, answer = skill_answer
+            print(f"⚡ Compétence locale '{skill_name}' en {(time.perf_counter() - start_time) * 1000:.2f} ms - LLM évité")
+            self.speak(answer)
+            return
+        
         # ========================================
         # NOUVEAU SYSTÈME DE CATÉGORISATION + IA
         # ========================================
@@ -1068,27 +1487,46 @@ RÉPONSE:"""
         print(f"🔍 Analyse de la demande : {command}")
         
         # Étape 1: Catégoriser la demande
-        request_type, action_type, original_command = self.categorize_request(command)
+        request_type, action_type, original_command = self.categorize_request(command, matched)
         
         print(f"📊 Type de demande : {request_type}")
         if action_type:
             print(f"🎯 Type d'action : {action_type}")
         
-        # 🤖 AMÉLIORATION IA : Si la catégorisation échoue, demander à l'IA
+        function_name, params = None, None
+        
+        # Si la catégorisation échoue : classifieur local d'abord, puis un seul
+        # appel IA (intention ET paramètres) quand le classifieur hésite
         if request_type == "QUESTION" and not action_type:
-            ai_analysis = self.ai_analyze_command(command)
-            if ai_analysis and ai_analysis != "QUESTION":
-                print(f"🤖 L'IA a recatégorisé en: {ai_analysis}")
-                if ai_analysis in ["ACTION_OUVRIR", "ACTION_FERMER", "ACTION_LISTER"]:
+            prediction = self.intent_classifier.predict(command) if self.intent_classifier else None
+            
+            if prediction and prediction[1] >= INTENT_CLASSIFIER_MIN_PROBABILITY:
+                intention, probability = prediction
+                print(f"🧠 Intention locale: {intention} (probabilité {probability:.2f}) - IA évitée")
+                if intention != "question":
+                    request_type = "ACTION"
+                    action_type = intention.split("_")[0]  # analyze_action_request extrait le sujet de la recherche
+            else:
+                if prediction:
+                    print(f"🧠 Classifieur incertain ({prediction[0]}, probabilité {prediction[1]:.2f}) - analyse IA...")
+                intent = self.ai_parse_intent(command)
+                if intent and intent["confiance"] >= INTENT_MIN_CONFIDENCE:
+                    log_command(command, intent["intention"], "ia")  # Exemple d'entraînement pour le classifieur
+                if intent and intent["intention"] != "question" and intent["confiance"] >= INTENT_MIN_CONFIDENCE:
+                    print(f"🤖 L'IA a recatégorisé en: {intent['intention']} (confiance {intent['confiance']:.2f})")
                     request_type = "ACTION"
-                    action_type = ai_analysis.replace("ACTION_", "").lower()
+                    action_type = intent["intention"].split("_")[0]
+                    function_name, params = self.intent_to_action(intent, command)
+        
+        self._check_cancelled()  # L'utilisateur a pu parler pendant l'analyse
         
         if request_type == "ACTION":
             # C'est une action à exécuter
-            self.speak(f"Action détectée : {action_type}. Je traite votre demande.")
+            self.speak(f"Action détectée : {action_type}. Je traite votre demande.", wait=False)
             
-            # Analyser les détails de l'action
-            function_name, params = self.analyze_action_request(command, action_type)
+            # Analyser les détails de l'action (déjà fait si l'IA a fourni les paramètres)
+            if function_name is None:
+                function_name, params = self.analyze_action_request(command, action_type)
             
             if function_name and function_name in self.action_functions:
                 print(f"🔧 Exécution de la fonction : {function_name}")
@@ -1100,39 +1538,40 @@ RÉPONSE:"""
                     
                     if success:
                         print(f"✅ Action réussie : {message}")
-                        self.speak(message)
+                        self.speak(message, wait=False)
                     else:
                         print(f"❌ Action échouée : {message}")
-                        self.speak(message)
+                        self.speak(message, wait=False)
                         
                 except Exception as e:
                     error_msg = f"Erreur lors de l'exécution de l'action : {str(e)}"
                     print(f"❌ {error_msg}")
-                    self.speak(error_msg)
+                    self.speak(error_msg, wait=False)
             else:
                 # Action non supportée
                 unsupported_msg = f"Je ne peux pas effectuer cette action pour le moment. Action demandée : {action_type}"
                 print(f"⚠️ {unsupported_msg}")
-                self.speak(unsupported_msg)
+                self.speak(unsupported_msg, wait=False)
                 
         elif request_type == "QUESTION":
             # C'est une question - envoyer à Mistral
             print("❓ Question détectée - Envoi à Mistral")
-            self.speak("Question détectée. Je consulte Mistral pour vous répondre.")
+            self.speak("Question détectée. Je consulte Mistral pour vous répondre.", wait=False)
             
             try:
-                response = self.query_mistral(command)
+                # Streaming : chaque phrase est mise en file dès qu'elle est générée
+                response = self.query_mistral(command, stream=True,
+                                              on_sentence=lambda sentence: self.speak(sentence, wait=False))
                 
                 if response and response.strip():
                     print(f"📝 Réponse Mistral: {response}")
-                    self.speak("Réponse reçue de Mistral avec succès.")
-                    time.sleep(0.3)
-                    self.speak(response)
                 else:
                     error_msg = "Mistral n'a pas pu générer de réponse."
                     print(f"❌ {error_msg}")
                     self.speak(error_msg)
                     
+            except OperationAnnulee:
+                raise
             except Exception as e:
                 error_details = str(e)
                 error_msg = f"Erreur lors de la consultation de Mistral : {error_details}"
@@ -1140,23 +1579,47 @@ RÉPONSE:"""
                 self.speak("Une erreur s'est produite lors de la consultation de Mistral.")
         
         # Confirmation de fin de traitement
-        self.speak("Traitement terminé avec succès !")
+        self.speak("Traitement terminé avec succès !", wait=False)
     
-    def query_mistral(self, prompt):
-        """Envoie une requête à l'API Ollama Mistral avec feedback détaillé"""
-        url = f"{self.ollama_url}/api/generate"
+    def query_mistral(self, prompt, stream=False, on_sentence=None, cache_type=None, response_format=None):
+        """Envoie une requête à l'API Ollama Mistral avec feedback détaillé
+        
+        En mode stream, les fragments NDJSON sont découpés en phrases au fil
+        de l'eau et chaque phrase complète est transmise à on_sentence
+        (par défaut self.speak) pendant que la génération continue.
         
+        Si cache_type est fourni (prompts d'aide déterministes), la réponse
+        est mise en cache avec le TTL de ce type d'appel.
+        
+        response_format ("json" ou un schéma JSON) contraint la sortie du modèle.
+        """
         payload = {
             "model": self.model_name,
             "prompt": f"Réponds en français de manière concise et naturelle à cette question ou demande : {prompt}",
-            "stream": False
+            "stream": stream
         }
+        if response_format:
+            payload["format"] = response_format
+            payload["options"] = {"temperature": 0}
+        
+        cache_key = None
+        if cache_type and not stream:
+            cache_key = make_key(payload["model"], payload["prompt"],
+                                 {"options": payload.get("options"), "format": payload.get("format")})
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                print(f"💾 Réponse en cache ({cache_type}) - appel Mistral évité")
+                return cached
         
         try:
             print(f"🤖 Envoi à Mistral: {prompt}")
+            
+            if stream:
+                return self._query_mistral_stream(payload, on_sentence or self.speak)
+            
             start_time = time.time()
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.client.post("/api/generate", payload)
             response.raise_for_status()
             
             end_time = time.time()
@@ -1169,6 +1632,10 @@ RÉPONSE:"""
             print(f"✅ Réponse reçue en {duration:.2f}s")
             if result.get('eval_count'):
                 print(f"📊 {result.get('eval_count')} tokens générés")
+            self._log_model_timing(result)
+            
+            if cache_key and response_text:
+                self.response_cache.set(cache_key, response_text, cache_type)
             
             return response_text
             
@@ -1185,6 +1652,66 @@ RÉPONSE:"""
             print(f"❌ {error_msg}")
             raise Exception(error_msg)
     
+    def _query_mistral_stream(self, payload, on_sentence):
+        """Lit la réponse NDJSON d'Ollama et prononce chaque phrase dès qu'elle est complète"""
+        start_time = time.time()
+        first_sentence_time = None
+        buffer = ""
+        full_text = []
+        result = {}
+        token = self.current_token
+        
+        with self.client.post("/api/generate", payload, stream=True) as response:
+            response.raise_for_status()
+            if token:
+                # Fermer la connexion fait aussi arrêter la génération côté Ollama
+                token.on_cancel(response.close)
+            
+            try:
+                for line in response.iter_lines():
+                    if token:
+                        token.check()
+                    if not line:
+                        continue
+                    
+                    result = json.loads(line)
+                    fragment = result.get('response', '')
+                    buffer += fragment
+                    full_text.append(fragment)
+                    
+                    sentences, buffer = split_sentences(buffer)
+                    for sentence in sentences:
+                        if first_sentence_time is None:
+                            first_sentence_time = time.time() - start_time
+                            print(f"⚡ Première phrase prête en {first_sentence_time:.2f}s")
+                        on_sentence(sentence)
+                    
+                    if result.get('done'):
+                        break
+            except OperationAnnulee:
+                raise
+            except Exception:
+                if token and token.cancelled:  # Lecture coupée par response.close()
+                    raise OperationAnnulee("Génération interrompue par l'utilisateur")
+                raise
+        
+        if token:
+            token.check()
+        
+        # Dernier morceau sans ponctuation finale
+        if buffer.strip():
+            if first_sentence_time is None:
+                first_sentence_time = time.time() - start_time
+            on_sentence(buffer.strip())
+        
+        duration = time.time() - start_time
+        print(f"✅ Réponse reçue en {duration:.2f}s (streaming)")
+        if result.get('eval_count'):
+            print(f"📊 {result.get('eval_count')} tokens générés")
+        self._log_model_timing(result)
+        
+        return "".join(full_text).strip()
+    
     def test_components(self):
         """Teste les composants de l'assistant"""
         print("🧪 Test des composants...")
@@ -1246,7 +1773,12 @@ RÉPONSE:"""
         except KeyboardInterrupt:
             print("\n👋 Arrêt de l'assistant...")
             self.active = False
+            self.response_cache.print_stats()
+            self.audio_cache.print_stats()
+            self.vad.print_stats()
+            self.flush_speech()
             self.speak("Au revoir !")
+            self.capture.stop()
 
 def main():
     print("🤖 Assistant Vocal PC avec Ollama Mistral")
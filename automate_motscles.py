@@ -0,0 +1,92 @@
+"""
+Automate de mots-clés (Aho-Corasick)
+====================================
+
+process_command testait ses tables de mots-clés les unes après les autres
+(arrêt, silence, test voix, aide, puis chaque catégorie d'action) avec des
+chaînes de `mot in commande`. Toutes ces tables sont compilées ici en un seul
+automate : un parcours de la commande, caractère par caractère, donne toutes
+les intentions reconnues, quel que soit le nombre de mots-clés.
+
+Les intentions sont classées par priorité (ordre de la table) :
+
+    automate = AutomateMotsCles({"arret": ["stop", "au revoir"], "ouvrir": ["ouvre", "lance"]})
+    automate.match("stop, ne lance rien")   # → ["arret", "ouvrir"]
+    automate.first("lance netflix")         # → "ouvrir"
+"""
+
+from collections import deque
+
+
+class AutomateMotsCles:
+    """Automate Aho-Corasick {intention: [mots-clés]} avec priorités"""
+
+    def __init__(self, table=None):
+        self.intents = []
+        self._delta = [{}]  # état -> {caractère: état suivant} (transitions complètes)
+        self._output = [0]  # état -> masque des intentions reconnues
+        if table:
+            self.build(table)
+
+    def build(self, table):
+        """(Re)compile la table ; l'ordre des intentions donne leur priorité"""
+        self.intents = list(table)
+        goto = [{}]
+        output = [0]
+        for bit, intent in enumerate(self.intents):
+            for keyword in table[intent]:
+                state = 0
+                for char in keyword.lower():
+                    next_state = goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(goto)
+                        goto[state][char] = next_state
+                        goto.append({})
+                        output.append(0)
+                    state = next_state
+                if state:
+                    output[state] |= 1 << bit
+
+        # Liens d'échec en largeur, puis transitions complètes (automate déterministe)
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            output[state] |= output[fail[state]]
+            delta[state] = dict(delta[fail[state]])
+            delta[state].update(goto[state])
+            for char, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(char, 0)
+                queue.append(next_state)
+
+        self._delta = delta
+        self._output = output
+
+    def _mask(self, text):
+        delta = self._delta
+        output = self._output
+        state = 0
+        mask = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            mask |= output[state]
+        return mask
+
+    def match(self, text):
+        """Toutes les intentions dont un mot-clé apparaît dans text, par priorité"""
+        mask = self._mask(text.lower())
+        intents = []
+        while mask:
+            lowest = mask & -mask
+            intents.append(self.intents[lowest.bit_length() - 1])
+            mask ^= lowest
+        return intents
+
+    def first(self, text):
+        """Intention la plus prioritaire reconnue dans text, ou None"""
+        mask = self._mask(text.lower())
+        if not mask:
+            return None
+        return self.intents[(mask & -mask).bit_length() - 1]
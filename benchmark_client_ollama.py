@@ -0,0 +1,104 @@
+"""
+Benchmark du client HTTP Ollama
+===============================
+
+Mesure le surcoût réseau par appel :
+- AVANT : requests.get/post direct (nouvelle connexion TCP à chaque appel)
+- APRÈS : client_ollama (Session keep-alive + pool de connexions)
+
+L'endpoint /api/version est utilisé pour isoler le coût HTTP du temps de
+génération du modèle. Si Ollama n'est pas joignable, un petit serveur local
+HTTP/1.1 est démarré pour que la mesure reste possible.
+
+Usage: python benchmark_client_ollama.py [nombre_appels]
+"""
+
+import sys
+import time
+import threading
+import statistics
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from client_ollama import OllamaClient, OLLAMA_URL
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Répond comme /api/version d'Ollama, avec keep-alive"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Sinon Nagle + ACK retardé ajoutent ~40 ms en keep-alive
+
+    def do_GET(self):
+        body = b'{"version": "benchmark"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_server():
+    """Démarre un faux serveur Ollama local et retourne son URL"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def measure(call, count):
+    """Exécute call() count fois et retourne les durées en millisecondes"""
+    call()  # Échauffement (résolution DNS, première connexion)
+    durations = []
+    for _ in range(count):
+        start = time.perf_counter()
+        call()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def print_stats(label, durations):
+    print(f"{label:<28} moyenne {statistics.mean(durations):7.2f} ms | "
+          f"médiane {statistics.median(durations):7.2f} ms | "
+          f"max {max(durations):7.2f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("⏱️  BENCHMARK CLIENT OLLAMA")
+    print("=" * 60)
+
+    base_url = OLLAMA_URL
+    server = None
+    try:
+        requests.get(f"{base_url}/api/version", timeout=2).raise_for_status()
+        print(f"🌐 Ollama: {base_url}")
+    except requests.exceptions.RequestException:
+        server, base_url = start_fake_server()
+        print(f"⚠️  Ollama injoignable - serveur local de test: {base_url}")
+
+    print(f"🔁 {count} appels par méthode")
+    print("-" * 60)
+
+    before = measure(lambda: requests.get(f"{base_url}/api/version", timeout=5).json(), count)
+    print_stats("AVANT (requests direct)", before)
+
+    client = OllamaClient(base_url)
+    after = measure(lambda: client.get("/api/version", timeout=5).json(), count)
+    print_stats("APRÈS (session partagée)", after)
+    client.close()
+
+    gain = statistics.mean(before) - statistics.mean(after)
+    print("-" * 60)
+    print(f"📊 Gain moyen par appel: {gain:.2f} ms "
+          f"({gain / statistics.mean(before) * 100:.0f}%)")
+
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
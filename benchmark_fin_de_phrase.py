@@ -0,0 +1,112 @@
+"""
+Benchmark de la détection de fin de phrase
+==========================================
+
+Écrit des fixtures WAV (voix de synthèse, fixtures_audio) puis les relit en
+temps réel par trames de 32 ms, comme le micro :
+- commandes courtes ("ouvre chrome", 2 mots)
+- longues questions (9 mots, une hésitation de 450 ms au milieu)
+
+Mesure le délai entre la fin de la parole et l'envoi de la commande au
+traitement (transcription disponible) :
+- AVANT : recognizer.listen, pause_threshold = 1.5 s de silence, puis reconnaissance
+- APRÈS : fin de phrase adaptative, avec et sans fin anticipée
+
+La reconnaissance est simulée (latence fixe, réglable) : elle ne connaît que
+la transcription de la fixture, tronquée si l'audio l'est.
+
+Usage: python benchmark_fin_de_phrase.py [latence_reconnaissance_s] [dossier_fixtures]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from fin_de_phrase import DetecteurFinDePhrase
+from fixtures_audio import SAMPLE_RATE, to_pcm16, utterance, write_wav
+from mot_reveil import read_wav
+
+PAUSE_THRESHOLD = 1.5  # Ancien recognizer.pause_threshold
+CHUNK = 512
+COMMAND = (["u v r", "k r o m"], "ouvre chrome")
+QUESTION = (["k e l", "è", "l a", "k a p i t a l"], ["d y", "k a n a d a", "e", "k o m b i a n", "d a b i t an"],
+            "quelle est la capitale du canada et combien d'habitants")
+
+
+def write_fixtures(directory):
+    """Écrit les WAV et retourne [(chemin, transcription, fin de la parole)]"""
+    fixtures = []
+    for seed in range(8):
+        samples, bounds = utterance(COMMAND[0], seed=seed, tail=2.0)
+        path = os.path.join(directory, f"commande_{seed}.wav")
+        write_wav(path, samples)
+        fixtures.append((path, COMMAND[1], bounds[-1][1]))
+    for seed in range(8):
+        first, _ = utterance(QUESTION[0], seed=seed, tail=0.45)
+        rest, bounds = utterance(QUESTION[1], seed=seed + 50, lead=0.0, tail=2.0)
+        path = os.path.join(directory, f"question_{seed}.wav")
+        write_wav(path, np.concatenate([first, rest]))
+        fixtures.append((path, QUESTION[2], len(first) / SAMPLE_RATE + bounds[-1][1]))
+    return fixtures
+
+
+def simulated_recognizer(transcript, speech_end, latency):
+    """Reconnaissance à latence fixe ; texte tronqué si l'audio s'arrête avant la fin de la parole"""
+    def transcribe(pcm):
+        time.sleep(latency)
+        # Le PCM commence au pré-enregistrement : marge d'une demi-seconde
+        return transcript if len(pcm) / 2 / SAMPLE_RATE >= speech_end - 0.5 else transcript.split()[0]
+    return transcribe
+
+
+def replay(path, transcript, speech_end, latency, early_commit):
+    """(délai fin de parole -> fin de phrase, -> commande, raison, transcription), WAV rejoué en temps réel"""
+    samples, _ = read_wav(path)
+    pcm = to_pcm16(samples)
+    transcribe = simulated_recognizer(transcript, speech_end, latency)
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE, transcribe=transcribe if early_commit else None,
+                                    is_complete=lambda text: text == COMMAND[1])
+    start = time.perf_counter()
+    for offset in range(0, len(pcm), CHUNK * 2):
+        time.sleep(max(0.0, start + offset / 2 / SAMPLE_RATE - time.perf_counter()))  # Cadence du micro
+        if endpoint.feed(pcm[offset:offset + CHUNK * 2]):
+            break
+    endpoint_time = time.perf_counter() - start - speech_end
+    audio, text = endpoint.result()
+    if text is None:
+        text = transcribe(audio)
+    return endpoint_time, time.perf_counter() - start - speech_end, endpoint.reason, text
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    directory = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp(prefix="fixtures_fin_de_phrase_")
+    fixtures = write_fixtures(directory)
+    print(f"📊 {len(fixtures)} fixtures dans {directory}, reconnaissance simulée à {latency * 1000:.0f} ms\n")
+    print(f"AVANT   pause_threshold {PAUSE_THRESHOLD}s : {(PAUSE_THRESHOLD + latency) * 1000:.0f} ms pour toute phrase")
+
+    for early_commit in (False, True):
+        delays = {"commande": [], "question": []}
+        endpoints = {"commande": [], "question": []}
+        reasons, cut = {}, 0
+        for path, transcript, speech_end in fixtures:
+            endpoint_delay, delay, reason, text = replay(path, transcript, speech_end, latency, early_commit)
+            kind = "commande" if "commande" in path else "question"
+            endpoints[kind].append(endpoint_delay * 1000)
+            delays[kind].append(delay * 1000)
+            reasons[reason] = reasons.get(reason, 0) + 1
+            cut += text != transcript
+        label = "APRÈS   avec fin anticipée" if early_commit else "APRÈS   silence adaptatif "
+        print(f"{label} : commande {statistics.mean(delays['commande']):.0f} ms "
+              f"(max {max(delays['commande']):.0f}), question {statistics.mean(delays['question']):.0f} ms "
+              f"(max {max(delays['question']):.0f}), {cut} phrase(s) coupée(s), fins {reasons}")
+        print(f"        dont fin de phrase : commande {statistics.mean(endpoints['commande']):.0f} ms, "
+              f"question {statistics.mean(endpoints['question']):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark du détecteur local de mot de réveil
+=============================================
+
+Écrit des fixtures WAV (voix de synthèse, fixtures_audio) puis les relit
+trame par trame comme le micro (32 ms) :
+- modèles : "assistant" prononcé seul par 3 locuteurs
+- positifs : "assistant" seul ou en début de phrase, autres locuteurs
+- négatifs : mots proches ("distant", "instant", "assiette"...) et courants
+- bruit de fond seul (fausses détections par heure)
+
+Mesure le taux de détection, le taux de fausses acceptations, le retard
+entre la fin du mot et la détection, et le temps de calcul par comparaison.
+(Avant : morceaux de 4 s envoyés à Google, ~1 s de retard après la fin du
+morceau, plus l'aller-retour réseau.)
+
+Usage: python benchmark_mot_reveil.py [dossier_fixtures]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+
+from fixtures_audio import SAMPLE_RATE, background_noise, utterance, write_wav
+from mot_reveil import DetecteurMotReveil, read_wav
+
+WAKE_WORD = "a s i s t an"
+NEGATIVE_WORDS = {
+    "distant": "d i s t an", "instant": "in s t an", "assiette": "a s i è t",
+    "assis": "a s i", "silence": "s i l an s", "musique": "m y z i k",
+    "bonjour": "b on j u r", "ouvre chrome": "u v r k r o m", "cinéma": "s i n e m a",
+}
+CHUNK = 512
+
+
+def write_fixtures(directory):
+    """Écrit les WAV et retourne (dossier des modèles, [(chemin, fin du mot ou None)])"""
+    templates_dir = os.path.join(directory, "modeles")
+    os.makedirs(templates_dir, exist_ok=True)
+    for seed in range(3):
+        write_wav(os.path.join(templates_dir, f"assistant_{seed}.wav"), utterance([WAKE_WORD], seed=seed, lead=0.2, tail=0.2)[0])
+
+    fixtures = []
+    for seed in range(10, 30):
+        words = [WAKE_WORD] if seed % 2 else [WAKE_WORD, "u v r", "k r o m"]
+        samples, bounds = utterance(words, seed=seed)
+        path = os.path.join(directory, f"positif_{seed}.wav")
+        write_wav(path, samples)
+        fixtures.append((path, bounds[0][1]))
+    for name, phonemes in NEGATIVE_WORDS.items():
+        for seed in range(100, 110):
+            path = os.path.join(directory, f"negatif_{name.replace(' ', '_')}_{seed}.wav")
+            write_wav(path, utterance([phonemes], seed=seed)[0])
+            fixtures.append((path, None))
+    path = os.path.join(directory, "bruit_10min.wav")
+    write_wav(path, background_noise(600, level=0.02))
+    fixtures.append((path, None))
+    return templates_dir, fixtures
+
+
+def replay(detector, path):
+    """Rejoue un WAV par trames ; retourne les instants (s) des détections"""
+    samples, _ = read_wav(path)
+    detector.reset()
+    hits = []
+    for start in range(0, len(samples), CHUNK):
+        if detector.feed(samples[start:start + CHUNK]):
+            hits.append((start + CHUNK) / SAMPLE_RATE)
+    return hits
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp(prefix="fixtures_mot_reveil_")
+    templates_dir, fixtures = write_fixtures(directory)
+    detector = DetecteurMotReveil.from_directory(templates_dir, sample_rate=SAMPLE_RATE)
+    print(f"📊 Fixtures dans {directory}, seuil calibré {detector.threshold:.2f}\n")
+
+    latencies, detected, positives = [], 0, 0
+    false_accepts, negatives, noise_hits, noise_hours = 0, 0, 0, 0
+    check_times = []
+    for path, word_end in fixtures:
+        hits = replay(detector, path)
+        check_times.append(detector.last_check_ms)
+        if word_end is not None:
+            positives += 1
+            if hits:
+                detected += 1
+                latencies.append((hits[0] - word_end) * 1000)
+        elif "bruit" in path:
+            noise_hits += len(hits)
+            noise_hours += len(read_wav(path)[0]) / SAMPLE_RATE / 3600
+        else:
+            negatives += 1
+            false_accepts += bool(hits)
+
+    print(f"Détection        {detected}/{positives} ({detected / positives * 100:.0f}%)")
+    print(f"Fausses accept.  {false_accepts}/{negatives} mots proches ou courants ({false_accepts / negatives * 100:.1f}%), "
+          f"{noise_hits / noise_hours:.1f} par heure de bruit seul")
+    if latencies:
+        print(f"Retard           moyen {statistics.mean(latencies):.0f} ms, max {max(latencies):.0f} ms après la fin du mot")
+    print(f"Calcul           {statistics.mean(check_times):.1f} ms par comparaison (toutes les 100 ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark de la synthèse en pipeline
+====================================
+
+Mesure le temps avant le premier son et le temps total pour une réponse
+longue :
+- AVANT : tout le texte synthétisé, puis joué (ancien speak_coqui)
+- APRÈS : phrase N+1 synthétisée pendant la lecture de la phrase N
+
+La sortie est la sortie nulle en temps réel (attend la durée du son).
+Le moteur "simule" produit 60 ms d'audio par caractère en prenant
+facteur_temps_reel x cette durée ; "coqui" utilise le vrai modèle.
+
+Usage: python benchmark_pipeline_synthese.py [simule|coqui] [facteur_temps_reel]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from pipeline_synthese import PipelineSynthese
+from sortie_audio import SortieNulle
+from synthese_vocale import coqui_synthesize
+
+SAMPLE_RATE = 16000
+SECONDS_PER_CHAR = 0.06
+
+TEXT = ("Un assistant vocal écoute une commande, la transcrit puis décide quoi faire. "
+        "Pour une question, il interroge un modèle de langage local. "
+        "La réponse est ensuite lue à voix haute, phrase par phrase. "
+        "Le premier son doit arriver le plus tôt possible. "
+        "Les phrases suivantes sont préparées pendant la lecture.")
+
+
+def simulated_engine(real_time_factor):
+    def synthesize(text):
+        duration = len(text) * SECONDS_PER_CHAR
+        time.sleep(duration * real_time_factor)
+        return np.zeros(int(duration * SAMPLE_RATE), dtype=np.float32), SAMPLE_RATE
+    return synthesize
+
+
+def coqui_engine():
+    from TTS.api import TTS
+    tts = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC", progress_bar=False, gpu=False)
+    return lambda text: coqui_synthesize(tts, text)
+
+
+def sequential(synthesize, output, text):
+    start = time.perf_counter()
+    audio = synthesize(text)
+    first_audio = time.perf_counter() - start
+    output.play(*audio)
+    return first_audio, time.perf_counter() - start
+
+
+def pipelined(synthesize, output, text):
+    stats = PipelineSynthese(synthesize, lambda audio: output.play(*audio)).speak(text)
+    return stats["premier_son"], stats["total"]
+
+
+def main():
+    engine = sys.argv[1] if len(sys.argv) > 1 else "simule"
+    real_time_factor = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    synthesize = coqui_engine() if engine == "coqui" else simulated_engine(real_time_factor)
+    output = SortieNulle(realtime=True)
+
+    synthesize("Préchauffage.")
+    print(f"📊 Moteur '{engine}', {len(TEXT)} caractères\n")
+    for label, run in [("AVANT", sequential), ("APRÈS", pipelined)]:
+        output.played.clear()
+        first_audio, total = run(synthesize, output, TEXT)
+        print(f"{label:<6} premier son {first_audio:6.2f}s, total {total:6.2f}s (audio {sum(output.played):.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark du prompt de recherche d'application
+==============================================
+
+Compare la liste d'applications envoyée à Mistral par ai_smart_app_search :
+- AVANT : 20 applications "importantes" + les 40 premières du catalogue
+- APRÈS : les k applications les plus proches selon l'index local
+          (CatalogueIndex.retrieve) + les applications courantes
+
+Pour chaque requête étiquetée on mesure la taille de la liste (lignes),
+celle du prompt complet APP_SEARCH_PROMPT (tokens estimés) et si
+l'application attendue y figure (taux de présence). Si Ollama est joignable,
+prompt_eval_count et prompt_eval_duration réels sont relevés avec le modèle
+de config.MODEL_NAME (num_predict=1 pour ne mesurer que l'évaluation du
+prompt).
+
+Usage: python benchmark_prompt_applications.py [k]
+"""
+
+import os
+import sys
+import statistics
+
+from client_ollama import OllamaClient, OLLAMA_URL
+from index_applications import APP_SEARCH_PROMPT, POPULAR_APP_KEYWORDS, CatalogueIndex, load_catalog
+
+try:
+    import config
+except ImportError:
+    config = None
+
+MODEL = getattr(config, "MODEL_NAME", "mistral:instruct")
+LEGACY_KEYWORDS = ['netflix', 'chrome', 'firefox', 'edge', 'vlc', 'spotify', 'word', 'excel']
+
+# (phrase utilisateur, clés acceptées)
+LABELLED_QUERIES = [
+    ("je veux que tu ouvres netflix", {"netflix"}),
+    ("lance le navigateur", {"google chrome", "chrome", "microsoft edge", "navigateur opera"}),
+    ("je veux regarder un film", {"netflix", "vlc media player", "vlc"}),
+    ("ouvre discorde", {"discord"}),
+    ("lance visual studio", {"visual studio code"}),
+    ("démarre docker", {"docker desktop"}),
+    ("ouvre audacity pour enregistrer", {"audacity"}),
+    ("lance photoshop", {"photoshop"}),
+    ("ouvre la calculatrice", {"calc"}),
+    ("ouvre le bloc notes", {"notepad"}),
+    ("lance steam", {"steam"}),
+    ("ouvre teams", {"microsoft teams"}),
+    ("ouvre paint", {"mspaint"}),
+    ("lance git", {"git"}),
+    ("ouvre excel", {"excel"}),
+    ("lance vlc", {"vlc media player", "vlc"}),
+]
+
+
+def legacy_candidates(applications, query):
+    """Sélection d'origine : indépendante de la requête"""
+    important, other = [], []
+    for app_key in applications:
+        if any(keyword in app_key.lower() for keyword in LEGACY_KEYWORDS):
+            important.append(app_key)
+        else:
+            other.append(app_key)
+    return important[:20] + other[:40]
+
+
+def retrieval_candidates(index, popular, query, k):
+    """Sélection par l'index local, complétée par les applications courantes"""
+    selected = [app_key for app_key, _ in index.retrieve(query, k)]
+    return selected + [app_key for app_key in popular if app_key not in selected]
+
+
+def apps_list(applications, app_keys):
+    return "\n".join(f"- {applications[app_key]['nom']} (clé: {app_key})" for app_key in app_keys)
+
+
+def estimate_tokens(text):
+    """Estimation grossière (~4 caractères par token)"""
+    return len(text) / 4
+
+
+def prompt_eval(client, prompt):
+    """Retourne (prompt_eval_count, prompt_eval_duration en ms) mesurés par Ollama"""
+    response = client.post("/api/generate", {
+        "model": MODEL,
+        "prompt": prompt,
+        "stream": False,
+        "options": {"num_predict": 1, "temperature": 0}
+    })
+    response.raise_for_status()
+    result = response.json()
+    return result.get("prompt_eval_count", 0), result.get("prompt_eval_duration", 0) / 1e6
+
+
+def report(label, rows):
+    lines = [row["lignes"] for row in rows]
+    tokens = [row["tokens"] for row in rows]
+    hits = sum(row["trouvee"] for row in rows)
+    print(f"{label:<8} {statistics.mean(lines):>8.1f} lignes  ~{statistics.mean(tokens):>7.0f} tokens  "
+          f"présence {hits}/{len(rows)} ({hits / len(rows) * 100:.0f}%)")
+    if rows[0].get("eval_ms") is not None:
+        print(f"{'':<8} prompt_eval_count moyen {statistics.mean(row['eval_count'] for row in rows):.0f}, "
+              f"prompt_eval_duration moyen {statistics.mean(row['eval_ms'] for row in rows):.0f} ms")
+
+
+def main():
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    applications, app_commands_map = load_catalog(os.path.join(os.path.dirname(__file__), "applications_assistant.json"))
+    index = CatalogueIndex(applications, app_commands_map)
+    popular = index.popular_apps(POPULAR_APP_KEYWORDS)
+
+    client = OllamaClient(OLLAMA_URL)
+    try:
+        client.get("/api/version", timeout=2).raise_for_status()
+    except Exception:
+        print("⚠️ Ollama non joignable: mesure des tokens estimés uniquement")
+        client = None
+
+    print(f"📊 {len(applications)} applications, {len(LABELLED_QUERIES)} requêtes, k={k}, modèle {MODEL}\n")
+    results = {"AVANT": [], "APRÈS": []}
+    for query, expected in LABELLED_QUERIES:
+        for label, app_keys in (("AVANT", legacy_candidates(applications, query)),
+                                ("APRÈS", retrieval_candidates(index, popular, query, k))):
+            prompt = APP_SEARCH_PROMPT.format(original_query=query, apps_list=apps_list(applications, app_keys))
+            row = {"lignes": len(app_keys), "tokens": estimate_tokens(prompt),
+                   "trouvee": bool(expected & set(app_keys))}
+            if client:
+                row["eval_count"], row["eval_ms"] = prompt_eval(client, prompt)
+            results[label].append(row)
+
+    for label, rows in results.items():
+        report(label, rows)
+
+
+if __name__ == "__main__":
+    main()
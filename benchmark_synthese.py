@@ -0,0 +1,73 @@
+"""
+Benchmark du processus de synthèse vocale
+=========================================
+
+Mesure le surcoût par phrase (temps total - temps de synthèse rapporté) :
+- AVANT : un nouveau processus par phrase (comme os.system("powershell ..."))
+- APRÈS : processus de synthèse persistant (synthese_vocale)
+
+Usage: python benchmark_synthese.py [moteur] [nombre_phrases]
+       moteur: sapi (Windows) ou stub (par défaut hors Windows)
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from synthese_vocale import ENGINES, SYNTHESIS_ENGINE, ProcessusSynthese, encode_speak
+
+PHRASES = [
+    "Compris ! Je traite votre demande.",
+    "Action détectée : ouvrir. Je traite votre demande.",
+    "Netflix est maintenant ouvert.",
+    "Traitement terminé avec succès !",
+]
+
+
+def spawn_per_phrase(engine, text):
+    """Ancien fonctionnement : un processus démarré, utilisé puis arrêté pour une phrase"""
+    start = time.perf_counter()
+    result = subprocess.run(ENGINES[engine](), input=encode_speak(text) + "QUIT\n",
+                            capture_output=True, text=True, encoding="utf-8")
+    total = time.perf_counter() - start
+    reply = [line for line in result.stdout.splitlines() if line.startswith("OK")]
+    synthesis = int(reply[0].split()[1]) / 1000 if reply else 0
+    return total, synthesis
+
+
+def persistent(synthese, text):
+    start = time.perf_counter()
+    synthesis = synthese.speak(text)
+    return time.perf_counter() - start, synthesis
+
+
+def report(label, measures):
+    overheads = [(total - synthesis) * 1000 for total, synthesis in measures]
+    print(f"{label:<8} surcoût moyen {statistics.mean(overheads):8.1f} ms, "
+          f"médiane {statistics.median(overheads):8.1f} ms, max {max(overheads):8.1f} ms")
+    return statistics.mean(overheads)
+
+
+def main():
+    engine = sys.argv[1] if len(sys.argv) > 1 else SYNTHESIS_ENGINE
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    phrases = [PHRASES[i % len(PHRASES)] for i in range(count)]
+    print(f"📊 Moteur '{engine}', {count} phrases\n")
+
+    before = [spawn_per_phrase(engine, text) for text in phrases]
+
+    synthese = ProcessusSynthese(engine)
+    synthese.start()
+    after = [persistent(synthese, text) for text in phrases]
+    synthese.close()
+
+    print()
+    mean_before = report("AVANT", before)
+    mean_after = report("APRÈS", after)
+    print(f"\n⚡ Gain: {mean_before - mean_after:.1f} ms par phrase, "
+          f"soit ~{(mean_before - mean_after) * 5 / 1000:.2f}s par commande (5 phrases)")
+
+
+if __name__ == "__main__":
+    main()
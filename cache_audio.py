@@ -0,0 +1,149 @@
+"""
+Cache audio des phrases fixes
+=============================
+
+"Présent ! Je vous écoute.", "Traitement terminé avec succès !"... étaient
+resynthétisées à chaque commande. Ici l'audio rendu (WAV) est adressé par
+son contenu : la clé est le hash du texte, de la voix, de la vitesse et du
+moteur, donc changer de voix ou de vitesse ne rejoue jamais un ancien rendu.
+
+- Couche mémoire LRU (OrderedDict) bornée en octets : lecture directe
+- Couche disque (un fichier <clé>.wav par phrase) bornée en octets, LRU
+  selon la date de dernier accès, qui survit aux redémarrages
+- Compteurs de hits / misses
+
+    from cache_audio import CacheAudio, audio_key
+
+    cache = CacheAudio()
+    key = audio_key("Présent ! Je vous écoute.", "Hortense", 1, "sapi")
+    wav = cache.get_or_render(key, lambda: synthese.render(texte, rate=1)[0])
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    import config
+except ImportError:
+    config = None
+
+AUDIO_CACHE_DIR = getattr(config, "DOSSIER_CACHE_AUDIO", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_audio"))
+AUDIO_CACHE_MAX_BYTES = getattr(config, "TAILLE_CACHE_AUDIO", 50 * 1024 * 1024)  # Disque
+AUDIO_CACHE_MEMORY_BYTES = getattr(config, "TAILLE_CACHE_AUDIO_MEMOIRE", 16 * 1024 * 1024)
+
+
+def audio_key(text, voice, rate, backend):
+    """Clé de contenu d'un rendu audio"""
+    raw = json.dumps([backend, voice, rate, text], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CacheAudio:
+    """Rendus WAV en mémoire et sur disque, chaque couche bornée en octets (LRU)"""
+
+    def __init__(self, directory=AUDIO_CACHE_DIR, max_bytes=AUDIO_CACHE_MAX_BYTES,
+                 memory_bytes=AUDIO_CACHE_MEMORY_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self._memory = OrderedDict()  # clé -> WAV
+        self._memory_size = 0
+        self._disk = OrderedDict()  # clé -> taille, du moins au plus récemment utilisé
+        self._lock = threading.Lock()
+        self.stats = {"hits_memoire": 0, "hits_disque": 0, "misses": 0}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            entries = []
+            for name in os.listdir(directory):
+                if name.endswith(".wav"):
+                    info = os.stat(os.path.join(directory, name))
+                    entries.append((info.st_mtime, name[:-4], info.st_size))
+            for _, key, size in sorted(entries):
+                self._disk[key] = size
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".wav")
+
+    def get(self, key):
+        """Retourne le WAV en cache ou None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits_memoire"] += 1
+                return data
+
+            if key in self._disk:
+                try:
+                    with open(self._path(key), "rb") as f:
+                        data = f.read()
+                    os.utime(self._path(key))  # Date de dernier accès pour la LRU disque
+                except OSError:
+                    del self._disk[key]
+                else:
+                    self._disk.move_to_end(key)
+                    self._remember(key, data)
+                    self.stats["hits_disque"] += 1
+                    return data
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key, data):
+        """Enregistre un WAV dans les deux couches"""
+        with self._lock:
+            self._remember(key, data)
+            if not self.directory:
+                return
+            temp_path = self._path(key) + ".tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, self._path(key))
+            except OSError as e:
+                print(f"⚠️ Cache audio disque indisponible: {e}")
+                return
+            self._disk[key] = len(data)
+            self._disk.move_to_end(key)
+            self._evict_disk()
+
+    def get_or_render(self, key, render):
+        """WAV en cache, sinon rendu par render() puis mis en cache"""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def _remember(self, key, data):
+        """Ajoute en mémoire et évince les entrées les moins récemment utilisées"""
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _evict_disk(self):
+        while sum(self._disk.values()) > self.max_bytes and len(self._disk) > 1:
+            key, _ = self._disk.popitem(last=False)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def disk_size(self):
+        return sum(self._disk.values())
+
+    def print_stats(self):
+        total = sum(self.stats.values())
+        hits = self.stats["hits_memoire"] + self.stats["hits_disque"]
+        rate = hits / total * 100 if total else 0
+        print(f"🔈 Cache audio: {hits}/{total} hits ({rate:.0f}%) - "
+              f"mémoire {self.stats['hits_memoire']}, disque {self.stats['hits_disque']}, "
+              f"{len(self._disk)} rendus sur disque ({self.disk_size() / 1024:.0f} Ko)")
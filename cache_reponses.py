@@ -0,0 +1,135 @@
+"""
+Cache des réponses Mistral
+==========================
+
+Les prompts d'aide (ai_parse_intent, ai_smart_app_search, ai_help_context...)
+sont des gabarits déterministes : pour une même entrée, on renvoie la réponse
+déjà obtenue au lieu de refaire un aller-retour de plusieurs secondes vers Ollama.
+
+- Couche mémoire LRU (OrderedDict) pour les accès les plus fréquents
+- Couche SQLite optionnelle qui survit aux redémarrages
+- TTL par type d'appel
+- Compteurs de hits / misses
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import config
+except ImportError:
+    config = None
+
+CACHE_MAX_ENTRIES = getattr(config, "CACHE_MAX_ENTRIES", 512)
+CACHE_FILE = getattr(config, "CACHE_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_reponses.sqlite"))
+
+# Durée de vie (secondes) par type d'appel
+CACHE_TTL = getattr(config, "CACHE_TTL", {
+    "analyse": 7 * 24 * 3600,       # Catégorisation d'une commande : stable
+    "recherche_app": 24 * 3600,     # Dépend du catalogue d'applications
+    "suggestions": 24 * 3600,
+    "aide": 24 * 3600,
+    "defaut": 3600
+})
+
+
+def make_key(model, prompt, options=None):
+    """Clé de cache stable à partir du modèle, du prompt et des options"""
+    raw = json.dumps([model, prompt, options or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ReponseCache:
+    """Cache LRU en mémoire avec persistance SQLite optionnelle"""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, db_path=CACHE_FILE, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = dict(CACHE_TTL)
+        if ttl:
+            self.ttl.update(ttl)
+
+        self._memory = OrderedDict()  # clé -> (expire_at, réponse)
+        self._lock = threading.Lock()
+        self.stats = {"hits_memoire": 0, "hits_disque": 0, "misses": 0}
+
+        self._db = None
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS reponses "
+                    "(cle TEXT PRIMARY KEY, reponse TEXT NOT NULL, expire_at REAL NOT NULL)"
+                )
+                self._db.execute("DELETE FROM reponses WHERE expire_at < ?", (time.time(),))
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Cache disque indisponible: {e}")
+                self._db = None
+
+    def get(self, key):
+        """Retourne la réponse en cache ou None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry:
+                expire_at, response = entry
+                if expire_at >= now:
+                    self._memory.move_to_end(key)
+                    self.stats["hits_memoire"] += 1
+                    return response
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT reponse, expire_at FROM reponses WHERE cle = ?", (key,)
+                ).fetchone()
+                if row and row[1] >= now:
+                    self._remember(key, row[1], row[0])
+                    self.stats["hits_disque"] += 1
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key, response, call_type="defaut"):
+        """Enregistre une réponse avec le TTL de son type d'appel"""
+        expire_at = time.time() + self.ttl.get(call_type, self.ttl["defaut"])
+        with self._lock:
+            self._remember(key, expire_at, response)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO reponses (cle, reponse, expire_at) VALUES (?, ?, ?)",
+                    (key, response, expire_at)
+                )
+                self._db.commit()
+
+    def _remember(self, key, expire_at, response):
+        """Ajoute en mémoire et évince l'entrée la moins récemment utilisée"""
+        self._memory[key] = (expire_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """Vide les deux couches du cache"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM reponses")
+                self._db.commit()
+
+    def hit_rate(self):
+        """Taux de réussite du cache (0.0 à 1.0)"""
+        hits = self.stats["hits_memoire"] + self.stats["hits_disque"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def print_stats(self):
+        print(f"💾 Cache réponses: {self.stats['hits_memoire']} hits mémoire, "
+              f"{self.stats['hits_disque']} hits disque, {self.stats['misses']} misses "
+              f"({self.hit_rate() * 100:.0f}% de réussite)")
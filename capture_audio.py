@@ -0,0 +1,162 @@
+"""
+Capture micro continue dans un tampon circulaire
+================================================
+
+Chaque boucle d'écoute faisait "with self.microphone as source:" : le flux
+PyAudio était ouvert puis refermé à chaque tour, ce qui coûte du temps et
+perd tout ce qui est dit entre deux ouvertures (la commande enchaînée juste
+après "Assistant", par exemple). Ici un seul thread garde le micro ouvert et
+écrit des trames de taille fixe (CHUNK échantillons) dans un tampon
+circulaire alloué une fois (bytearray de CAPTURE_SECONDS secondes).
+
+Chaque consommateur (mot de réveil, commande, écoute d'interruption) a son
+LecteurCapture, avec sa propre position : read() rend une vue memoryview de
+la trame dans le tampon, sans copie. Un lecteur qui continue après un autre
+ne perd aucune trame ; "with lecteur as source:" repart du direct, comme la
+réouverture d'un micro, mais sans rien rouvrir. Les vues restent valides
+jusqu'à ce que le tampon fasse le tour : un consommateur qui garde l'audio
+plus longtemps le copie (b"".join, bytes()).
+
+Le lecteur suit l'interface de speech_recognition.Microphone (stream.read,
+CHUNK, SAMPLE_RATE, SAMPLE_WIDTH) et passe donc tel quel à recognizer.listen,
+adjust_for_ambient_noise, EcouteInterruption ou au détecteur de mot de réveil.
+
+    from capture_audio import CaptureMicro
+
+    capture = CaptureMicro(sr.Microphone())
+    capture.start()
+    source = capture.reader()
+    trame = source.stream.read(source.CHUNK)     # memoryview dans le tampon
+"""
+
+import threading
+
+try:
+    import config
+except ImportError:
+    config = None
+
+try:
+    from speech_recognition import AudioSource
+except ImportError:
+    AudioSource = object
+
+CAPTURE_SECONDS = getattr(config, "DUREE_TAMPON_MICRO", 30)  # Plus que la plus longue phrase gardée en vues
+READ_TIMEOUT = 2.0  # Secondes sans trame avant de considérer la capture bloquée
+
+
+class CaptureMicro:
+    """Thread unique qui lit le micro et remplit le tampon circulaire"""
+
+    def __init__(self, microphone, seconds=CAPTURE_SECONDS):
+        self.microphone = microphone
+        self.seconds = seconds
+        self.written = 0  # Nombre de trames écrites depuis le début
+        self.error = None
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+        self._source = None
+
+    def start(self):
+        """Ouvre le micro une fois pour toutes et lance le thread de capture"""
+        self._source = self.microphone.__enter__()
+        self.CHUNK = self._source.CHUNK
+        self.SAMPLE_RATE = self._source.SAMPLE_RATE
+        self.SAMPLE_WIDTH = self._source.SAMPLE_WIDTH
+        self.frame_bytes = self.CHUNK * self.SAMPLE_WIDTH
+        self.frame_count = max(2, int(self.seconds * self.SAMPLE_RATE / self.CHUNK))
+        self.buffer = bytearray(self.frame_count * self.frame_bytes)
+        self._view = memoryview(self.buffer)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._source is not None:
+            self.microphone.__exit__(None, None, None)
+            self._source = None
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                data = bytes(self._source.stream.read(self.CHUNK))[:self.frame_bytes]
+                slot = self.written % self.frame_count
+                self._view[slot * self.frame_bytes:(slot + 1) * self.frame_bytes] = data.ljust(self.frame_bytes, b"\0")
+                with self._condition:
+                    self.written += 1
+                    self._condition.notify_all()
+        except Exception as e:
+            print(f"❌ Capture micro arrêtée: {e}")
+            self.error = e
+        finally:
+            with self._condition:
+                self._stop.set()
+                self._condition.notify_all()
+
+    def frame(self, position):
+        """Vue de la trame numéro position, en attendant qu'elle soit écrite"""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.written > position or self._stop.is_set(), READ_TIMEOUT):
+                raise OSError(f"Aucune trame du micro depuis {READ_TIMEOUT:.0f} s")
+            if self.written <= position:
+                raise OSError(f"Capture micro arrêtée ({self.error})")
+        slot = position % self.frame_count
+        return self._view[slot * self.frame_bytes:(slot + 1) * self.frame_bytes]
+
+    def reader(self):
+        """Nouveau lecteur, positionné sur le direct"""
+        return LecteurCapture(self)
+
+
+class LecteurCapture(AudioSource):
+    """Position de lecture dans le tampon, utilisable comme source speech_recognition"""
+
+    def __init__(self, capture):
+        self.capture = capture
+        self.CHUNK = capture.CHUNK
+        self.SAMPLE_RATE = capture.SAMPLE_RATE
+        self.SAMPLE_WIDTH = capture.SAMPLE_WIDTH
+        self.stream = self
+        self.position = capture.written
+        self.lost_frames = 0
+
+    def __enter__(self):
+        self.skip_to_live()
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def skip_to_live(self):
+        """Ignore tout ce qui a été capturé et pas encore lu"""
+        self.skip_to(self.capture.written)
+
+    def skip_to(self, position):
+        """Avance jusqu'à position (jamais en arrière), par exemple la fin de la voix de l'assistant"""
+        self.position = max(self.position, position)
+
+    def read(self, size=None):
+        """Trame suivante (vue sans copie) ; size > CHUNK : plusieurs trames concaténées"""
+        count = max(1, (size or self.CHUNK) // self.CHUNK)
+        if count > 1:
+            return b"".join(self.read() for _ in range(count))
+        behind = self.capture.written - self.position
+        if behind >= self.capture.frame_count - 1:
+            # Le tampon a fait le tour : les trames non lues sont écrasées
+            self.lost_frames += behind
+            print(f"⚠️ Lecture micro en retard : {behind} trames perdues")
+            self.skip_to_live()
+        frame = self.capture.frame(self.position)
+        self.position += 1
+        return frame
+
+    def history(self, seconds):
+        """Copie des dernières secondes lues (avant la position), pour estimer le bruit de fond"""
+        count = min(int(seconds * self.SAMPLE_RATE / self.CHUNK), self.position, self.capture.frame_count - 2)
+        return b"".join(bytes(self.capture.frame(position)) for position in range(self.position - count, self.position))
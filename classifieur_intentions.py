@@ -0,0 +1,165 @@
+"""
+Classifieur d'intentions hors ligne
+===================================
+
+Quand aucun mot-clé ne correspond, process_command demandait à Mistral de
+choisir parmi cinq intentions. Ce module fait ce choix localement : une
+régression logistique multinomiale sur des n-grammes de caractères hachés,
+en NumPy pur, entraînée sur un corpus d'énoncés français livré avec le
+projet (corpus_intentions.json) et sur le journal des commandes déjà
+résolues (journal_commandes.jsonl).
+
+La prédiction prend quelques dizaines de microsecondes et retourne une
+probabilité : l'appel au LLM n'est gardé que lorsque le classifieur hésite.
+
+    classifieur = ClassifieurIntentions.from_files()
+    intention, probabilite = classifieur.predict("je veux regarder un film")
+"""
+
+import json
+import os
+import re
+import time
+import unicodedata
+import zlib
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_FILE = os.path.join(_DIR, "corpus_intentions.json")
+JOURNAL_FILE = getattr(config, "JOURNAL_COMMANDES", os.path.join(_DIR, "journal_commandes.jsonl"))
+
+INTENTS = ["ouvrir_application", "fermer_application", "lister_applications", "rechercher_web", "question"]
+NGRAM_RANGE = (2, 4)
+HASH_DIM = 1 << 14  # Nombre de colonnes du vecteur de n-grammes haché
+MIN_PROBABILITY = getattr(config, "SEUIL_CLASSIFIEUR", 0.7)  # En dessous, le LLM est consulté
+
+
+def _normalize(text):
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.sub(r"[^a-z0-9]+", " ", text).strip()
+
+
+def features(text):
+    """(indices, poids) des n-grammes de caractères hachés, normalisés L2"""
+    padded = f" {_normalize(text)} "
+    counts = {}
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        for i in range(len(padded) - n + 1):
+            index = zlib.crc32(padded[i:i + n].encode("ascii")) % HASH_DIM
+            counts[index] = counts.get(index, 0) + 1
+    indices = np.fromiter(counts, dtype=np.int64, count=len(counts))
+    weights = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    norm = np.linalg.norm(weights)
+    return indices, weights / norm if norm else weights
+
+
+def load_examples(corpus_path=CORPUS_FILE, journal_path=JOURNAL_FILE):
+    """Énoncés étiquetés [(texte, intention)] du corpus et du journal des commandes"""
+    examples = []
+    if corpus_path and os.path.exists(corpus_path):
+        with open(corpus_path, "r", encoding="utf-8") as f:
+            examples.extend((item["texte"], item["intention"]) for item in json.load(f))
+    if journal_path and os.path.exists(journal_path):
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue
+                if item.get("intention") in INTENTS:
+                    examples.append((item["commande"], item["intention"]))
+    return examples
+
+
+def log_command(command, intention, source, journal_path=JOURNAL_FILE):
+    """Ajoute une commande résolue au journal (exemple d'entraînement pour le prochain démarrage)"""
+    if not journal_path or intention not in INTENTS:
+        return
+    try:
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"commande": command, "intention": intention, "source": source,
+                                "date": time.strftime("%Y-%m-%d %H:%M:%S")}, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"⚠️ Journal des commandes indisponible: {e}")
+
+
+class ClassifieurIntentions:
+    """Régression logistique multinomiale sur n-grammes de caractères hachés"""
+
+    def __init__(self, intents=INTENTS):
+        self.intents = list(intents)
+        self.weights = np.zeros((HASH_DIM, len(self.intents)), dtype=np.float32)
+        self.bias = np.zeros(len(self.intents), dtype=np.float32)
+
+    @classmethod
+    def from_files(cls, corpus_path=CORPUS_FILE, journal_path=JOURNAL_FILE):
+        """Classifieur entraîné sur le corpus livré et le journal des commandes"""
+        classifier = cls()
+        start_time = time.perf_counter()
+        examples = load_examples(corpus_path, journal_path)
+        classifier.fit(examples)
+        print(f"🧠 Classifieur d'intentions entraîné sur {len(examples)} énoncés "
+              f"en {(time.perf_counter() - start_time) * 1000:.0f} ms")
+        return classifier
+
+    def fit(self, examples, epochs=100, learning_rate=16.0, l2=1e-4):
+        """Descente de gradient sur l'entropie croisée (matrice creuse des n-grammes)"""
+        if not examples:
+            return self
+        n = len(examples)
+        rows, cols, values = [], [], []
+        for row, (text, _) in enumerate(examples):
+            indices, weights = features(text)
+            rows.append(np.full(len(indices), row))
+            cols.append(indices)
+            values.append(weights)
+        rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+        targets = np.zeros((n, len(self.intents)), dtype=np.float32)
+        targets[np.arange(n), [self.intents.index(intent) for _, intent in examples]] = 1
+
+        # Seules les colonnes présentes dans le corpus sont entraînées. Les
+        # entrées sont groupées par ligne (déjà contiguës) et par colonne
+        # (après tri) pour que chaque produit creux soit un np.add.reduceat
+        used, cols = np.unique(cols, return_inverse=True)
+        row_starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        by_col = np.argsort(cols, kind="stable")
+        col_starts = np.flatnonzero(np.r_[True, np.diff(cols[by_col]) != 0])
+
+        weights = np.zeros((len(used), len(self.intents)), dtype=np.float32)
+        bias = np.zeros(len(self.intents), dtype=np.float32)
+        for _ in range(epochs):
+            logits = np.add.reduceat(values[:, None] * weights[cols], row_starts, axis=0)
+            probabilities = self._softmax(logits + bias)
+            error = (probabilities - targets) / n
+            gradient = np.add.reduceat((values[:, None] * error[rows])[by_col], col_starts, axis=0)
+            weights -= learning_rate * (gradient + l2 * weights)
+            bias -= learning_rate * error.sum(axis=0)
+
+        self.weights[:] = 0
+        self.weights[used] = weights
+        self.bias = bias
+        return self
+
+    @staticmethod
+    def _softmax(logits):
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def probabilities(self, text):
+        """Probabilité de chaque intention pour text"""
+        indices, weights = features(text)
+        return self._softmax(weights @ self.weights[indices] + self.bias)
+
+    def predict(self, text):
+        """(intention la plus probable, probabilité)"""
+        probabilities = self.probabilities(text)
+        best = int(np.argmax(probabilities))
+        return self.intents[best], float(probabilities[best])
@@ -0,0 +1,108 @@
+"""
+Client HTTP partagé pour l'API Ollama
+=====================================
+
+Toutes les variantes de l'assistant passent par ce client au lieu d'appeler
+requests.post directement. Une Session unique garde les connexions TCP
+ouvertes (keep-alive) et les réutilise via un pool, ce qui évite de refaire
+la poignée de main TCP à chaque appel au modèle.
+
+Utilisation:
+    from client_ollama import get_client
+
+    client = get_client("http://127.0.0.1:11434")
+    response = client.post("/api/generate", payload)
+    response.raise_for_status()
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Paramètres par défaut, surchargés par config.py s'il est présent
+try:
+    import config
+except ImportError:
+    config = None
+
+OLLAMA_URL = getattr(config, "OLLAMA_URL", "http://127.0.0.1:11434")
+CONNECT_TIMEOUT = getattr(config, "CONNECT_TIMEOUT_API", 3)  # Timeout de connexion en secondes
+READ_TIMEOUT = getattr(config, "TIMEOUT_API", 30)  # Timeout de lecture en secondes
+POOL_SIZE = getattr(config, "POOL_SIZE_API", 4)  # Connexions gardées ouvertes par hôte
+KEEP_ALIVE = getattr(config, "KEEP_ALIVE_MODELE", "30m")  # Durée de maintien du modèle en mémoire
+
+# Endpoints qui chargent un modèle et acceptent keep_alive
+MODEL_ENDPOINTS = ("/api/generate", "/api/chat", "/api/embeddings", "/api/embed")
+
+
+class OllamaClient:
+    """Client Ollama avec Session keep-alive et pool de connexions"""
+
+    def __init__(self, base_url=OLLAMA_URL, connect_timeout=CONNECT_TIMEOUT,
+                 read_timeout=READ_TIMEOUT, pool_size=POOL_SIZE, keep_alive=KEEP_ALIVE):
+        self.base_url = base_url.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+    def _timeout(self, timeout):
+        """Construit le couple (connexion, lecture) attendu par requests"""
+        if timeout is None:
+            return (self.connect_timeout, self.read_timeout)
+        if isinstance(timeout, tuple):
+            return timeout
+        return (self.connect_timeout, timeout)
+
+    def post(self, path, payload, timeout=None, stream=False):
+        """POST JSON sur un endpoint Ollama (ex: /api/generate)
+
+        keep_alive est ajouté aux requêtes de modèle pour qu'Ollama ne le
+        décharge pas entre deux commandes.
+        """
+        if path in MODEL_ENDPOINTS and self.keep_alive and "keep_alive" not in payload:
+            payload = dict(payload, keep_alive=self.keep_alive)
+        return self.session.post(
+            f"{self.base_url}{path}",
+            json=payload,
+            timeout=self._timeout(timeout),
+            stream=stream
+        )
+
+    def get(self, path="", timeout=None):
+        """GET sur un endpoint Ollama (ex: /api/tags)"""
+        return self.session.get(f"{self.base_url}{path}", timeout=self._timeout(timeout))
+
+    def warmup(self, model, timeout=None):
+        """Charge le modèle en mémoire sans rien générer (prompt vide)
+
+        Retourne la réponse d'Ollama, dont load_duration en nanosecondes.
+        """
+        response = self.post("/api/generate", {"model": model, "prompt": ""}, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        """Ferme toutes les connexions du pool"""
+        self.session.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(base_url=OLLAMA_URL):
+    """Retourne le client partagé pour cette URL (créé au premier appel)"""
+    key = base_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OllamaClient(key)
+            _clients[key] = client
+        return client
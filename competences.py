@@ -0,0 +1,264 @@
+"""
+Compétences locales
+===================
+
+Réponses immédiates, sans appel au LLM, pour les questions dont la réponse
+se calcule sur place : heure, date, calcul, conversion d'unités.
+
+Chaque compétence déclare les mots-clés qui peuvent la concerner et une
+méthode repondre(commande) qui retourne la phrase à prononcer, ou None si la
+commande ne la concerne finalement pas. Le moteur compile les mots-clés de
+toutes les compétences dans un AutomateMotsCles : une commande n'est
+proposée qu'aux compétences dont un mot-clé apparaît.
+
+    moteur = MoteurCompetences()
+    moteur.repondre("combien font 12 fois 7")   # → ("calcul", "12 fois 7 font 84.")
+    moteur.ajouter(MaCompetence())              # compétence supplémentaire
+"""
+
+import ast
+import operator
+import re
+from datetime import datetime
+
+from automate_motscles import AutomateMotsCles
+
+JOURS = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"]
+MOIS = ["janvier", "février", "mars", "avril", "mai", "juin", "juillet",
+        "août", "septembre", "octobre", "novembre", "décembre"]
+
+
+def format_number(value):
+    """Nombre prononçable : entier si possible, sinon 4 décimales au plus, virgule française"""
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        value = int(value)
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.4f}".rstrip("0").rstrip(".").replace(".", ",")
+
+
+class Competence:
+    """Compétence locale : mots-clés déclencheurs + réponse"""
+    nom = ""
+    mots_cles = []
+
+    def repondre(self, commande):
+        raise NotImplementedError
+
+
+class CompetenceHeure(Competence):
+    nom = "heure"
+    mots_cles = ["quelle heure", "l'heure"]
+    # Ancrées en fin de question : "quelle heure est-il à Tokyo" relève du LLM
+    FORMULES = re.compile(r"(?:quelle heure (?:est-il|il est|est il)|il est quelle heure|"
+                          r"(?:donne|dis)[- ]moi l'heure|l'heure (?:qu'il est|actuelle)|^l'heure)"
+                          r"(?:\s+(?:maintenant|actuellement|en ce moment|s'il (?:te|vous) plaît))?$")
+
+    def __init__(self, now=datetime.now):
+        self.now = now
+
+    def repondre(self, commande):
+        if not self.FORMULES.search(commande.lower().strip(" ?!.")):
+            return None  # "à quelle heure ferme la poste" n'est pas une demande d'heure
+        moment = self.now()
+        return f"Il est {moment.hour} heures {moment.minute:02d}."
+
+
+class CompetenceDate(Competence):
+    nom = "date"
+    mots_cles = ["quel jour", "quelle date", "la date", "le combien"]
+    # Ancrées en fin de question : "quelle est la date de la révolution" relève du LLM
+    FORMULES = re.compile(r"(?:quel jour (?:sommes-nous|sommes nous|on est|est-on|est-ce|nous sommes|aujourd'hui)|"
+                          r"c'est quel jour|on est quel jour|quelle (?:est la )?date|la date (?:d'aujourd'hui|du jour)|"
+                          r"(?:on est|nous sommes) le combien)"
+                          r"(?:\s+(?:aujourd'hui|maintenant|actuellement|s'il (?:te|vous) plaît))?$")
+
+    def __init__(self, now=datetime.now):
+        self.now = now
+
+    def repondre(self, commande):
+        if not self.FORMULES.search(commande.lower().strip(" ?!.")):
+            return None  # "la date de la révolution française" relève du LLM
+        moment = self.now()
+        return f"Nous sommes le {JOURS[moment.weekday()]} {moment.day} {MOIS[moment.month - 1]} {moment.year}."
+
+
+class CompetenceCalcul(Competence):
+    """Calcul arithmétique évalué sur l'arbre syntaxique (jamais eval)"""
+    nom = "calcul"
+    mots_cles = ["plus", "moins", "fois", "multipli", "divis", "+", "*", "/", "racine", "puissance",
+                 "au carré", "au cube", "pourcent", "pour cent", "%", "calcul", "combien font", "combien fait"]
+
+    OPERATEURS = [
+        (r"multipliée?s? par|fois|x|×", "*"),
+        (r"divisée?s? par|sur|÷", "/"),
+        (r"plus", "+"),
+        (r"moins", "-"),
+        (r"puissance|exposant", "**"),
+        (r"au carré", "**2"),
+        (r"au cube", "**3"),
+        (r"modulo", "%"),
+    ]
+    BINAIRES = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+                ast.Div: operator.truediv, ast.Pow: operator.pow, ast.Mod: operator.mod}
+    UNAIRES = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+    MAX_EXPOSANT = 100
+    MAX_RESULTAT = 10 ** 30  # Au-delà, le nombre n'est plus prononçable (et sa conversion en texte peut échouer)
+
+    def __init__(self):
+        self._operateurs = [(re.compile(rf"(?<![a-zé]){pattern}(?![a-zé])"), repl) for pattern, repl in self.OPERATEURS]
+        self._prefixe = re.compile(r"^.*?(?:combien (?:font|fait|vaut|valent|égale?)|calcule[rz]?|calcul de|"
+                                   r"résultat de|quel est le résultat de|ça fait combien)\s*")
+        self._pourcentage = re.compile(r"([\d.]+)\s*(?:%|pour ?cent)\s*de\s*([\d.]+)")
+        self._racine = re.compile(r"racine(?: carrée)? de\s*([\d.]+)")
+
+    def _evaluer(self, node):
+        if isinstance(node, ast.Expression):
+            return self._evaluer(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in self.BINAIRES:
+            left, right = self._evaluer(node.left), self._evaluer(node.right)
+            if isinstance(node.op, ast.Pow) and abs(right) > self.MAX_EXPOSANT:
+                raise ValueError("exposant trop grand")
+            resultat = self.BINAIRES[type(node.op)](left, right)
+            if isinstance(resultat, complex) or abs(resultat) > self.MAX_RESULTAT:
+                raise ValueError("résultat trop grand")
+            return resultat
+        if isinstance(node, ast.UnaryOp) and type(node.op) in self.UNAIRES:
+            return self.UNAIRES[type(node.op)](self._evaluer(node.operand))
+        raise ValueError(f"élément non autorisé: {type(node).__name__}")
+
+    def evaluer(self, expression):
+        """Évalue une expression arithmétique (nombres, + - * / ** % et parenthèses)"""
+        return self._evaluer(ast.parse(expression, mode="eval"))
+
+    def repondre(self, commande):
+        texte = commande.lower().strip(" ?!.")
+        texte = re.sub(r"(\d),(\d)", r"\1.\2", texte)  # Décimales à la française
+        texte = self._prefixe.sub("", texte)
+
+        pourcentage = self._pourcentage.search(texte)
+        if pourcentage:
+            texte = f"{pourcentage.group(1)}*{pourcentage.group(2)}/100"
+        racine = self._racine.search(texte)
+        if racine:
+            texte = self._racine.sub(lambda m: f"({m.group(1)})**0.5", texte)
+
+        expression = texte
+        for pattern, repl in self._operateurs:
+            expression = pattern.sub(f" {repl} ", expression)
+        expression = expression.replace("  ", " ").strip()
+        if not re.fullmatch(r"[\d\s.+\-*/%()]+", expression) or not re.search(r"\d\s*(\*\*|[+\-*/%])\s*[\d(]|\*\*\d", expression):
+            return None
+
+        try:
+            resultat = self.evaluer(expression)
+        except ZeroDivisionError:
+            return "Division par zéro impossible."
+        except (SyntaxError, ValueError, OverflowError):
+            return None
+
+        if pourcentage or racine:
+            return f"Le résultat est {format_number(resultat)}."
+        enonce = self._prefixe.sub("", commande.lower().strip(" ?!."))
+        return f"{enonce} font {format_number(resultat)}."
+
+
+class CompetenceConversion(Competence):
+    """Conversion d'unités : "convertis 10 kilomètres en miles" """
+    nom = "conversion"
+    mots_cles = [" en ", " vers ", "convert"]
+
+    # unité -> (grandeur, facteur vers l'unité de base)
+    UNITES = {
+        "mètre": ("longueur", 1.0), "m": ("longueur", 1.0), "kilomètre": ("longueur", 1000.0),
+        "km": ("longueur", 1000.0), "centimètre": ("longueur", 0.01), "cm": ("longueur", 0.01),
+        "millimètre": ("longueur", 0.001), "mm": ("longueur", 0.001), "mile": ("longueur", 1609.344),
+        "pied": ("longueur", 0.3048), "pouce": ("longueur", 0.0254), "yard": ("longueur", 0.9144),
+        "gramme": ("masse", 1.0), "g": ("masse", 1.0), "kilogramme": ("masse", 1000.0), "kilo": ("masse", 1000.0),
+        "kg": ("masse", 1000.0), "milligramme": ("masse", 0.001), "tonne": ("masse", 1e6),
+        "livre": ("masse", 453.59237), "once": ("masse", 28.349523125),
+        "litre": ("volume", 1.0), "l": ("volume", 1.0), "millilitre": ("volume", 0.001), "ml": ("volume", 0.001),
+        "centilitre": ("volume", 0.01), "cl": ("volume", 0.01), "gallon": ("volume", 3.785411784),
+        "seconde": ("durée", 1.0), "minute": ("durée", 60.0), "heure": ("durée", 3600.0), "jour": ("durée", 86400.0),
+        "semaine": ("durée", 604800.0),
+        "octet": ("données", 1.0), "kilooctet": ("données", 1e3), "ko": ("données", 1e3),
+        "mégaoctet": ("données", 1e6), "mo": ("données", 1e6), "gigaoctet": ("données", 1e9), "go": ("données", 1e9),
+        "km/h": ("vitesse", 1 / 3.6), "kilomètre heure": ("vitesse", 1 / 3.6), "m/s": ("vitesse", 1.0),
+        "mètre par seconde": ("vitesse", 1.0), "mile par heure": ("vitesse", 0.44704), "mph": ("vitesse", 0.44704),
+    }
+    TEMPERATURES = {"celsius": "C", "degré": "C", "degrés celsius": "C", "fahrenheit": "F", "kelvin": "K"}
+
+    def __init__(self):
+        unites = sorted(list(self.UNITES) + list(self.TEMPERATURES), key=len, reverse=True)
+        unite = "|".join(re.escape(u) + r"s?" for u in unites)
+        self._pattern = re.compile(
+            rf"(-?[\d.]+)\s*(?:degrés?\s+)?({unite})\s+(?:en|vers)\s+(?:degrés?\s+)?({unite})(?![a-zé])")
+
+    def _unite(self, texte):
+        texte = texte.strip()
+        for candidate in (texte, texte[:-1] if texte.endswith("s") else texte, texte.replace("s ", " ")):
+            if candidate in self.UNITES or candidate in self.TEMPERATURES:
+                return candidate
+        return None
+
+    @staticmethod
+    def _temperature(valeur, source, cible):
+        celsius = {"C": valeur, "F": (valeur - 32) * 5 / 9, "K": valeur - 273.15}[source]
+        return {"C": celsius, "F": celsius * 9 / 5 + 32, "K": celsius + 273.15}[cible]
+
+    def repondre(self, commande):
+        texte = re.sub(r"(\d),(\d)", r"\1.\2", commande.lower())
+        match = self._pattern.search(texte)
+        if not match:
+            return None
+        try:
+            valeur = float(match.group(1))
+        except ValueError:
+            return None
+        source, cible = self._unite(match.group(2)), self._unite(match.group(3))
+        if not source or not cible:
+            return None
+
+        if source in self.TEMPERATURES or cible in self.TEMPERATURES:
+            if not (source in self.TEMPERATURES and cible in self.TEMPERATURES):
+                return None
+            resultat = self._temperature(valeur, self.TEMPERATURES[source], self.TEMPERATURES[cible])
+        else:
+            (grandeur_source, facteur_source), (grandeur_cible, facteur_cible) = self.UNITES[source], self.UNITES[cible]
+            if grandeur_source != grandeur_cible:
+                return f"Impossible de convertir des {match.group(2)} en {match.group(3)}."
+            resultat = valeur * facteur_source / facteur_cible
+
+        degres = "degrés " if source in self.TEMPERATURES and source != "degré" else ""
+        return (f"{format_number(valeur)} {degres}{match.group(2)} font "
+                f"{format_number(round(resultat, 4))} {degres}{match.group(3)}.")
+
+
+class MoteurCompetences:
+    """Compétences locales consultées avant le LLM"""
+
+    def __init__(self, competences=None):
+        self.competences = {}
+        self.automate = AutomateMotsCles()
+        for competence in competences if competences is not None else \
+                [CompetenceHeure(), CompetenceDate(), CompetenceConversion(), CompetenceCalcul()]:
+            self.competences[competence.nom] = competence
+        self._compiler()
+
+    def _compiler(self):
+        self.automate.build({nom: competence.mots_cles for nom, competence in self.competences.items()})
+
+    def ajouter(self, competence):
+        """Ajoute (ou remplace) une compétence et recompile l'automate"""
+        self.competences[competence.nom] = competence
+        self._compiler()
+
+    def repondre(self, commande):
+        """(nom de la compétence, réponse) de la première compétence qui sait répondre, ou None"""
+        for nom in self.automate.match(commande):
+            reponse = self.competences[nom].repondre(commande)
+            if reponse:
+                return nom, reponse
+        return None
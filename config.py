@@ -1,10 +1,18 @@
 # Configuration de l'Assistant Vocal PC
 # Modifiez ces paramètres selon vos besoins
 
+import sys
+
 # Configuration Ollama
 OLLAMA_URL = "http://127.0.0.1:11434"
 MODEL_NAME = "mistral:instruct"
 TIMEOUT_API = 30  # Timeout en secondes pour les requêtes API
+CONNECT_TIMEOUT_API = 3  # Timeout de connexion TCP en secondes
+POOL_SIZE_API = 4  # Connexions HTTP gardées ouvertes vers Ollama (keep-alive)
+KEEP_ALIVE_MODELE = "30m"  # Durée pendant laquelle Ollama garde le modèle chargé
+MODELE_EMBEDDINGS = "nomic-embed-text"  # Modèle d'embeddings pour la recherche sémantique d'applications
+SEUIL_CORRESPONDANCE_APP = 0.7  # Confiance locale minimale pour ouvrir une application sans consulter l'IA
+SEUIL_SIMILARITE_SEMANTIQUE = 0.6  # Similarité cosinus minimale pour ouvrir l'application trouvée par embeddings
 
 # Configuration reconnaissance vocale
 LANGUAGE = "fr-FR"  # Langue pour la reconnaissance vocale
@@ -15,11 +23,25 @@ PHRASE_TIME_LIMIT = 10  # Limite de temps pour une phrase
 TTS_RATE = 180  # Vitesse de parole (mots par minute)
 TTS_VOLUME = 0.9  # Volume (0.0 à 1.0)
 PREFER_FRENCH_VOICE = True  # Préférer une voix française si disponible
+MOTEUR_SYNTHESE = "sapi" if sys.platform == "win32" else "stub"  # Processus de synthèse persistant : "sapi" (Windows) ou "stub" (tests sans audio)
+SORTIE_AUDIO = "winsound"  # Lecture des sons en mémoire : "winsound" (Windows), "sounddevice" (flux PortAudio) ou "nulle" (sans son)
+TAILLE_CACHE_AUDIO = 50 * 1024 * 1024  # Taille maximale sur disque du cache audio des phrases fixes (octets)
+INTERRUPTION_VOCALE = True  # Parler pendant une réponse l'interrompt (barge-in)
+FACTEUR_INTERRUPTION = 3.0  # Énergie nécessaire pour interrompre, en multiple du seuil du micro (écho des haut-parleurs)
 
 # Configuration microphone
 ADJUST_FOR_NOISE = True  # Ajustement automatique du bruit ambiant
 NOISE_ADJUSTMENT_DURATION = 1  # Durée d'ajustement en secondes
 
+# Détection locale du mot de réveil (modèles enregistrés avec : python mot_reveil.py enregistrer)
+SEUIL_MOT_REVEIL = None  # None : seuil calibré sur les distances entre modèles
+
+# Fin de phrase adaptative : silence exigé entre SILENCE_FIN_MIN (commande courte) et SILENCE_FIN_MAX (longue question)
+SILENCE_FIN_MIN = 0.3
+SILENCE_FIN_MAX = 1.2
+FIN_ANTICIPEE = True  # Transcrire pendant les pauses et conclure dès qu'une commande est complète
+DUREE_TAMPON_MICRO = 30  # Secondes gardées dans le tampon circulaire du micro (ouvert une seule fois)
+
 # Mots de réveil acceptés (en minuscules)
 WAKE_WORDS = ["assistant", "assistante", "hey assistant"]
 
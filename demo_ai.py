@@ -22,7 +22,7 @@ def demo_ai_assistant():
     assistant = AssistantVocal()
     
     # Désactiver TTS pour la démo
-    def mock_speak(text):
+    def mock_speak(text, wait=True):
         print(f"🔊 [Assistant]: {text}")
     
     assistant.speak = mock_speak
@@ -73,10 +73,10 @@ def demo_ai_assistant():
     
     for cmd in ambiguous_commands:
         print(f"\n📝 Commande: '{cmd}'")
-        analysis = assistant.ai_analyze_command(cmd)
+        analysis = assistant.ai_parse_intent(cmd)
         print(f"   🤖 Analyse IA: {analysis}")
         
-        if "ACTION" in analysis:
+        if analysis and analysis["intention"] != "question":
             print(f"   ✅ L'IA identifie une action à exécuter")
         else:
             print(f"   ❓ L'IA identifie une question")
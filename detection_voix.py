@@ -0,0 +1,101 @@
+"""
+Détection d'activité vocale (VAD)
+=================================
+
+Les boucles d'écoute envoyaient à la reconnaissance chaque phrase captée par
+recognizer.listen, y compris le souffle d'un ventilateur ou un claquement qui
+avait dépassé le seuil d'énergie : une requête réseau (et souvent un
+"je n'ai pas compris") pour rien. Ici chaque segment est d'abord analysé
+localement par trames de 20 ms, en NumPy vectorisé :
+
+- énergie RMS, comparée au bruit de fond du segment (10e centile)
+- taux de passage par zéro : élimine le ronflement grave (secteur, moteur)
+- platitude spectrale (optionnelle) : le bruit est plat, la parole a des
+  formants ou une bande de fricative
+
+Un segment est de la parole s'il contient au moins MIN_SPEECH_SECONDS de
+trames qui passent les trois tests ; sinon la reconnaissance est évitée.
+
+    from detection_voix import DetecteurActiviteVocale
+
+    vad = DetecteurActiviteVocale()
+    if vad.is_speech(audio.frame_data, audio.sample_rate, audio.sample_width):
+        texte = recognizer.recognize_google(audio)
+"""
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+VAD_FRAME_SECONDS = 0.02
+VAD_ENERGY_RATIO = getattr(config, "RATIO_ENERGIE_VAD", 2.5)  # x bruit de fond du segment
+VAD_MIN_ZCR = 0.02  # Sous ce taux de passage par zéro : ronflement grave, pas de la voix
+VAD_MAX_FLATNESS = 0.3  # Au-dessus : spectre plat de bruit
+VAD_MAX_ZCR_WITHOUT_FLATNESS = 0.45  # Sans platitude : le souffle a un taux de passage par zéro élevé
+MIN_SPEECH_SECONDS = getattr(config, "DUREE_MIN_PAROLE", 0.1)
+
+
+def pcm_to_float(pcm, sample_width=2):
+    """Échantillons float dans [-1, 1] d'un PCM 8 (non signé), 16 ou 32 bits"""
+    if sample_width == 1:
+        return (np.frombuffer(pcm, dtype=np.uint8).astype(np.float32) - 128) / 128
+    dtype = {2: "<i2", 4: "<i4"}[sample_width]
+    return np.frombuffer(pcm, dtype=dtype).astype(np.float32) / float(1 << (8 * sample_width - 1))
+
+
+def frame_features(samples, sample_rate, frame_seconds=VAD_FRAME_SECONDS, flatness=True):
+    """(rms, zcr, platitude) par trame ; platitude vaut None si flatness=False"""
+    frame_length = int(frame_seconds * sample_rate)
+    count = len(samples) // frame_length
+    frames = np.asarray(samples[:count * frame_length], dtype=np.float32).reshape(count, frame_length)
+    rms = np.sqrt((frames * frames).mean(axis=1))
+    signs = np.signbit(frames)
+    zcr = (signs[:, 1:] != signs[:, :-1]).mean(axis=1)
+    if not flatness:
+        return rms, zcr, None
+    power = np.abs(np.fft.rfft(frames * np.hanning(frame_length), axis=1)) ** 2 + 1e-12
+    spectral_flatness = np.exp(np.log(power).mean(axis=1)) / power.mean(axis=1)
+    return rms, zcr, spectral_flatness
+
+
+class DetecteurActiviteVocale:
+    """Décide si un segment audio contient de la parole, et compte les reconnaissances évitées"""
+
+    def __init__(self, energy_ratio=VAD_ENERGY_RATIO, min_speech=MIN_SPEECH_SECONDS, use_flatness=True):
+        self.energy_ratio = energy_ratio
+        self.min_speech = min_speech
+        self.use_flatness = use_flatness
+        self.stats = {"segments": 0, "rejetes": 0}
+
+    def speech_frames(self, samples, sample_rate):
+        """Masque booléen des trames de parole"""
+        rms, zcr, flatness = frame_features(samples, sample_rate, flatness=self.use_flatness)
+        if not len(rms):
+            return np.zeros(0, dtype=bool)
+        noise_floor = max(np.percentile(rms, 10), 1e-4)
+        speech = (rms > noise_floor * self.energy_ratio) & (zcr > VAD_MIN_ZCR)
+        if flatness is not None:
+            speech &= flatness < VAD_MAX_FLATNESS
+        else:
+            speech &= zcr < VAD_MAX_ZCR_WITHOUT_FLATNESS
+        return speech
+
+    def speech_seconds(self, samples, sample_rate):
+        return self.speech_frames(samples, sample_rate).sum() * VAD_FRAME_SECONDS
+
+    def is_speech(self, pcm, sample_rate, sample_width=2):
+        """True si le segment PCM contient assez de parole pour mériter une reconnaissance"""
+        samples = pcm_to_float(pcm, sample_width) if isinstance(pcm, (bytes, bytearray, memoryview)) else pcm
+        speech = self.speech_seconds(samples, sample_rate) >= self.min_speech
+        self.stats["segments"] += 1
+        if not speech:
+            self.stats["rejetes"] += 1
+        return speech
+
+    def print_stats(self):
+        segments, rejected = self.stats["segments"], self.stats["rejetes"]
+        rate = rejected / segments * 100 if segments else 0
+        print(f"🔇 Détection de voix: {rejected}/{segments} segments sans parole ({rate:.0f}%) - reconnaissances évitées")
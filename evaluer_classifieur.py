@@ -0,0 +1,77 @@
+"""
+Évaluation du classifieur d'intentions
+======================================
+
+Validation croisée (k plis) sur le corpus livré et le journal des commandes :
+- exactitude globale et par intention, matrice de confusion
+- couverture au seuil de confiance : part des commandes décidées localement
+  (sans appel au LLM) et exactitude sur cette part
+- latence d'une prédiction et durée d'entraînement
+
+Usage: python evaluer_classifieur.py [nombre_plis] [seuil]
+"""
+
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from classifieur_intentions import ClassifieurIntentions, INTENTS, MIN_PROBABILITY, load_examples
+
+
+def cross_validate(examples, folds, threshold):
+    random.Random(0).shuffle(examples)
+    confusion = np.zeros((len(INTENTS), len(INTENTS)), dtype=int)
+    confident = confident_correct = 0
+    latencies, fit_times = [], []
+
+    for fold in range(folds):
+        train = [example for i, example in enumerate(examples) if i % folds != fold]
+        test = [example for i, example in enumerate(examples) if i % folds == fold]
+
+        start = time.perf_counter()
+        classifier = ClassifieurIntentions().fit(train)
+        fit_times.append((time.perf_counter() - start) * 1000)
+
+        for text, expected in test:
+            start = time.perf_counter()
+            predicted, probability = classifier.predict(text)
+            latencies.append((time.perf_counter() - start) * 1e6)
+            confusion[INTENTS.index(expected), INTENTS.index(predicted)] += 1
+            if probability >= threshold:
+                confident += 1
+                confident_correct += predicted == expected
+
+    return confusion, confident, confident_correct, latencies, fit_times
+
+
+def main():
+    folds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else MIN_PROBABILITY
+    examples = load_examples()
+    print(f"📊 {len(examples)} énoncés, validation croisée à {folds} plis, seuil {threshold}\n")
+
+    confusion, confident, confident_correct, latencies, fit_times = cross_validate(examples, folds, threshold)
+    total = confusion.sum()
+    print(f"Exactitude globale: {np.trace(confusion) / total * 100:.1f}% ({np.trace(confusion)}/{total})")
+    for i, intent in enumerate(INTENTS):
+        print(f"   {intent:<20} {confusion[i, i] / max(confusion[i].sum(), 1) * 100:5.1f}% "
+              f"de {confusion[i].sum()} énoncés")
+
+    print("\nMatrice de confusion (lignes: attendue, colonnes: prédite)")
+    print(" " * 22 + " ".join(f"{intent[:8]:>8}" for intent in INTENTS))
+    for i, intent in enumerate(INTENTS):
+        print(f"   {intent:<19}" + " ".join(f"{count:>8}" for count in confusion[i]))
+
+    print(f"\nDécidées localement (probabilité ≥ {threshold}): {confident / total * 100:.1f}% des commandes, "
+          f"exactitude {confident_correct / max(confident, 1) * 100:.1f}%")
+    print(f"LLM consulté pour: {(total - confident) / total * 100:.1f}% des commandes")
+    print(f"\nLatence de prédiction: moyenne {statistics.mean(latencies):.0f} µs, "
+          f"p95 {sorted(latencies)[int(len(latencies) * 0.95)]:.0f} µs")
+    print(f"Entraînement: {statistics.mean(fit_times):.0f} ms par pli")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+File d'attente de parole asynchrone
+===================================
+
+speak() était entièrement synchrone : "Compris ! Je traite votre demande",
+puis "Action détectée", puis le résultat... et l'appel au LLM ou le lancement
+de l'application ne commençait qu'une fois ces confirmations prononcées.
+
+Ici les phrases sont déposées dans une file et prononcées dans l'ordre par un
+thread lecteur ; l'appelant continue son traitement pendant ce temps.
+
+    from file_parole import FileParole
+
+    parole = FileParole(prononcer)        # prononcer(texte) -> bool, bloquant
+    parole.put("Compris !")               # retour immédiat
+    ...                                   # traitement en parallèle
+    parole.wait()                         # avant de réécouter le micro
+    parole.flush()                        # abandonne les phrases en attente
+"""
+
+import queue
+import threading
+
+
+class Enonce:
+    """Phrase déposée dans la file ; done est signalé une fois prononcée (ou abandonnée)"""
+
+    def __init__(self, text):
+        self.text = text
+        self.result = None
+        self.done = threading.Event()
+
+    def wait(self, timeout=None):
+        """Attend la fin de la phrase et retourne le résultat de la synthèse"""
+        self.done.wait(timeout)
+        return self.result
+
+
+class FileParole:
+    """Prononce les phrases déposées, dans l'ordre, depuis un thread dédié"""
+
+    def __init__(self, speak_fn):
+        self.speak_fn = speak_fn
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, text):
+        """Dépose une phrase et retourne immédiatement son Enonce"""
+        enonce = Enonce(text)
+        self._queue.put(enonce)
+        return enonce
+
+    def _run(self):
+        while True:
+            enonce = self._queue.get()
+            try:
+                if enonce is None:
+                    return
+                enonce.result = self.speak_fn(enonce.text)
+            except Exception as e:
+                print(f"⚠️ Erreur de synthèse en arrière-plan: {e}")
+                enonce.result = False
+            finally:
+                if enonce is not None:
+                    enonce.done.set()
+                self._queue.task_done()
+
+    def pending(self):
+        """Nombre de phrases pas encore terminées (en attente ou en cours)"""
+        return self._queue.unfinished_tasks
+
+    def wait(self):
+        """Bloque jusqu'à ce que toutes les phrases déposées soient prononcées"""
+        self._queue.join()
+
+    def flush(self):
+        """Abandonne les phrases en attente (la phrase en cours se termine) ; retourne leur nombre"""
+        dropped = 0
+        while True:
+            try:
+                enonce = self._queue.get_nowait()
+            except queue.Empty:
+                return dropped
+            self._queue.task_done()
+            if enonce is None:  # close() déjà demandé : le conserver
+                self._queue.put(None)
+                return dropped
+            enonce.result = False
+            enonce.done.set()
+            dropped += 1
+
+    def close(self):
+        """Termine le thread lecteur après les phrases déjà déposées"""
+        self._queue.put(None)
+        self._thread.join()
@@ -0,0 +1,184 @@
+"""
+Détection adaptative de fin de phrase
+=====================================
+
+recognizer.listen attendait pause_threshold = 1.5 s de silence avant de
+rendre la main : chaque commande, même "ouvre chrome", coûtait une seconde
+et demie d'attente avant même la reconnaissance. Ici la fin de phrase est
+décidée trame par trame (20 ms) :
+
+- probabilité de parole : décision de detection_voix par trame (énergie
+  contre bruit de fond, passage par zéro, platitude), lissée ; le bruit de
+  fond n'est mis à jour qu'en dehors de la parole
+- silence exigé adaptatif : MIN_SILENCE après une phrase courte, puis
+  SILENCE_PER_SPEECH_SECOND de plus par seconde de parole, plafonné à
+  MAX_SILENCE
+  (une longue question n'est pas coupée à la première hésitation)
+- fin anticipée : dès EARLY_COMMIT_PAUSE de pause, la phrase captée jusque-là
+  est transcrite en arrière-plan ; si la transcription est déjà une commande
+  complète ("ouvre chrome"), la phrase est terminée sans attendre le reste
+  du silence. Sinon la transcription resservira si aucune parole ne suit.
+
+    from fin_de_phrase import DetecteurFinDePhrase
+
+    fin = DetecteurFinDePhrase(16000, transcribe=reconnaitre, is_complete=est_complete)
+    while not fin.feed(stream.read(1024)):
+        pass
+    pcm, texte = fin.result()              # texte : transcription déjà faite, ou None
+"""
+
+import threading
+from collections import deque
+
+import numpy as np
+
+from detection_voix import (VAD_ENERGY_RATIO, VAD_FRAME_SECONDS, VAD_MAX_FLATNESS, VAD_MIN_ZCR,
+                            frame_features, pcm_to_float)
+
+try:
+    import config
+except ImportError:
+    config = None
+
+MIN_SILENCE = getattr(config, "SILENCE_FIN_MIN", 0.3)  # Silence exigé après une commande courte
+MAX_SILENCE = getattr(config, "SILENCE_FIN_MAX", 1.2)  # Plafond après une longue question
+SILENCE_PER_SPEECH_SECOND = 0.15
+EARLY_COMMIT_PAUSE = 0.15  # Pause avant la transcription anticipée
+EARLY_COMMIT_ENABLED = getattr(config, "FIN_ANTICIPEE", True)
+PROBABILITY_SMOOTHING = 0.35  # Poids de la dernière trame dans la probabilité lissée
+START_PROBABILITY = 0.6
+SILENCE_PROBABILITY = 0.3
+NOISE_HISTORY_SECONDS = 3.0
+PREROLL_SECONDS = 0.3  # Audio gardé avant le début de la parole
+
+
+class DetecteurFinDePhrase:
+    """Découpe une phrase dans un flux PCM et décide le plus tôt possible qu'elle est finie"""
+
+    def __init__(self, sample_rate=16000, sample_width=2, transcribe=None, is_complete=None,
+                 min_silence=MIN_SILENCE, max_silence=MAX_SILENCE, max_seconds=None, history=None):
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.transcribe = transcribe if EARLY_COMMIT_ENABLED else None
+        self.is_complete = is_complete
+        self.min_silence = min_silence
+        self.max_silence = max_silence
+        self.max_seconds = max_seconds
+        self.frame_bytes = int(VAD_FRAME_SECONDS * sample_rate) * sample_width
+        self.reset()
+        if history:
+            # Audio qui précède l'écoute (tampon du micro) : bruit de fond connu dès la première trame
+            rms, _, _ = frame_features(pcm_to_float(history, sample_width), sample_rate, flatness=False)
+            self._noise.extend(rms)
+
+    def reset(self):
+        self._pending = b""
+        self._preroll = deque(maxlen=int(PREROLL_SECONDS / VAD_FRAME_SECONDS))
+        self._noise = deque(maxlen=int(NOISE_HISTORY_SECONDS / VAD_FRAME_SECONDS))
+        self.audio = bytearray()
+        self.probability = 0.0
+        self.started = False
+        self.ended = False
+        self.reason = None
+        self.speech_seconds = 0.0
+        self.silence_seconds = 0.0
+        self._speech_frames = 0
+        self._speculation = None  # (trames de parole transcrites, thread, résultat)
+
+    @property
+    def required_silence(self):
+        """Silence exigé pour conclure, selon la longueur de la phrase"""
+        return min(self.max_silence, self.min_silence + SILENCE_PER_SPEECH_SECOND * self.speech_seconds)
+
+    def _frame_is_speech(self, rms, zcr, flatness):
+        noise_floor = max(np.percentile(self._noise, 10), 1e-4) if self._noise else 1e-4
+        return rms > noise_floor * VAD_ENERGY_RATIO and zcr > VAD_MIN_ZCR and flatness < VAD_MAX_FLATNESS
+
+    def feed(self, chunk):
+        """Ajoute des octets PCM ; True quand la phrase est terminée (voir reason)"""
+        if self.ended:
+            return True
+        data = self._pending + bytes(chunk)
+        usable = len(data) - len(data) % self.frame_bytes
+        self._pending = data[usable:]
+        if not usable:
+            return False
+
+        rms, zcr, flatness = frame_features(pcm_to_float(data[:usable], self.sample_width), self.sample_rate)
+        for index in range(len(rms)):
+            frame = data[index * self.frame_bytes:(index + 1) * self.frame_bytes]
+            speech = self._frame_is_speech(rms[index], zcr[index], flatness[index])
+            self.probability += PROBABILITY_SMOOTHING * (speech - self.probability)
+            if not self.started:
+                self._noise.append(rms[index])
+                self._preroll.append(frame)
+                if self.probability >= START_PROBABILITY:
+                    self.started = True
+                    self.audio.extend(b"".join(self._preroll))
+                continue
+
+            self.audio.extend(frame)
+            if speech and self.probability >= START_PROBABILITY:
+                # Parole (ou reprise après une pause : une trame isolée ne suffit pas)
+                self.speech_seconds += VAD_FRAME_SECONDS + self.silence_seconds
+                self._speech_frames += 1
+                self.silence_seconds = 0.0
+            elif self.silence_seconds or self.probability <= SILENCE_PROBABILITY:
+                self._noise.append(rms[index])
+                self.silence_seconds += VAD_FRAME_SECONDS
+                if self.silence_seconds >= EARLY_COMMIT_PAUSE:
+                    self._speculate()
+            if self._finished():
+                self.ended = True
+                return True
+        return False
+
+    def _finished(self):
+        if self.silence_seconds >= self.required_silence:
+            self.reason = "silence"
+            return True
+        if self.max_seconds and len(self.audio) >= self.max_seconds * self.sample_rate * self.sample_width:
+            self.reason = "durée max"
+            return True
+        if self._speculation_result("complete"):
+            self.reason = "commande complète"
+            return True
+        return False
+
+    def _speculate(self):
+        """Transcrit en arrière-plan la phrase captée jusqu'à cette pause (une requête à la fois)"""
+        if not self.transcribe:
+            return
+        if self._speculation:
+            frames, thread, _ = self._speculation
+            if frames == self._speech_frames or thread.is_alive():
+                return
+        result = {}
+        pcm = bytes(self.audio)
+
+        def _run():
+            try:
+                text = self.transcribe(pcm)
+            except Exception:
+                text = None
+            result["complete"] = bool(text and self.is_complete and self.is_complete(text))
+            result["texte"] = text
+
+        thread = threading.Thread(target=_run, daemon=True)
+        self._speculation = (self._speech_frames, thread, result)
+        thread.start()
+
+    def _speculation_result(self, field, wait=False):
+        """Champ de la transcription anticipée, si elle couvre toute la parole captée"""
+        if not self._speculation:
+            return None
+        frames, thread, result = self._speculation
+        if frames != self._speech_frames:
+            return None  # La parole a repris depuis
+        if wait:
+            thread.join()
+        return result.get(field)
+
+    def result(self):
+        """(PCM de la phrase, transcription déjà faite ou None)"""
+        return bytes(self.audio), self._speculation_result("texte", wait=True)
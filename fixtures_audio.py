@@ -0,0 +1,151 @@
+"""
+Voix de synthèse pour les fixtures audio
+========================================
+
+Les tests du mot de réveil, de la détection d'activité vocale et de la fin
+de phrase ont besoin de WAV de parole reproductibles, sans micro ni moteur
+de synthèse installé. Ce module fabrique des mots à partir de phonèmes
+approchés :
+- voyelles : harmoniques d'une fondamentale filtrées par trois formants
+- fricatives : bruit blanc limité à une bande de fréquences
+- occlusives : silence puis bruit bref
+- nasales / liquides : voisement grave et peu d'énergie
+
+Chaque locuteur (graine) a sa fondamentale, son débit et un léger décalage
+des formants : deux "assistant" diffèrent autant que deux vraies voix se
+ressemblent, ce qui suffit à tester le traitement du signal.
+
+    from fixtures_audio import synthesize_word, write_wav
+
+    samples = synthesize_word("a s i s t an", seed=3)
+    write_wav("assistant_3.wav", samples)
+"""
+
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# Voyelles : formants F1, F2, F3 (Hz)
+VOWELS = {
+    "a": (800, 1250, 2600), "e": (400, 2000, 2600), "è": (550, 1800, 2500),
+    "i": (300, 2300, 3000), "o": (450, 800, 2600), "u": (300, 750, 2300),
+    "y": (300, 1800, 2200), "eu": (400, 1500, 2400),
+    "an": (650, 1050, 2600), "on": (450, 800, 2500), "in": (600, 1600, 2600),
+}
+NASAL_VOWELS = {"an", "on", "in"}
+# Fricatives : bande de bruit (Hz) et voisement
+FRICATIVES = {"s": (4000, 7500, False), "ch": (2000, 5000, False), "f": (1500, 7000, False),
+              "z": (4000, 7500, True), "j": (2000, 5000, True), "v": (1500, 7000, True)}
+PLOSIVES = {"p": (500, 2000), "t": (3000, 6000), "k": (1500, 3500),
+            "b": (300, 1500), "d": (2500, 5000), "g": (1000, 3000)}
+SONORANTS = {"m": (250, 1000, 2200), "n": (250, 1500, 2500), "l": (400, 1200, 2600), "r": (500, 1300, 2300)}
+
+DURATIONS = {"voyelle": 0.11, "fricative": 0.09, "occlusive": 0.06, "sonore": 0.07}
+
+
+def _band_noise(rng, n, low, high):
+    spectrum = np.fft.rfft(rng.standard_normal(n))
+    freqs = np.fft.rfftfreq(n, 1 / SAMPLE_RATE)
+    spectrum[(freqs < low) | (freqs > high)] = 0
+    noise = np.fft.irfft(spectrum, n)
+    return noise / (np.abs(noise).max() + 1e-9)
+
+
+def _voiced(n, f0, formants, start_phase=0.0, nasal=False):
+    t = np.arange(n) / SAMPLE_RATE
+    signal = np.zeros(n)
+    for harmonic in range(1, int(4000 / f0)):
+        freq = harmonic * f0
+        gain = sum(np.exp(-((freq - formant) / (60 + formant * 0.08)) ** 2) / (k + 1)
+                   for k, formant in enumerate(formants))
+        if nasal:
+            gain += 0.8 * np.exp(-((freq - 250) / 80) ** 2)
+        signal += gain * np.sin(2 * np.pi * freq * t + start_phase * harmonic)
+    return signal / (np.abs(signal).max() + 1e-9)
+
+
+def _envelope(n, fade):
+    envelope = np.ones(n)
+    fade = min(fade, n // 2)
+    if fade:
+        ramp = np.linspace(0, 1, fade)
+        envelope[:fade] = ramp
+        envelope[-fade:] = ramp[::-1]
+    return envelope
+
+
+def synthesize_word(phonemes, seed=0, speed=None, f0=None, amplitude=0.5):
+    """Échantillons float d'un mot décrit par des phonèmes séparés par des espaces"""
+    rng = np.random.default_rng(seed)
+    speed = speed or rng.uniform(0.85, 1.2)
+    f0 = f0 or rng.uniform(100, 220)
+    shift = rng.uniform(0.95, 1.05)
+    fade = int(0.01 * SAMPLE_RATE)
+    parts = []
+    for phoneme in phonemes.split():
+        if phoneme in VOWELS:
+            n = int(DURATIONS["voyelle"] * SAMPLE_RATE / speed)
+            segment = _voiced(n, f0, [f * shift for f in VOWELS[phoneme]], nasal=phoneme in NASAL_VOWELS)
+        elif phoneme in FRICATIVES:
+            low, high, voiced = FRICATIVES[phoneme]
+            n = int(DURATIONS["fricative"] * SAMPLE_RATE / speed)
+            segment = 0.5 * _band_noise(rng, n, low, high)
+            if voiced:
+                segment += 0.3 * _voiced(n, f0, (250, 1500, 2500))
+        elif phoneme in PLOSIVES:
+            low, high = PLOSIVES[phoneme]
+            n = int(DURATIONS["occlusive"] * SAMPLE_RATE / speed)
+            closure = n * 2 // 3
+            segment = np.zeros(n)
+            segment[closure:] = 0.7 * _band_noise(rng, n - closure, low, high)
+        elif phoneme in SONORANTS:
+            n = int(DURATIONS["sonore"] * SAMPLE_RATE / speed)
+            segment = 0.4 * _voiced(n, f0, [f * shift for f in SONORANTS[phoneme]])
+        else:
+            raise ValueError(f"Phonème inconnu: {phoneme}")
+        parts.append(segment * _envelope(n, fade))
+    return amplitude * np.concatenate(parts)
+
+
+def background_noise(seconds, level=0.01, seed=0):
+    """Bruit de fond (souffle + ronflement de ventilateur à 120 Hz)"""
+    rng = np.random.default_rng(seed + 10_000)
+    n = int(seconds * SAMPLE_RATE)
+    hum = np.sin(2 * np.pi * 120 * np.arange(n) / SAMPLE_RATE)
+    return level * (rng.standard_normal(n) + 0.5 * hum)
+
+
+def utterance(words, seed=0, pause=0.25, lead=0.5, tail=0.8, noise=0.01):
+    """Phrase complète : mots séparés par des pauses, avec silence bruité avant et après
+
+    Retourne (échantillons, [(début, fin) en secondes de chaque mot]).
+    """
+    rng = np.random.default_rng(seed)
+    pieces = [np.zeros(int(lead * SAMPLE_RATE))]
+    bounds = []
+    position = lead
+    for index, phonemes in enumerate(words):
+        word = synthesize_word(phonemes, seed=seed * 100 + index, speed=rng.uniform(0.9, 1.1))
+        bounds.append((position, position + len(word) / SAMPLE_RATE))
+        pieces.append(word)
+        position += len(word) / SAMPLE_RATE
+        if index < len(words) - 1:
+            pieces.append(np.zeros(int(pause * SAMPLE_RATE)))
+            position += pause
+    pieces.append(np.zeros(int(tail * SAMPLE_RATE)))
+    samples = np.concatenate(pieces)
+    return samples + background_noise(len(samples) / SAMPLE_RATE, noise, seed), bounds
+
+
+def to_pcm16(samples):
+    return (np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes()
+
+
+def write_wav(path, samples, sample_rate=SAMPLE_RATE):
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(to_pcm16(samples))
@@ -0,0 +1,513 @@
+"""
+Index du catalogue d'applications
+=================================
+
+Construit une seule fois au chargement des applications, cet index remplace
+les parcours linéaires de find_application (jusqu'à cinq passes sur tout le
+catalogue, avec des noms re-normalisés à chaque requête) par des recherches
+dans des dictionnaires :
+
+- commandes vocales exactes et tokens de commandes
+- noms et clés en minuscules
+- trigrammes de caractères pour les recherches « contient »
+- clés phonétiques françaises des noms et commandes (homophones de la
+  reconnaissance vocale : "spotifaille", "discorde", "vé elle cé")
+- TrigramMatcher : similarité de Jaccard sur les trigrammes des noms et des
+  commandes, calculée avec NumPy sur tout le catalogue, qui retourne les k
+  meilleures applications classées par score
+
+Les correspondances exactes sont départagées par l'ordre du catalogue. L'index
+se met à jour application par application quand le catalogue change.
+"""
+
+import itertools
+import json
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+from phonetique import phonetic_key, phonetic_variants
+
+# Mappings spécifiques pour les applications populaires (type -> mots-clés)
+SPECIFIC_MAPPINGS = {
+    "netflix": ["netflix", "4df9e0f8.netflix"],
+    "chrome": ["chrome", "google chrome"],
+    "firefox": ["firefox", "mozilla firefox"],
+    "word": ["word", "microsoft word", "winword"],
+    "excel": ["excel", "microsoft excel"],
+    "powerpoint": ["powerpoint", "microsoft powerpoint"],
+    "outlook": ["outlook", "microsoft outlook"],
+    "notepad": ["notepad", "bloc-notes", "bloc notes"],
+    "calculator": ["calc", "calculatrice"],
+    "paint": ["paint", "peinture"],
+    "skype": ["skype"],
+    "discord": ["discord"],
+    "spotify": ["spotify"],
+    "vlc": ["vlc", "vlc media player"],
+    "steam": ["steam"],
+    "adobe": ["adobe"],
+    "photoshop": ["photoshop"]
+}
+
+# Prompt de recherche d'application (candidats présélectionnés par l'index local)
+APP_SEARCH_PROMPT = """
+ANALYSE DIRECTE DE LA DEMANDE UTILISATEUR:
+
+PHRASE COMPLÈTE: "{original_query}"
+
+APPLICATIONS DISPONIBLES:
+{apps_list}
+
+INSTRUCTIONS PRÉCISES:
+1. Analyse la phrase complète de l'utilisateur
+2. Identifie EXACTEMENT quelle application il veut ouvrir
+3. EXEMPLES CONCRETS:
+   - "je veux que tu ouvres Netflix" → cherche "netflix" dans la liste → réponse: "4df9e0f8.netflix"
+   - "lance le navigateur" → cherche "chrome" ou "firefox" ou "edge" → réponse: "google chrome" ou "firefox"
+   - "je veux regarder un film" → cherche "netflix" ou "vlc" → réponse: "4df9e0f8.netflix" ou "vlc media player"
+   - "ouvre Word" → cherche "word" → réponse: "microsoft word"
+
+4. Réponds UNIQUEMENT avec la clé exacte de l'application (ce qui est entre parenthèses)
+5. Si aucune correspondance évidente, réponds "AUCUNE"
+6. Ne te laisse pas tromper par des mots parasites
+
+RÉPONSE (clé exacte uniquement):"""
+
+# Applications courantes toujours proposées au modèle, pour les demandes sans
+# nom d'application ("je veux regarder un film", "lance le navigateur")
+POPULAR_APP_KEYWORDS = ['netflix', 'chrome', 'firefox', 'microsoft edge', 'vlc', 'spotify', 'word', 'excel']
+
+# Mots trop courants pour une recherche « contient » sur les commandes
+EXCLUDED_WORDS = {'de', 'le', 'la', 'un', 'une', 'me', 'ai', 'et', 'ou', 'du'}
+
+# Mots vides et verbes de commande ignorés lors de la sélection de candidats
+STOPWORDS = {
+    "les", "des", "une", "pour", "avec", "dans", "sur", "par", "mon", "mes", "ton", "tes",
+    "son", "ses", "que", "qui", "quoi", "est", "moi", "toi", "veux", "voudrais", "aimerais",
+    "peux", "besoin", "faire", "fais", "app", "application", "applications", "logiciel",
+    "programme", "ouvre", "ouvres", "ouvrir", "lance", "lances", "lancer", "demarre",
+    "demarres", "demarrer", "execute", "executer", "ferme", "fermer", "quitte", "quitter",
+    "stp", "plait", "merci"
+}
+
+# Longueur minimale d'une clé phonétique (les clés plus courtes sont trop ambiguës)
+MIN_PHONETIC_KEY_LENGTH = 3
+
+
+def normalize(text):
+    """Minuscules, sans accents, ponctuation remplacée par des espaces"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.findall(r"[a-z0-9]+", text))
+
+
+def trigrams(text):
+    """Ensemble des trigrammes de caractères d'un texte"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def trigram_profile(text):
+    """Trigrammes du texte normalisé, avec bordures pour bien noter les mots courts"""
+    text = normalize(text)
+    return trigrams(f"  {text} ") if text else set()
+
+
+def load_catalog(path):
+    """Charge un fichier applications_assistant.json -> (applications, app_commands_map)"""
+    with open(path, "r", encoding="utf-8") as f:
+        scanned_apps = json.load(f)
+
+    applications = {}
+    app_commands_map = {}
+    for app_key, app_data in scanned_apps.items():
+        applications[app_key] = {
+            "nom": app_data["nom"],
+            "chemin": app_data["chemin"],
+            "processus": app_data["processus"]
+        }
+        for command in app_data.get("commandes", []):
+            app_commands_map[command.lower()] = app_key
+    return applications, app_commands_map
+
+
+def substrings(text, min_length=1, max_length=None):
+    """Toutes les sous-chaînes de text dont la longueur est dans [min_length, max_length]"""
+    max_length = min(max_length or len(text), len(text))
+    for length in range(max(min_length, 1), max_length + 1):
+        for start in range(len(text) - length + 1):
+            yield text[start:start + length]
+
+
+class TrigramMatcher:
+    """Recherche approchée par trigrammes, classée par similarité de Jaccard
+
+    Chaque texte indexé (nom, clé, commande vocale) est une ligne ; le score
+    d'une application est le meilleur score de ses lignes. Les listes de
+    lignes par trigramme sont combinées avec np.bincount, ce qui donne
+    l'intersection avec la requête pour tout le catalogue en une opération.
+    """
+
+    def __init__(self):
+        self._build()
+
+    def _build(self, rows=()):
+        """Structures de l'index, remplies avec les lignes (clé d'application, trigrammes)"""
+        self.vocabulary = {}   # trigramme -> identifiant
+        self.postings = []     # identifiant de trigramme -> lignes
+        self.row_app = []      # ligne -> identifiant d'application
+        self.row_size = []     # ligne -> nombre de trigrammes
+        self.row_alive = []    # ligne -> encore valide (suppression incrémentale)
+        self.app_ids = {}      # clé d'application -> identifiant
+        self.app_keys = []     # identifiant -> clé d'application
+        self.rows_by_app = defaultdict(list)
+        self.dead_rows = 0
+
+        self._posting_arrays = {}
+        self._row_arrays = None
+        for app_key, profile in rows:
+            self._add_profile(app_key, profile)
+
+    def add(self, app_key, texts):
+        """Indexe (ou ré-indexe) les textes d'une application"""
+        if app_key in self.rows_by_app:
+            self.remove(app_key)
+
+        for profile in {frozenset(trigram_profile(text)) for text in texts}:
+            if profile:
+                self._add_profile(app_key, profile)
+        self._row_arrays = None
+
+    def remove(self, app_key):
+        """Retire une application (ses lignes sont masquées, puis compactées)"""
+        for row in self.rows_by_app.pop(app_key, ()):
+            self.row_alive[row] = False
+            self.dead_rows += 1
+        self._row_arrays = None
+        if self.dead_rows > len(self.row_alive) // 2:
+            self._compact()
+
+    def _compact(self):
+        """Reconstruit l'index sans les lignes supprimées"""
+        live = [(self.app_keys[self.row_app[row]], row) for row, alive in enumerate(self.row_alive) if alive]
+        row_trigrams = defaultdict(list)
+        for trigram, trigram_id in self.vocabulary.items():
+            for row in self.postings[trigram_id]:
+                if self.row_alive[row]:
+                    row_trigrams[row].append(trigram)
+
+        self._build([(app_key, row_trigrams[row]) for app_key, row in live])
+
+    def _add_profile(self, app_key, profile):
+        """Ajoute une ligne (ensemble de trigrammes) pour une application"""
+        app_id = self.app_ids.get(app_key)
+        if app_id is None:
+            app_id = self.app_ids[app_key] = len(self.app_keys)
+            self.app_keys.append(app_key)
+        row = len(self.row_app)
+        self.row_app.append(app_id)
+        self.row_size.append(len(profile))
+        self.row_alive.append(True)
+        self.rows_by_app[app_key].append(row)
+        for trigram in profile:
+            trigram_id = self.vocabulary.setdefault(trigram, len(self.vocabulary))
+            if trigram_id == len(self.postings):
+                self.postings.append([])
+            self.postings[trigram_id].append(row)
+            self._posting_arrays.pop(trigram_id, None)
+
+    def _posting(self, trigram_id):
+        array = self._posting_arrays.get(trigram_id)
+        if array is None:
+            array = self._posting_arrays[trigram_id] = np.array(self.postings[trigram_id], dtype=np.int32)
+        return array
+
+    def _rows(self):
+        if self._row_arrays is None:
+            self._row_arrays = (
+                np.array(self.row_app, dtype=np.int32),
+                np.array(self.row_size, dtype=np.float32),
+                np.array(self.row_alive, dtype=bool)
+            )
+        return self._row_arrays
+
+    def top_k(self, text, k=5, min_score=0.0):
+        """Les k applications les plus proches de text -> [(clé, score)] par score décroissant"""
+        profile = trigram_profile(text)
+        trigram_ids = [self.vocabulary[t] for t in profile if t in self.vocabulary]
+        if not trigram_ids:
+            return []
+
+        row_app, row_size, row_alive = self._rows()
+        hits = np.concatenate([self._posting(trigram_id) for trigram_id in trigram_ids])
+        intersection = np.bincount(hits, minlength=len(row_size)).astype(np.float32)
+        scores = intersection / (len(profile) + row_size - intersection)
+        scores[~row_alive] = 0.0
+
+        app_scores = np.zeros(len(self.app_keys), dtype=np.float32)
+        np.maximum.at(app_scores, row_app, scores)
+
+        candidates = np.flatnonzero(app_scores > min_score)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-app_scores[candidates], k - 1)[:k]]
+        # Score décroissant, puis ordre d'insertion pour un classement stable
+        candidates = candidates[np.lexsort((candidates, -app_scores[candidates]))]
+        return [(self.app_keys[i], float(app_scores[i])) for i in candidates]
+
+
+class CatalogueIndex:
+    """Index inversé des applications, de leurs noms et de leurs commandes vocales"""
+
+    def __init__(self, applications, app_commands_map):
+        self.applications = applications
+        self.commands = app_commands_map
+
+        # Rang dans le catalogue : départage les correspondances comme l'ancien parcours
+        self.app_rank = {}
+        self.command_rank = {}
+        self._app_counter = itertools.count()      # Rangs jamais réutilisés après une suppression
+        self._command_counter = itertools.count()
+        self.commands_by_app = defaultdict(list)
+
+        self.keys = defaultdict(list)             # clé en minuscules -> clés
+        self.names = defaultdict(list)            # nom en minuscules -> clés
+        self.command_trigrams = defaultdict(set)  # trigramme de commande -> commandes
+        self.tokens = defaultdict(set)            # token normalisé (nom, clé, commande) -> clés
+        self.tokens_by_app = defaultdict(set)     # clé -> tokens (suppression sans parcourir tous les tokens)
+        self.phonetic = defaultdict(set)          # clé phonétique -> clés
+        self.phonetic_by_app = defaultdict(set)   # clé -> clés phonétiques
+        self.fuzzy = TrigramMatcher()
+
+        for command, app_key in app_commands_map.items():
+            self._index_command(command, app_key)
+        for app_key, app_data in applications.items():
+            self._index_application(app_key, app_data)
+
+        self.specific_matches = self._precompute_specific_mappings()
+
+    def _index_command(self, command, app_key):
+        if command not in self.command_rank:
+            self.command_rank[command] = next(self._command_counter)
+        self.commands_by_app[app_key].append(command)
+        for trigram in trigrams(command):
+            self.command_trigrams[trigram].add(command)
+        for token in normalize(command).split():  # Normalisés comme les mots de la requête (retrieve)
+            self.tokens[token].add(app_key)
+            self.tokens_by_app[app_key].add(token)
+
+    def _index_application(self, app_key, app_data):
+        key_lower = app_key.lower()
+        nom_lower = app_data["nom"].lower()
+
+        if app_key not in self.app_rank:  # Une application modifiée garde son rang
+            self.app_rank[app_key] = next(self._app_counter)
+        self.keys[key_lower].append(app_key)
+        self.names[nom_lower].append(app_key)
+        for token in normalize(f"{nom_lower} {key_lower}").split():
+            self.tokens[token].add(app_key)
+            self.tokens_by_app[app_key].add(token)
+        for text in [app_data["nom"], app_key] + self.commands_by_app[app_key]:
+            for key in phonetic_variants(text):
+                if len(key) >= MIN_PHONETIC_KEY_LENGTH:
+                    self.phonetic[key].add(app_key)
+                    self.phonetic_by_app[app_key].add(key)
+        self.fuzzy.add(app_key, [app_data["nom"], app_key] + self.commands_by_app[app_key])
+
+    def _unindex_application(self, app_key, app_data):
+        """Retire une application des index (rangs et place dans le catalogue conservés)"""
+        removed_commands = self.commands_by_app.pop(app_key, [])
+        for command in removed_commands:
+            if self.commands.get(command) == app_key:
+                del self.commands[command]
+            for trigram in trigrams(command):
+                self.command_trigrams[trigram].discard(command)
+
+        self.keys[app_key.lower()].remove(app_key)
+        self.names[app_data["nom"].lower()].remove(app_key)
+        for token in self.tokens_by_app.pop(app_key, ()):
+            self.tokens[token].discard(app_key)
+        for key in self.phonetic_by_app.pop(app_key, ()):
+            self.phonetic[key].discard(app_key)
+        self.fuzzy.remove(app_key)
+        return removed_commands
+
+    # ------------------------------------------------------------------
+    # Mises à jour incrémentales (nouveau scan du catalogue)
+    # ------------------------------------------------------------------
+
+    def add_application(self, app_key, app_data, commands=()):
+        """Ajoute ou met à jour une application sans reconstruire l'index
+
+        Une application déjà présente garde son rang et sa place dans le
+        catalogue, comme après une reconstruction complète.
+        """
+        old_data = self.applications.get(app_key)
+        old_commands = self._unindex_application(app_key, old_data) if old_data is not None else []
+
+        self.applications[app_key] = app_data
+        for command in commands:
+            command = command.lower()
+            self.commands[command] = app_key
+            self._index_command(command, app_key)
+        for command in old_commands:
+            if command not in self.commands:
+                self.command_rank.pop(command, None)
+        self._index_application(app_key, app_data)
+        self._update_specific_mappings([(app_key, app_data)] + ([(app_key, old_data)] if old_data else []))
+
+    def remove_application(self, app_key):
+        """Retire une application et ses commandes vocales de l'index"""
+        app_data = self.applications.pop(app_key, None)
+        if app_data is None:
+            return
+
+        for command in self._unindex_application(app_key, app_data):
+            if command not in self.commands:
+                self.command_rank.pop(command, None)
+        self.app_rank.pop(app_key, None)
+        self._update_specific_mappings([(app_key, app_data)])
+
+    @staticmethod
+    def _specific_candidate(app_type, keyword, app_key, app_data):
+        """Vrai si l'application peut être retenue pour ce mot-clé spécifique (exacte ou partielle)"""
+        app_key_lower = app_key.lower()
+        return (keyword in app_key_lower or app_type in app_key_lower
+                or keyword in app_key_lower.split() or keyword in app_data["nom"].lower())
+
+    def _update_specific_mappings(self, changed):
+        """Recalcule seulement les mots-clés spécifiques que les applications modifiées peuvent concerner"""
+        pairs = [(app_type, keyword) for app_type, keywords in SPECIFIC_MAPPINGS.items() for keyword in keywords
+                 if any(self._specific_candidate(app_type, keyword, app_key, app_data) for app_key, app_data in changed)]
+        if not pairs:
+            return
+        matches = self._precompute_specific_mappings(pairs)
+        for pair in pairs:
+            if pair in matches:
+                self.specific_matches[pair] = matches[pair]
+            else:
+                self.specific_matches.pop(pair, None)
+
+    def _precompute_specific_mappings(self, pairs=None):
+        """Pour chaque mot-clé spécifique : meilleure application et type de correspondance"""
+        if pairs is None:
+            pairs = [(app_type, keyword) for app_type, keywords in SPECIFIC_MAPPINGS.items() for keyword in keywords]
+        matches = {}
+        for app_type, keyword in pairs:
+            exact_match = partial_match = None
+            for app_key, app_data in self.applications.items():
+                app_key_lower = app_key.lower()
+                if (keyword == app_key_lower or
+                        keyword in app_key_lower.split() or
+                        app_type in app_key_lower):
+                    exact_match = app_key
+                    break
+                if partial_match is None and (keyword in app_key_lower or keyword in app_data["nom"].lower()):
+                    partial_match = app_key
+            if exact_match:
+                matches[(app_type, keyword)] = (exact_match, True)
+            elif partial_match:
+                matches[(app_type, keyword)] = (partial_match, False)
+        return matches
+
+    def _first(self, candidates, rank):
+        """Candidat apparaissant en premier dans le catalogue"""
+        return min(candidates, key=rank.__getitem__) if candidates else None
+
+    def _containing(self, fragment, trigram_index, universe):
+        """Candidats dont le texte indexé peut contenir fragment (à vérifier ensuite)"""
+        fragment_trigrams = trigrams(fragment)
+        if not fragment_trigrams:
+            return set(universe)
+        postings = sorted((trigram_index.get(t, set()) for t in fragment_trigrams), key=len)
+        return set.intersection(*postings)
+
+    # ------------------------------------------------------------------
+    # Recherches utilisées par find_application
+    # ------------------------------------------------------------------
+
+    def exact_command(self, app_name):
+        """Recherche 1 : commande vocale exacte"""
+        return self.commands.get(app_name)
+
+    def command_containing(self, app_name):
+        """Recherche 1 bis : commande qui contient app_name ou est contenue dedans"""
+        if len(app_name) <= 4 or app_name in EXCLUDED_WORDS:
+            return None
+
+        found = {command for command in self._containing(app_name, self.command_trigrams, self.commands)
+                 if app_name in command}
+        found.update(part for part in set(substrings(app_name)) if part in self.commands)
+        return self._first(found, self.command_rank)
+
+    def specific_mapping(self, app_name):
+        """Recherche 2 : mappings des applications populaires -> (clé, mot-clé, exacte)"""
+        for app_type, keywords in SPECIFIC_MAPPINGS.items():
+            for keyword in keywords:
+                if keyword in app_name or app_name in keyword:
+                    match = self.specific_matches.get((app_type, keyword))
+                    if match:
+                        return match[0], keyword, match[1]
+        return None
+
+    def phonetic_match(self, app_name):
+        """Recherche 3 : même prononciation (homophones de la reconnaissance vocale)"""
+        key = phonetic_key(app_name)
+        if len(key) < MIN_PHONETIC_KEY_LENGTH:
+            return None, key
+        return self._first(self.phonetic.get(key, ()), self.app_rank), key
+
+    def fuzzy_matches(self, app_name, k=5, min_score=0.3):
+        """Recherche 4 : k meilleures correspondances approchées -> [(clé, score)]"""
+        return self.fuzzy.top_k(app_name, k, min_score)
+
+    def popular_apps(self, keywords):
+        """Une application par mot-clé (mapping spécifique, commande exacte ou trigrammes)"""
+        app_keys = []
+        for keyword in keywords:
+            specific = self.specific_mapping(keyword)
+            app_key = specific[0] if specific else self.exact_command(keyword)
+            if not app_key:
+                matches = self.fuzzy_matches(keyword, k=1, min_score=0.5)
+                app_key = matches[0][0] if matches else None
+            if app_key and app_key not in app_keys:
+                app_keys.append(app_key)
+        return app_keys
+
+    def retrieve(self, query, k=10):
+        """Les k applications les plus pertinentes pour une phrase -> [(clé, score)]
+
+        Sert à ne proposer au modèle que des candidats plausibles. Chaque mot
+        utile de la phrase (et la phrase entière) vote pour les applications
+        proches par trigrammes, prononciation ou token exact ; les votes des
+        différents mots s'additionnent.
+        """
+        words = [word for word in normalize(query).split() if len(word) >= 3 and word not in STOPWORDS]
+        scores = defaultdict(float)
+
+        texts = words + ([" ".join(words)] if len(words) > 1 else [])
+        for text in texts:
+            best = defaultdict(float)
+            for app_key, score in self.fuzzy.top_k(text, k, min_score=0.25):
+                best[app_key] = score
+            for app_key in self.phonetic.get(phonetic_key(text), ()):
+                best[app_key] = max(best[app_key], 0.85)
+            for app_key in self.tokens.get(text, ()):
+                best[app_key] = max(best[app_key], 0.6)
+            for app_key, score in best.items():
+                scores[app_key] += score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.app_rank[item[0]]))
+        return ranked[:k]
+
+    def contained_in(self, text):
+        """Applications dont la clé ou le nom apparaît dans text"""
+        found = set()
+        for part in set(substrings(text)):
+            found.update(self.keys.get(part, ()))
+            found.update(self.names.get(part, ()))
+        return found
+
+    def first_contained_in(self, text):
+        """Première application (ordre du catalogue) dont la clé ou le nom apparaît dans text"""
+        return self._first(self.contained_in(text), self.app_rank)
@@ -0,0 +1,219 @@
+"""
+Interruption vocale (barge-in)
+==============================
+
+Pendant speak() ou query_mistral, l'assistant était sourd : il fallait
+écouter jusqu'au bout une mauvaise réponse de 30 secondes, et la requête HTTP
+continuait jusqu'à son timeout. Ici un thread surveille l'énergie du micro
+pendant la génération et la lecture ; dès que l'utilisateur parle :
+- le jeton d'annulation de la commande en cours est annulé : chaque étage
+  (file de parole, sortie audio, processus de synthèse, flux Ollama) a
+  enregistré de quoi s'arrêter et vérifie le jeton entre deux unités de travail
+- la nouvelle phrase est enregistrée (avec les quelques trames qui ont
+  déclenché la détection) et remise à l'assistant pour process_command
+
+Pendant que l'assistant parle, sa propre voix revient dans le micro par les
+haut-parleurs, bien au-dessus du bruit ambiant mesuré à la calibration. Le
+seuil est alors calculé sur le niveau du micro mesuré pendant la lecture
+(NiveauEcho) : pas d'interruption tant que ce niveau n'est pas connu, puis
+il faut factor fois plus que l'écho.
+
+    from interruption import EcouteInterruption, JetonAnnulation, OperationAnnulee
+
+    token = JetonAnnulation()
+    token.on_cancel(response.close)
+    listener = EcouteInterruption(sr.Microphone(), recognizer.energy_threshold, on_interrupt)
+    listener.start(token)
+    ...
+    token.check()                 # OperationAnnulee si l'utilisateur a parlé
+"""
+
+import collections
+import threading
+import time
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+BARGE_IN_ENABLED = getattr(config, "INTERRUPTION_VOCALE", True)
+BARGE_IN_FACTOR = getattr(config, "FACTEUR_INTERRUPTION", 3.0)  # x seuil d'énergie du micro (écho de la voix de l'assistant)
+BARGE_IN_MIN_SPEECH = getattr(config, "DUREE_MIN_INTERRUPTION", 0.3)  # Secondes de parole continue pour interrompre
+BARGE_IN_PAUSE = 0.8  # Secondes de silence qui terminent la nouvelle phrase
+BARGE_IN_MAX_SECONDS = 20
+ECHO_LEARN_SECONDS = 0.5  # Lecture écoutée avant de connaître le niveau de l'écho
+ECHO_HISTORY_SECONDS = 3.0
+ECHO_PERCENTILE = 90
+
+
+class OperationAnnulee(Exception):
+    """Levée par un étage de traitement dont le jeton a été annulé"""
+
+
+class JetonAnnulation:
+    """Jeton partagé par tous les étages d'une commande"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def on_cancel(self, callback):
+        """Enregistre callback (appelé une fois à l'annulation, tout de suite si déjà annulé)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return callback
+        callback()
+        return callback
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ Erreur pendant l'annulation: {e}")
+
+    def check(self):
+        """Lève OperationAnnulee si le jeton est annulé"""
+        if self._event.is_set():
+            raise OperationAnnulee("Commande interrompue par l'utilisateur")
+
+
+def frame_rms(frame):
+    """Énergie RMS d'une trame PCM 16 bits (même échelle que Recognizer.energy_threshold)"""
+    samples = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+    return float(np.sqrt(np.mean(samples * samples))) if len(samples) else 0.0
+
+
+class DetecteurParole:
+    """Parole = min_frames trames consécutives au-dessus du seuil d'énergie"""
+
+    def __init__(self, threshold, min_frames):
+        self.threshold = threshold
+        self.min_frames = max(1, min_frames)
+        self.loud_frames = 0
+
+    def feed(self, frame):
+        if frame_rms(frame) > self.threshold:
+            self.loud_frames += 1
+        else:
+            self.loud_frames = 0
+        return self.loud_frames >= self.min_frames
+
+
+class NiveauEcho:
+    """Niveau du micro pendant que l'assistant parle, partagé d'une commande à l'autre"""
+
+    def __init__(self, learn_seconds=ECHO_LEARN_SECONDS, history_seconds=ECHO_HISTORY_SECONDS):
+        self.learn_seconds = learn_seconds
+        self.history_seconds = history_seconds
+        self._history = collections.deque()
+        self._frame_seconds = None
+        self.level = None
+
+    def observe(self, rms, frame_seconds):
+        """Ajoute l'énergie d'une trame captée pendant la lecture (sans parole détectée)"""
+        if self._frame_seconds != frame_seconds:
+            self._frame_seconds = frame_seconds
+            self._history = collections.deque(self._history, maxlen=max(1, int(self.history_seconds / frame_seconds)))
+        self._history.append(rms)
+        if len(self._history) * frame_seconds >= self.learn_seconds:
+            self.level = float(np.percentile(self._history, ECHO_PERCENTILE))
+
+
+class EcouteInterruption:
+    """Thread d'écoute qui annule le jeton quand l'utilisateur parle
+
+    microphone suit l'interface de speech_recognition.Microphone : gestionnaire
+    de contexte dont la source expose stream.read(), CHUNK, SAMPLE_RATE et
+    SAMPLE_WIDTH. threshold est le seuil d'énergie normal du micro : il faut
+    factor fois plus pour interrompre (la voix de l'assistant revient dans le
+    micro), puis la phrase se termine sous threshold. on_interrupt(pcm,
+    sample_rate, sample_width) reçoit la nouvelle phrase.
+
+    is_playing() indique si l'assistant est en train de parler : pendant la
+    lecture, le seuil devient factor x max(threshold, niveau de l'écho).
+    """
+
+    def __init__(self, microphone, threshold, on_interrupt, factor=BARGE_IN_FACTOR,
+                 min_speech=BARGE_IN_MIN_SPEECH, pause=BARGE_IN_PAUSE, max_seconds=BARGE_IN_MAX_SECONDS,
+                 is_playing=None, echo=None):
+        self.microphone = microphone
+        self.is_playing = is_playing
+        self.echo = echo or NiveauEcho()
+        self.threshold = threshold
+        self.factor = factor
+        self.on_interrupt = on_interrupt
+        self.min_speech = min_speech
+        self.pause = pause
+        self.max_seconds = max_seconds
+        self.detection_time = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, token):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(token,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête l'écoute ; si une phrase est en cours d'enregistrement, attend sa fin"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, token):
+        try:
+            with self.microphone as source:
+                frame_seconds = source.CHUNK / source.SAMPLE_RATE
+                detector = DetecteurParole(self.threshold * self.factor, int(self.min_speech / frame_seconds))
+                preroll = collections.deque(maxlen=detector.min_frames + 2)
+                while not self._stop.is_set() and not token.cancelled:
+                    frame = source.stream.read(source.CHUNK)
+                    preroll.append(frame)
+                    playing = self.is_playing is not None and self.is_playing()
+                    if playing:
+                        if self.echo.level is None:
+                            # Niveau de l'écho encore inconnu : sa propre voix ne doit pas l'interrompre
+                            self.echo.observe(frame_rms(frame), frame_seconds)
+                            detector.loud_frames = 0
+                            continue
+                        detector.threshold = max(self.threshold, self.echo.level) * self.factor
+                    else:
+                        detector.threshold = self.threshold * self.factor
+                    if not detector.feed(frame):
+                        if playing and not detector.loud_frames:
+                            self.echo.observe(frame_rms(frame), frame_seconds)
+                        continue
+                    self.detection_time = time.perf_counter()
+                    print("✋ Interruption détectée - arrêt de la réponse en cours")
+                    token.cancel()
+                    pcm = self._record(source, list(preroll), frame_seconds)
+                    self.on_interrupt(pcm, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+                    return
+        except Exception as e:
+            print(f"⚠️ Écoute d'interruption indisponible: {e}")
+
+    def _record(self, source, frames, frame_seconds):
+        """Enregistre la suite de la phrase jusqu'à pause secondes de silence"""
+        silent_frames = 0
+        max_frames = int(self.max_seconds / frame_seconds)
+        while silent_frames * frame_seconds < self.pause and len(frames) < max_frames:
+            frame = source.stream.read(source.CHUNK)
+            frames.append(frame)
+            silent_frames = 0 if frame_rms(frame) > self.threshold else silent_frames + 1
+        return b"".join(frames)
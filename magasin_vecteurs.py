@@ -0,0 +1,170 @@
+"""
+Magasin de vecteurs sur disque
+==============================
+
+Les embeddings (catalogue d'applications, historique de questions...) sont
+gardés dans une matrice float16 .npy ouverte en np.memmap : seules les pages
+lues pendant une recherche sont chargées en mémoire, et rien n'est recalculé
+au démarrage.
+
+Une table annexe JSON associe chaque clé à sa ligne et à l'empreinte du texte
+embeddé. Après un nouveau scan du catalogue, sync() ne recalcule que les
+lignes dont le texte a changé, réutilise les lignes libérées par les entrées
+supprimées et n'agrandit le fichier que si nécessaire.
+
+sync() écrit la table en deux temps pour résister à une interruption (délai
+d'Ollama dépassé au milieu du scan) : d'abord les suppressions et les
+entrées à recalculer invalidées, avant qu'une ligne ne soit réécrite, puis
+les nouvelles empreintes, même si embed() échoue en cours de route. Une
+ligne n'est donc jamais associée sur disque à l'empreinte d'un autre texte.
+
+    magasin = MagasinVecteurs("embeddings_applications", modele="nomic-embed-text")
+    magasin.sync({"vlc": "VLC media player, vlc"}, embed)
+    for cle, score in magasin.top_k(vecteur_requete, 5): ...
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+CHUNK_ROWS = 4096  # Lignes converties en float32 à la fois pendant une recherche
+
+
+def content_hash(text):
+    """Empreinte courte du texte embeddé"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class MagasinVecteurs:
+    """Matrice float16 memmap + table clé → (ligne, empreinte)"""
+
+    def __init__(self, base_path, modele):
+        self.matrix_path = base_path + ".npy"
+        self.table_path = base_path + ".json"
+        self.modele = modele
+        self.rows = {}  # clé -> [ligne, empreinte]
+        self.free_rows = []
+        self.matrix = None
+        self._keys_by_row = []
+        self._load()
+
+    def _load(self):
+        """Ouvre le magasin existant s'il a été créé avec le même modèle"""
+        if not (os.path.exists(self.matrix_path) and os.path.exists(self.table_path)):
+            return
+        try:
+            with open(self.table_path, "r", encoding="utf-8") as f:
+                table = json.load(f)
+            if table.get("modele") != self.modele:
+                print(f"🔄 Modèle d'embeddings changé ({table.get('modele')} → {self.modele}): magasin recréé")
+                return
+            self.matrix = np.load(self.matrix_path, mmap_mode="r+")
+            self.rows = table["rows"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Magasin de vecteurs illisible, recréé: {e}")
+            self.matrix, self.rows = None, {}
+        # Lignes libres déduites de la table : aussi juste après un agrandissement interrompu
+        used = {row for row, _ in self.rows.values()}
+        capacity = 0 if self.matrix is None else self.matrix.shape[0]
+        self.free_rows = [row for row in range(capacity - 1, -1, -1) if row not in used]
+        self._index_rows()
+
+    def _index_rows(self):
+        capacity = 0 if self.matrix is None else self.matrix.shape[0]
+        self._keys_by_row = [None] * capacity
+        for key, (row, _) in self.rows.items():
+            self._keys_by_row[row] = key
+
+    def _save_table(self):
+        tmp_path = self.table_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"modele": self.modele, "rows": self.rows, "free_rows": self.free_rows}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.table_path)
+
+    def _grow(self, needed, dim):
+        """Agrandit la matrice (capacité doublée) en recopiant les lignes existantes"""
+        old = self.matrix
+        old_capacity = 0 if old is None else old.shape[0]
+        capacity = max(needed, old_capacity * 2, 16)
+        tmp_path = self.matrix_path + ".tmp.npy"
+        matrix = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float16, shape=(capacity, dim))
+        if old is not None:
+            matrix[:old_capacity] = old
+            del old
+        matrix.flush()
+        del matrix
+        self.matrix = None
+        os.replace(tmp_path, self.matrix_path)
+        self.matrix = np.load(self.matrix_path, mmap_mode="r+")
+        self.free_rows.extend(range(capacity - 1, old_capacity - 1, -1))
+        self._index_rows()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def sync(self, documents, embed):
+        """Aligne le magasin sur {clé: texte} en n'embeddant que les entrées nouvelles ou modifiées
+
+        Retourne (réutilisées, calculées, supprimées).
+        """
+        removed = [key for key in self.rows if key not in documents]
+        for key in removed:
+            row, _ = self.rows.pop(key)
+            self._keys_by_row[row] = None
+            self.free_rows.append(row)
+
+        to_embed, invalidated = [], 0
+        for key, text in documents.items():
+            digest = content_hash(text)
+            entry = self.rows.get(key)
+            if entry is None or entry[1] != digest:
+                to_embed.append((key, text, digest))
+                if entry is not None:
+                    entry[1] = None  # Sa ligne va être réécrite : plus valide pour aucun texte
+                    invalidated += 1
+
+        if self.matrix is not None and (removed or invalidated):
+            self._save_table()  # Suppressions et invalidations sur disque avant de réécrire une ligne
+
+        try:
+            for key, text, digest in to_embed:
+                vector = np.asarray(embed(text), dtype=np.float32)
+                if self.matrix is None or self.matrix.shape[1] != vector.shape[0]:
+                    if self.matrix is not None:
+                        raise ValueError(f"Dimension d'embedding {vector.shape[0]} ≠ {self.matrix.shape[1]} du magasin")
+                    self._grow(len(documents), vector.shape[0])
+                entry = self.rows.get(key)
+                if entry is None:
+                    if not self.free_rows:
+                        self._grow(self.matrix.shape[0] + 1, self.matrix.shape[1])
+                    row = self.free_rows.pop()
+                else:
+                    row = entry[0]
+                self.matrix[row] = vector
+                self.rows[key] = [row, digest]
+                self._keys_by_row[row] = key
+        finally:
+            if self.matrix is not None and (to_embed or removed):
+                self.matrix.flush()
+                self._save_table()  # Lignes déjà calculées gardées, même si embed() a échoué
+        return len(documents) - len(to_embed), len(to_embed), len(removed)
+
+    def top_k(self, vector, k=5):
+        """Les k clés dont le vecteur a le plus grand produit scalaire avec vector : [(clé, score)]"""
+        if self.matrix is None or not self.rows:
+            return []
+        vector = np.asarray(vector, dtype=np.float32)
+        capacity = self.matrix.shape[0]
+        scores = np.empty(capacity, dtype=np.float32)
+        for start in range(0, capacity, CHUNK_ROWS):
+            chunk = self.matrix[start:start + CHUNK_ROWS]
+            np.dot(chunk.astype(np.float32), vector, out=scores[start:start + len(chunk)])
+        if self.free_rows:
+            scores[self.free_rows] = -np.inf
+
+        k = min(k, len(self.rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._keys_by_row[row], float(scores[row])) for row in top]
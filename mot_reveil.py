@@ -0,0 +1,247 @@
+"""
+Détection locale du mot de réveil
+=================================
+
+listen_for_wake_word enregistrait des morceaux de 4 secondes et les envoyait
+tous à recognize_google pour y chercher "assistant" : un aller-retour réseau
+et un envoi d'audio par morceau, jour et nuit, et environ une seconde de
+retard à la détection. Ici le mot est repéré localement sur les trames du
+micro, et la reconnaissance complète ne démarre qu'après une détection.
+
+- MFCC en NumPy (fenêtres de 25 ms, pas de 10 ms, 26 filtres mel, 12 coefficients)
+- comparaison par DTW (alignement temporel) aux enregistrements modèles du
+  mot, sur les dernières secondes d'audio, toutes les 100 ms
+- pas de DTW (1,0), (1,1), (1,2) : chaque trame du modèle est alignée une
+  fois, le débit de la voix peut varier du simple au double, et chaque ligne
+  se calcule d'un coup en NumPy
+- seuil calibré sur les distances entre modèles (ou SEUIL_MOT_REVEIL)
+
+Les modèles sont des WAV du mot prononcé seul (3 à 5), dans
+modeles_mot_reveil/ :
+
+    python mot_reveil.py enregistrer 4      # enregistre 4 modèles au micro
+
+    from mot_reveil import DetecteurMotReveil
+
+    detecteur = DetecteurMotReveil.from_directory(sample_rate=16000)
+    if detecteur.feed(trame_pcm16):
+        ...                                 # mot de réveil entendu
+"""
+
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+WAKE_WORD_DIR = getattr(config, "DOSSIER_MOT_REVEIL", os.path.join(os.path.dirname(os.path.abspath(__file__)), "modeles_mot_reveil"))
+WAKE_WORD_THRESHOLD = getattr(config, "SEUIL_MOT_REVEIL", None)  # None : calibré sur les modèles
+THRESHOLD_MARGIN = 1.25  # Seuil = marge x plus grande distance entre deux modèles
+
+FRAME_SECONDS = 0.025
+HOP_SECONDS = 0.010
+N_MELS = 26
+N_MFCC = 13
+DETECTION_HOP = 0.1  # Secondes d'audio entre deux comparaisons
+STEP_PENALTY = 0.1  # Coût ajouté aux pas qui étirent ou compressent la voix
+SPEECH_DYNAMIC_RANGE = 2.0 * N_MELS  # Trames de parole : c0 à moins de ~20 dB du maximum
+
+
+def read_wav(path):
+    """(échantillons float32 dans [-1, 1], fréquence) d'un WAV mono 16 bits"""
+    with wave.open(path, "rb") as wav:
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        if wav.getnchannels() > 1:
+            pcm = pcm.reshape(-1, wav.getnchannels()).mean(axis=1)
+        return pcm.astype(np.float32) / 32768, wav.getframerate()
+
+
+_filterbanks = {}
+
+
+def mel_filterbank(n_fft, sample_rate, n_mels=N_MELS):
+    """Matrice (n_mels, n_fft // 2 + 1) de filtres triangulaires sur l'échelle mel"""
+    key = (n_fft, sample_rate, n_mels)
+    if key not in _filterbanks:
+        mel_max = 2595 * np.log10(1 + min(sample_rate / 2, 8000) / 700)
+        hz = 700 * (10 ** (np.linspace(0, mel_max, n_mels + 2) / 2595) - 1)
+        bins = np.floor((n_fft + 1) * hz / sample_rate).astype(int)
+        bank = np.zeros((n_mels, n_fft // 2 + 1))
+        for m in range(1, n_mels + 1):
+            left, center, right = bins[m - 1], bins[m], bins[m + 1]
+            if center > left:
+                bank[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+            if right > center:
+                bank[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+        _filterbanks[key] = bank
+    return _filterbanks[key]
+
+
+_dct = {}
+
+
+def _dct_matrix(n_mfcc, n_mels):
+    if (n_mfcc, n_mels) not in _dct:
+        k = np.arange(n_mfcc)[:, None]
+        n = np.arange(n_mels)[None, :]
+        _dct[(n_mfcc, n_mels)] = np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels))
+    return _dct[(n_mfcc, n_mels)]
+
+
+def frame_signal(samples, sample_rate):
+    """Trames de 25 ms tous les 10 ms, (nombre de trames, longueur de trame)"""
+    frame_length = int(FRAME_SECONDS * sample_rate)
+    hop = int(HOP_SECONDS * sample_rate)
+    if len(samples) < frame_length:
+        return np.zeros((0, frame_length), dtype=np.float32)
+    count = 1 + (len(samples) - frame_length) // hop
+    return np.lib.stride_tricks.as_strided(
+        samples, shape=(count, frame_length), strides=(samples.strides[0] * hop, samples.strides[0]), writeable=False)
+
+
+def mfcc(samples, sample_rate):
+    """MFCC (trames, 12) sans le coefficient d'énergie c0, centrés par coefficient"""
+    samples = np.asarray(samples, dtype=np.float32)
+    emphasized = np.append(samples[:1], samples[1:] - 0.97 * samples[:-1])
+    frames = frame_signal(emphasized, sample_rate)
+    if not len(frames):
+        return np.zeros((0, N_MFCC - 1))
+    n_fft = 1 << (frames.shape[1] - 1).bit_length()
+    power = np.abs(np.fft.rfft(frames * np.hamming(frames.shape[1]), n_fft)) ** 2
+    energies = np.log(power @ mel_filterbank(n_fft, sample_rate).T + 1e-10)
+    coefficients = energies @ _dct_matrix(N_MFCC, N_MELS).T
+    features = coefficients[:, 1:]
+    # Moyenne sur les trames de parole seulement : le silence autour du mot ne décale pas les coefficients
+    speech = coefficients[:, 0] > coefficients[:, 0].max() - SPEECH_DYNAMIC_RANGE
+    return features - features[speech].mean(axis=0)
+
+
+def trim_silence(samples, sample_rate, ratio=0.05):
+    """Retire le silence avant et après le mot (trames sous ratio x l'énergie maximale)"""
+    frames = frame_signal(np.asarray(samples, dtype=np.float32), sample_rate)
+    if not len(frames):
+        return samples
+    energy = (frames ** 2).mean(axis=1)
+    voiced = np.nonzero(energy > ratio * energy.max())[0]
+    hop = int(HOP_SECONDS * sample_rate)
+    return samples[voiced[0] * hop:voiced[-1] * hop + frames.shape[1]]
+
+
+def dtw_cost(template, features):
+    """Coût moyen du meilleur alignement de template n'importe où dans features
+
+    DTW en sous-séquence (début et fin libres dans features) avec les pas
+    (1,0), (1,1), (1,2) : une ligne ne dépend que de la précédente.
+    """
+    if len(features) < len(template) // 2:
+        return np.inf
+    distances = np.sqrt(((template[:, None, :] - features[None, :, :]) ** 2).sum(axis=2))
+    distances /= np.sqrt(template.shape[1])
+    previous = distances[0].copy()
+    for i in range(1, len(template)):
+        stay = previous + STEP_PENALTY
+        diagonal = np.concatenate(([np.inf], previous[:-1]))
+        skip = np.concatenate(([np.inf, np.inf], previous[:-2])) + STEP_PENALTY
+        previous = distances[i] + np.minimum(np.minimum(stay, diagonal), skip)
+    return float(previous.min() / len(template))
+
+
+class DetecteurMotReveil:
+    """Repère le mot de réveil dans un flux audio par comparaison DTW aux modèles"""
+
+    def __init__(self, templates, sample_rate=16000, threshold=WAKE_WORD_THRESHOLD, margin=THRESHOLD_MARGIN):
+        if not templates:
+            raise ValueError("Aucun modèle de mot de réveil")
+        self.sample_rate = sample_rate
+        trimmed = [(trim_silence(samples, rate), rate) for samples, rate in templates]
+        features = [mfcc(samples, rate) for samples, rate in trimmed]
+        # Enregistrement coupé : moins de la moitié de la durée habituelle, aucun alignement DTW possible
+        typical = np.median([len(template) for template in features])
+        kept = [index for index, template in enumerate(features) if len(template) >= typical / 2]
+        if len(kept) < len(features):
+            print(f"⚠️ {len(features) - len(kept)} modèle(s) de mot de réveil trop court(s) ignoré(s) - réenregistrez-les")
+        self.templates = [features[index] for index in kept]
+        longest = max(len(trimmed[index][0]) / trimmed[index][1] for index in kept)
+        self.window = np.zeros(int(longest * 1.5 * sample_rate), dtype=np.float32)
+        self.threshold = threshold if threshold is not None else self.calibrate(margin)
+        self._since_check = 0
+        self._filled = 0
+        self.last_score = np.inf
+        self.last_check_ms = 0.0
+
+    @classmethod
+    def from_directory(cls, directory=WAKE_WORD_DIR, **kwargs):
+        """Détecteur à partir des WAV modèles d'un dossier ; None s'il n'y en a pas"""
+        if not os.path.isdir(directory):
+            return None
+        paths = sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".wav"))
+        if not paths:
+            return None
+        return cls([read_wav(path) for path in paths], **kwargs)
+
+    def calibrate(self, margin):
+        """Seuil à partir des distances entre modèles (un seul modèle : valeur par défaut)"""
+        costs = [dtw_cost(a, b) for i, a in enumerate(self.templates) for j, b in enumerate(self.templates) if i != j]
+        finite = [cost for cost in costs if np.isfinite(cost)]
+        if len(finite) < len(costs):
+            print(f"⚠️ {len(costs) - len(finite)} paire(s) de modèles de durées trop différentes, ignorée(s) pour le seuil")
+        return margin * max(finite) if finite else 1.0
+
+    def score(self, samples, sample_rate=None):
+        """Plus petit coût d'alignement d'un modèle dans samples"""
+        features = mfcc(samples, sample_rate or self.sample_rate)
+        return min(dtw_cost(template, features) for template in self.templates)
+
+    def reset(self):
+        self.window[:] = 0
+        self._filled = 0
+        self._since_check = 0
+
+    def feed(self, frame):
+        """Ajoute une trame (octets PCM 16 bits ou échantillons float) ; True si le mot vient d'être dit"""
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            frame = np.frombuffer(frame, dtype="<i2").astype(np.float32) / 32768
+        frame = frame[-len(self.window):]
+        self.window = np.roll(self.window, -len(frame))
+        self.window[-len(frame):] = frame
+        self._filled = min(len(self.window), self._filled + len(frame))
+        self._since_check += len(frame)
+        if self._since_check < DETECTION_HOP * self.sample_rate:
+            return False
+        self._since_check = 0
+
+        start_time = time.perf_counter()
+        self.last_score = self.score(self.window[-self._filled:])
+        self.last_check_ms = (time.perf_counter() - start_time) * 1000
+        if self.last_score <= self.threshold:
+            self.reset()  # Pas de double détection du même mot
+            return True
+        return False
+
+
+def record_templates(count=4, directory=WAKE_WORD_DIR):
+    """Enregistre count modèles du mot de réveil au micro"""
+    import speech_recognition as sr
+
+    os.makedirs(directory, exist_ok=True)
+    recognizer = sr.Recognizer()
+    with sr.Microphone() as source:
+        print("🔧 Calibration du bruit ambiant...")
+        recognizer.adjust_for_ambient_noise(source, duration=1)
+        for index in range(count):
+            print(f"🎤 Modèle {index + 1}/{count} : dites 'Assistant'")
+            audio = recognizer.listen(source, timeout=10, phrase_time_limit=3)
+            path = os.path.join(directory, f"assistant_{int(time.time())}_{index}.wav")
+            with open(path, "wb") as f:
+                f.write(audio.get_wav_data(convert_rate=16000, convert_width=2))
+            print(f"✅ {path}")
+
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "enregistrer":
+    record_templates(int(sys.argv[2]) if len(sys.argv) > 2 else 4)
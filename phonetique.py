@@ -0,0 +1,113 @@
+"""
+Clés phonétiques françaises
+===========================
+
+Encodage inspiré de Phonex / Soundex pour rapprocher les noms d'applications
+des homophones produits par la reconnaissance vocale :
+
+    "spotifaille" → spotify     "discorde" → discord     "vé elle cé" → vlc
+
+Deux textes qui se prononcent de la même façon en français donnent la même
+clé. Pour les noms d'applications (souvent anglais), phonetic_variants ajoute
+une lecture « à l'anglaise » et, pour les sigles courts, l'épellation lettre
+par lettre.
+"""
+
+import re
+import unicodedata
+
+# Nom des lettres en français, pour les sigles épelés ("vlc" → "vé elle cé")
+LETTER_NAMES = {
+    "a": "a", "b": "bé", "c": "cé", "d": "dé", "e": "e", "f": "effe", "g": "gé",
+    "h": "ache", "i": "i", "j": "ji", "k": "ka", "l": "elle", "m": "emme",
+    "n": "enne", "o": "o", "p": "pé", "q": "ku", "r": "erre", "s": "esse",
+    "t": "té", "u": "u", "v": "vé", "w": "double vé", "x": "ixe", "y": "i grec",
+    "z": "zède", "0": "zéro", "1": "un", "2": "deux", "3": "trois", "4": "quatre",
+    "5": "cinq", "6": "six", "7": "sept", "8": "huit", "9": "neuf"
+}
+
+# Règles appliquées dans l'ordre sur chaque mot (minuscules, sans accents sauf
+# "é" noté E). Les majuscules notent des sons qui ne doivent plus être réécrits :
+# E = é/è, S = ch
+FRENCH_RULES = [
+    (r"aille?$|ail(?=[^l]|$)", "ay"),
+    (r"eille?$|eil(?=[^l]|$)", "ey"),
+    (r"ille", "iy"),
+    (r"ph", "f"),
+    (r"th", "t"),
+    (r"ch(?=[lr])", "k"),
+    (r"[cs]h", "S"),
+    (r"qu|q|ck", "k"),
+    (r"gu(?=[eiy])", "g"),
+    (r"g(?=[eiy])", "j"),
+    (r"gn", "ni"),
+    (r"c(?=[eiy])", "s"),
+    (r"c", "k"),
+    (r"x", "ks"),
+    (r"z", "s"),
+    (r"w", "v"),
+    (r"h", ""),
+    (r"eau|au", "o"),
+    (r"(?:er|et|ez)$", "E"),
+    (r"y", "i"),
+    (r"ai|ei", "E"),
+    (r"ou", "u"),
+    (r"(.)\1+", r"\1"),
+]
+
+# Lecture anglaise fréquente dans les noms de logiciels
+ENGLISH_RULES = [
+    (r"(?<=[^aeiou])y(?=[^aeiou]|$)", "ai"),  # spotify, skype
+    (r"^chr", "kr"),
+    (r"ee|ea", "i"),
+    (r"oo", "u"),
+    (r"^w", "ou"),
+]
+
+_compiled_french = [(re.compile(pattern), repl) for pattern, repl in FRENCH_RULES]
+_compiled_english = [(re.compile(pattern), repl) for pattern, repl in ENGLISH_RULES]
+
+
+def _words(text):
+    """Mots du texte en minuscules, sans accents (é, è, ê notés E)"""
+    text = re.sub(r"[éèêë]", "E", text.lower())
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r"[a-z0-9E]+", text)
+
+
+def _encode_word(word):
+    for pattern, repl in _compiled_french:
+        word = pattern.sub(repl, word)
+    # Lettres finales muettes
+    if len(word) > 1 and word.endswith("s"):
+        word = word[:-1]
+    if len(word) > 1 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def phonetic_key(text):
+    """Clé phonétique française d'un texte (les mots sont concaténés)"""
+    return "".join(_encode_word(word) for word in _words(text))
+
+
+def _anglicize(word):
+    for pattern, repl in _compiled_english:
+        word = pattern.sub(repl, word)
+    return word
+
+
+def phonetic_variants(name):
+    """Clés phonétiques possibles pour un nom d'application"""
+    words = _words(name)
+    variants = {
+        "".join(_encode_word(word) for word in words),
+        "".join(_encode_word(_anglicize(word)) for word in words)
+    }
+    # Sigle court épelé par la reconnaissance vocale
+    if len(words) == 1 and (2 <= len(words[0]) <= 3 or
+                            (len(words[0]) == 4 and not re.search(r"[aeiouy]", words[0]))):
+        variants.add(phonetic_key(" ".join(LETTER_NAMES[c] for c in words[0])))
+    variants.discard("")
+    return variants
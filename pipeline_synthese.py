@@ -0,0 +1,120 @@
+"""
+Synthèse vocale en pipeline, phrase par phrase
+==============================================
+
+Pour une réponse longue, speak() synthétisait tout le texte puis le jouait :
+durée totale = synthèse + lecture, et rien n'était entendu avant la fin de
+la synthèse complète. Ici le texte est découpé en phrases et traité par deux
+étages reliés par une file bornée :
+
+    thread de synthèse : phrase 1, phrase 2, phrase 3...  -> tampons audio
+    lecteur            :           joue 1,    joue 2...   <- file (max N tampons)
+
+La phrase N+1 est synthétisée pendant que la phrase N est jouée : la durée
+totale tend vers max(synthèse, lecture) et le premier son arrive après la
+synthèse de la seule première phrase. La file bornée évite de synthétiser
+toute la réponse d'avance (mémoire, travail perdu si la lecture s'arrête).
+
+    from pipeline_synthese import PipelineSynthese
+
+    pipeline = PipelineSynthese(synthesize, play)   # synthesize(phrase) -> tampon, play(tampon)
+    stats = pipeline.speak(long_texte)              # {"premier_son": s, "total": s, "phrases": n}
+
+Avec un jeton d'annulation (interruption.JetonAnnulation), synthèse et
+lecture s'arrêtent entre deux phrases et speak lève OperationAnnulee.
+"""
+
+import queue
+import re
+import threading
+import time
+
+try:
+    import config
+except ImportError:
+    config = None
+
+PIPELINE_BUFFERS = getattr(config, "TAMPONS_SYNTHESE", 2)  # Phrases synthétisées d'avance au maximum
+
+# Fin de phrase : ponctuation forte suivie d'un espace, ou saut de ligne
+SENTENCE_END_RE = re.compile(r'(?<=[.!?…])\s+|\n+')
+
+def split_sentences(buffer):
+    """Découpe un tampon de texte en phrases complètes
+
+    Retourne (phrases, reste) où reste est le début de phrase encore incomplet.
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END_RE.finditer(buffer):
+        sentence = buffer[start:match.start()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    return sentences, buffer[start:]
+
+
+def split_text(text):
+    """Toutes les phrases d'un texte complet (le reste sans ponctuation finale compris)"""
+    sentences, rest = split_sentences(text)
+    if rest.strip():
+        sentences.append(rest.strip())
+    return sentences
+
+
+class PipelineSynthese:
+    """Synthèse et lecture en parallèle, reliées par une file bornée de tampons audio"""
+
+    def __init__(self, synthesize, play, max_buffers=PIPELINE_BUFFERS):
+        self.synthesize = synthesize
+        self.play = play
+        self.max_buffers = max_buffers
+
+    def speak(self, text, token=None):
+        """Prononce text en entier (bloquant) ; retourne les temps du premier son et total"""
+        sentences = split_text(text)
+        buffers = queue.Queue(maxsize=self.max_buffers)
+        stop = threading.Event()
+
+        def _synthesize():
+            try:
+                for sentence in sentences:
+                    if stop.is_set() or (token and token.cancelled):
+                        return
+                    buffers.put(("audio", self.synthesize(sentence)))
+            except Exception as e:
+                buffers.put(("erreur", e))
+                return
+            buffers.put(("fin", None))
+
+        start_time = time.perf_counter()
+        first_audio = None
+        worker = threading.Thread(target=_synthesize, daemon=True)
+        worker.start()
+        try:
+            while True:
+                try:
+                    kind, payload = buffers.get(timeout=0.05)
+                except queue.Empty:
+                    kind = "attente"
+                if token:
+                    token.check()
+                if kind == "attente":
+                    continue
+                if kind == "fin":
+                    break
+                if kind == "erreur":
+                    raise payload
+                if first_audio is None:
+                    first_audio = time.perf_counter() - start_time
+                self.play(payload)
+        finally:
+            # Lecture interrompue : libérer le thread de synthèse bloqué sur la file pleine
+            stop.set()
+            while worker.is_alive():
+                try:
+                    buffers.get_nowait()
+                except queue.Empty:
+                    worker.join(0.05)
+
+        return {"premier_son": first_audio, "total": time.perf_counter() - start_time, "phrases": len(sentences)}
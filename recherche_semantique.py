@@ -0,0 +1,129 @@
+"""
+Recherche sémantique d'applications
+===================================
+
+Les phrases d'intention ("je veux regarder un film", "démarre une app pour
+les calculs") ne contiennent pas le nom de l'application : ni l'index local
+ni les clés phonétiques ne peuvent les résoudre. Chaque application du
+catalogue (nom + commandes vocales) est donc convertie en vecteur par
+Ollama (/api/embeddings), une seule fois : les vecteurs sont gardés dans un
+magasin memmap (magasin_vecteurs) et seules les applications ajoutées ou
+modifiées par un nouveau scan sont recalculées.
+
+Une requête coûte ensuite un embedding de la phrase et un produit
+matrice-vecteur NumPy (similarité cosinus sur des vecteurs normalisés).
+
+Un seul IndexSemantique (donc un seul magasin) par assistant : les
+reconstructions passent par un unique thread (build_async) ; un catalogue
+arrivé pendant un calcul remplace les versions en attente et n'est appliqué
+qu'à la fin du calcul en cours, jamais deux sync() en même temps.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from magasin_vecteurs import MagasinVecteurs
+
+try:
+    import config
+except ImportError:
+    config = None
+
+EMBEDDING_MODEL = getattr(config, "MODELE_EMBEDDINGS", "nomic-embed-text")
+EMBEDDINGS_STORE = getattr(config, "MAGASIN_EMBEDDINGS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "embeddings_applications"))
+MIN_SIMILARITY = getattr(config, "SEUIL_SIMILARITE_SEMANTIQUE", 0.6)  # Cosinus minimal pour retenir une application
+QUERY_CACHE_SIZE = 128  # Embeddings de requêtes gardés en mémoire
+
+
+def app_document(app_data, commands):
+    """Texte représentant une application pour l'embedding"""
+    names = [app_data.get("nom", "")] + [command for command in commands if command != app_data.get("nom", "").lower()]
+    return ", ".join(name for name in names if name)
+
+
+class IndexSemantique:
+    """Embeddings du catalogue et recherche cosinus top-k"""
+
+    def __init__(self, client, model=EMBEDDING_MODEL, store_path=EMBEDDINGS_STORE):
+        self.client = client
+        self.model = model
+        self.store_path = store_path
+        self.store = None  # Vecteurs normalisés, ouverts en memmap
+        self.ready = False
+        self._query_cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()  # Un seul sync() à la fois sur le magasin
+        self._pending = None  # Dernier catalogue en attente de build_async
+        self._worker = None
+
+    def embed(self, text):
+        """Vecteur normalisé d'un texte via Ollama"""
+        response = self.client.post("/api/embeddings", {"model": self.model, "prompt": text})
+        response.raise_for_status()
+        vector = np.asarray(response.json()["embedding"], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def build(self, documents):
+        """Aligne le magasin sur {clé: texte} : seules les entrées nouvelles ou modifiées sont embeddées"""
+        with self._build_lock:
+            start_time = time.perf_counter()
+            if self.store is None:
+                self.store = MagasinVecteurs(self.store_path, self.model)
+            reused, embedded, removed = self.store.sync(documents, self.embed)
+            print(f"🧭 Embeddings prêts en {time.perf_counter() - start_time:.2f}s: {reused} réutilisés, "
+                  f"{embedded} calculés, {removed} supprimés")
+            self.ready = True
+
+    def build_async(self, documents):
+        """build() en arrière-plan ; seule la dernière version reçue pendant un calcul est appliquée ensuite"""
+        with self._lock:
+            self._pending = documents
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run_pending, daemon=True)
+            self._worker.start()
+
+    def _run_pending(self):
+        while True:
+            with self._lock:
+                documents, self._pending = self._pending, None
+                if documents is None:
+                    self._worker = None
+                    return
+            try:
+                self.build(documents)
+            except Exception as e:
+                print(f"⚠️ Recherche sémantique indisponible: {e}")
+
+    def wait(self):
+        """Attend la fin des constructions en arrière-plan"""
+        while True:
+            with self._lock:
+                worker = self._worker
+            if worker is None:
+                return
+            worker.join()
+
+    def _query_vector(self, query):
+        with self._lock:
+            vector = self._query_cache.get(query)
+            if vector is not None:
+                self._query_cache.move_to_end(query)
+                return vector
+        vector = self.embed(query)
+        with self._lock:
+            self._query_cache[query] = vector
+            while len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return vector
+
+    def search(self, query, k=5):
+        """Les k applications les plus proches de la requête : [(clé, similarité)]"""
+        if not self.ready or not len(self.store):
+            return []
+        return self.store.top_k(self._query_vector(query), k)
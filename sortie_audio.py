@@ -0,0 +1,159 @@
+"""
+Sorties audio
+=============
+
+Joue un WAV ou des échantillons déjà en mémoire, sans fichier temporaire
+ni processus :
+- "winsound"    : module standard de Windows (PlaySound avec SND_MEMORY)
+- "sounddevice" : flux PortAudio, échantillons envoyés par blocs (optionnel)
+- "nulle"       : n'émet aucun son, garde la trace de ce qui aurait été joué
+                  (tests et machines sans carte son)
+
+    from sortie_audio import get_sortie_audio
+
+    sortie = get_sortie_audio()
+    sortie.play_wav(donnees_wav)              # bloquant jusqu'à la fin de la lecture
+    sortie.play(echantillons, 22050)          # float dans [-1, 1], mono
+    sortie.stop()                             # depuis un autre thread : coupe la lecture
+"""
+
+import io
+import sys
+import threading
+import wave
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+AUDIO_OUTPUT = getattr(config, "SORTIE_AUDIO", "winsound" if sys.platform == "win32" else "nulle")
+
+
+def wav_duration(data):
+    """Durée en secondes d'un WAV en mémoire"""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def samples_to_wav(samples, sample_rate):
+    """WAV mono 16 bits en mémoire à partir d'échantillons float dans [-1, 1]"""
+    pcm = (np.clip(np.asarray(samples, dtype=np.float32), -1.0, 1.0) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(int(sample_rate))
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def wav_to_samples(data):
+    """(échantillons float32, fréquence) d'un WAV mono 16 bits en mémoire"""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        return pcm.astype(np.float32) / 32768, wav.getframerate()
+
+
+class SortieNulle:
+    """Sortie sans son : mémorise la durée de chaque son reçu
+
+    Avec realtime=True, attend la durée du son comme une vraie carte son.
+    """
+
+    name = "nulle"
+
+    def __init__(self, realtime=False):
+        self.realtime = realtime
+        self.played = []
+        self._stop = threading.Event()
+
+    def play_wav(self, data):
+        self._play(wav_duration(data))
+
+    def play(self, samples, sample_rate):
+        self._play(len(samples) / sample_rate)
+
+    def _play(self, duration):
+        self._stop.clear()
+        self.played.append(duration)
+        if self.realtime:
+            self._stop.wait(duration)
+
+    def stop(self):
+        self._stop.set()
+
+
+class SortieWinsound:
+    """Lecture en mémoire avec winsound (Windows)"""
+
+    name = "winsound"
+
+    def __init__(self):
+        import winsound
+        self._winsound = winsound
+
+    def play_wav(self, data):
+        self._winsound.PlaySound(data, self._winsound.SND_MEMORY)
+
+    def play(self, samples, sample_rate):
+        self.play_wav(samples_to_wav(samples, sample_rate))
+
+    def stop(self):
+        self._winsound.PlaySound(None, 0)  # Arrête le son en cours
+
+
+class SortieSounddevice:
+    """Flux PortAudio : les échantillons sont écrits par blocs sur la carte son"""
+
+    name = "sounddevice"
+    block_frames = 2048
+
+    def __init__(self):
+        import sounddevice
+        self._sounddevice = sounddevice
+        self._stop = threading.Event()
+
+    def play_wav(self, data):
+        self.play(*wav_to_samples(data))
+
+    def play(self, samples, sample_rate):
+        self._stop.clear()
+        samples = np.asarray(samples, dtype=np.float32)
+        with self._sounddevice.OutputStream(samplerate=int(sample_rate), channels=1, dtype="float32") as stream:
+            for start in range(0, len(samples), self.block_frames):
+                if self._stop.is_set():
+                    stream.abort()
+                    return
+                stream.write(samples[start:start + self.block_frames])
+
+    def stop(self):
+        self._stop.set()
+
+
+OUTPUTS = {
+    "nulle": SortieNulle,
+    "winsound": SortieWinsound,
+    "sounddevice": SortieSounddevice,
+}
+
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def get_sortie_audio(name=AUDIO_OUTPUT):
+    """Retourne la sortie audio partagée ; sortie nulle si celle demandée est indisponible"""
+    with _instances_lock:
+        output = _instances.get(name)
+        if output is None:
+            if name not in OUTPUTS:
+                raise ValueError(f"Sortie audio inconnue: {name} (disponibles: {', '.join(OUTPUTS)})")
+            try:
+                output = OUTPUTS[name]()
+            except ImportError as e:
+                print(f"⚠️ Sortie audio '{name}' indisponible ({e}) - sortie nulle")
+                output = SortieNulle()
+            _instances[name] = output
+        return output
@@ -0,0 +1,327 @@
+"""
+Processus de synthèse vocale persistant
+=======================================
+
+Chaque phrase prononcée lançait un nouveau `powershell -Command "Add-Type
+System.Speech ..."` : démarrage de PowerShell et chargement de l'assembly
+(0,5 à 1,5 s) à payer pour chaque phrase, alors qu'une commande en prononce
+4 à 6. Ici un seul processus de synthèse est démarré et reçoit les phrases
+ligne par ligne sur son entrée standard.
+
+Protocole (une ligne par message, texte en base64 UTF-8) :
+    → SPEAK <vitesse> <texte base64>     ← OK <durée ms> | ERR <message>
+    → RENDER <vitesse> <texte base64>    ← OK <durée ms> <WAV base64> | ERR <message>
+    → PING                               ← OK 0
+    → QUIT
+Le processus écrit READY quand il est prêt.
+
+Le moteur est interchangeable : "sapi" (PowerShell + System.Speech, Windows)
+ou "stub" (ce module en mode --stub, sans audio, pour les tests sous Linux).
+Si le processus meurt, il est relancé automatiquement à la phrase suivante.
+RENDER produit l'audio en mémoire au lieu de le jouer (cache des phrases fixes).
+interrupt() coupe la phrase en cours (le processus est relancé en arrière-plan).
+
+    from synthese_vocale import get_synthese
+
+    synthese = get_synthese()
+    synthese.speak("Bonjour !", rate=1)
+"""
+
+import base64
+import io
+import subprocess
+import sys
+import threading
+import time
+import wave
+
+from interruption import OperationAnnulee
+
+try:
+    import config
+except ImportError:
+    config = None
+
+SYNTHESIS_ENGINE = getattr(config, "MOTEUR_SYNTHESE", "sapi" if sys.platform == "win32" else "stub")
+SAPI_VOICE = getattr(config, "VOIX_SAPI", "Hortense")
+COQUI_SAMPLE_RATE = 22050  # Fréquence des modèles Coqui quand le synthétiseur ne l'expose pas
+START_TIMEOUT = 15  # Secondes pour démarrer le processus (chargement de System.Speech)
+
+SAPI_WORKER_SCRIPT = r"""
+Add-Type -AssemblyName System.Speech
+$s = New-Object System.Speech.Synthesis.SpeechSynthesizer
+$s.SetOutputToDefaultAudioDevice()
+$s.Volume = 100
+foreach ($v in $s.GetInstalledVoices()) {
+    if ($v.VoiceInfo.Name -like '*__VOIX__*') { $s.SelectVoice($v.VoiceInfo.Name); break }
+}
+function Reply($message) { [Console]::Out.WriteLine($message); [Console]::Out.Flush() }
+Reply 'READY'
+while ($null -ne ($line = [Console]::In.ReadLine())) {
+    $parts = $line.Split(' ', 3)
+    try {
+        if ($parts[0] -eq 'QUIT') { break }
+        if ($parts[0] -eq 'PING') { Reply 'OK 0'; continue }
+        if ($parts[0] -eq 'SPEAK') {
+            $s.Rate = [int]$parts[1]
+            $text = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($parts[2]))
+            $watch = [Diagnostics.Stopwatch]::StartNew()
+            $s.Speak($text)
+            Reply ('OK ' + $watch.ElapsedMilliseconds)
+        }
+        if ($parts[0] -eq 'RENDER') {
+            $s.Rate = [int]$parts[1]
+            $text = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($parts[2]))
+            $stream = New-Object IO.MemoryStream
+            $watch = [Diagnostics.Stopwatch]::StartNew()
+            try {
+                $s.SetOutputToWaveStream($stream)
+                $s.Speak($text)
+            } finally {
+                $s.SetOutputToDefaultAudioDevice()
+            }
+            Reply ('OK ' + $watch.ElapsedMilliseconds + ' ' + [Convert]::ToBase64String($stream.ToArray()))
+        }
+    } catch {
+        Reply ('ERR ' + ($_.Exception.Message -replace '\s+', ' '))
+    }
+}
+$s.Dispose()
+"""
+
+
+def _powershell_command(script):
+    encoded = base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+    return ["powershell", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass", "-EncodedCommand", encoded]
+
+
+# Moteur -> commande qui démarre un processus parlant le protocole
+ENGINES = {
+    "sapi": lambda: _powershell_command(SAPI_WORKER_SCRIPT.replace("__VOIX__", SAPI_VOICE)),
+    "stub": lambda: [sys.executable, __file__, "--stub"],
+}
+
+
+def encode_speak(text, rate=0, command="SPEAK"):
+    """Ligne de protocole SPEAK (ou RENDER) pour un texte"""
+    return f"{command} {int(rate)} {base64.b64encode(text.encode('utf-8')).decode('ascii')}\n"
+
+
+class ProcessusSynthese:
+    """Processus de synthèse vocale long, relancé s'il plante"""
+
+    def __init__(self, engine=SYNTHESIS_ENGINE, start_timeout=START_TIMEOUT):
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur de synthèse inconnu: {engine} (disponibles: {', '.join(ENGINES)})")
+        self.engine = engine
+        self.start_timeout = start_timeout
+        self.process = None
+        self.started = False
+        self.restarts = 0
+        self._busy = False
+        self._interrupted = False
+        self._lock = threading.Lock()
+
+    def _alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Démarre le processus et attend READY"""
+        start_time = time.perf_counter()
+        self.process = subprocess.Popen(
+            ENGINES[self.engine](),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", bufsize=1
+        )
+        ready = self._read_line(self.start_timeout)
+        if ready != "READY":
+            self._kill()
+            raise RuntimeError(f"Processus de synthèse '{self.engine}' non démarré (réponse: {ready!r})")
+        self.started = True
+        print(f"🗣️ Processus de synthèse '{self.engine}' prêt en {time.perf_counter() - start_time:.2f}s")
+
+    def _read_line(self, timeout):
+        """Lit une ligne de réponse, None si le processus meurt ou ne répond pas à temps"""
+        result = []
+        reader = threading.Thread(target=lambda: result.append(self.process.stdout.readline()), daemon=True)
+        reader.start()
+        reader.join(timeout)
+        if not result or not result[0]:
+            return None
+        return result[0].strip()
+
+    def _exited(self):
+        """Vrai si le processus s'est terminé (court délai : il vient peut-être de fermer sa sortie)"""
+        if self.process is None:
+            return True
+        try:
+            self.process.wait(timeout=0.5)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
+    def _kill(self):
+        if self.process is not None:
+            try:
+                self.process.kill()
+            except OSError:
+                pass
+            self.process = None
+
+    def _request(self, line, timeout):
+        if not self._alive():
+            if self.started:
+                self.restarts += 1
+                print(f"🔄 Processus de synthèse relancé ({self.restarts})")
+            self.start()
+        self.process.stdin.write(line)
+        self.process.stdin.flush()
+        reply = self._read_line(timeout)
+        if reply is None:
+            raise RuntimeError("Processus de synthèse sans réponse")
+        return reply
+
+    def _call(self, command, text, rate, timeout):
+        """Envoie une commande texte ; une seule relance si le processus a planté
+
+        Pas de relance après un délai dépassé : le processus vivant a pu
+        prononcer la phrase, la renvoyer la ferait entendre deux fois.
+        """
+        line = encode_speak(text, rate, command)
+        timeout = timeout or 30 + len(text) / 5
+        with self._lock:
+            self._busy, self._interrupted = True, False
+            try:
+                reply = self._request(line, timeout)
+            except (OSError, RuntimeError):
+                died = self._exited()
+                self._kill()
+                if self._interrupted:
+                    raise OperationAnnulee("Synthèse interrompue")
+                if not died:
+                    raise
+                try:
+                    reply = self._request(line, timeout)
+                except (OSError, RuntimeError):
+                    self._kill()
+                    raise
+            finally:
+                self._busy = False
+        if not reply.startswith("OK"):
+            raise RuntimeError(reply)
+        return reply.split()
+
+    def speak(self, text, rate=0, timeout=None):
+        """Prononce text (bloquant) ; retourne la durée de synthèse en secondes"""
+        return int(self._call("SPEAK", text, rate, timeout)[1]) / 1000
+
+    def render(self, text, rate=0, timeout=None):
+        """Synthétise text sans le jouer ; retourne (WAV en octets, durée de synthèse en secondes)"""
+        parts = self._call("RENDER", text, rate, timeout)
+        return base64.b64decode(parts[2]), int(parts[1]) / 1000
+
+    def interrupt(self):
+        """Coupe la phrase en cours de synthèse (appelé depuis un autre thread)
+
+        Le moteur ne lit pas son entrée pendant qu'il parle : le processus est
+        arrêté puis relancé en arrière-plan pour la phrase suivante.
+        """
+        process = self.process
+        if not self._busy or process is None:
+            return
+        self._interrupted = True
+        try:
+            process.kill()
+        except OSError:
+            pass
+        self.preload()
+
+    def preload(self):
+        """Démarre le processus en arrière-plan pour que la première phrase ne l'attende pas"""
+        def _preload():
+            try:
+                self.ping()
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️ Processus de synthèse '{self.engine}' indisponible: {e}")
+
+        threading.Thread(target=_preload, daemon=True).start()
+
+    def ping(self):
+        with self._lock:
+            return self._request("PING\n", 5) == "OK 0"
+
+    def close(self):
+        with self._lock:
+            if self._alive():
+                try:
+                    self.process.stdin.write("QUIT\n")
+                    self.process.stdin.flush()
+                    self.process.wait(timeout=2)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            self._kill()
+
+
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def get_synthese(engine=SYNTHESIS_ENGINE):
+    """Retourne le processus de synthèse partagé pour ce moteur (démarré au premier appel)"""
+    with _instances_lock:
+        synthese = _instances.get(engine)
+        if synthese is None:
+            synthese = ProcessusSynthese(engine)
+            _instances[engine] = synthese
+        return synthese
+
+
+def coqui_synthesize(tts, text):
+    """Synthèse Coqui en mémoire (tts.tts) ; retourne (échantillons float32, fréquence)"""
+    import numpy as np
+    samples = np.asarray(tts.tts(text=text), dtype=np.float32)
+    sample_rate = getattr(getattr(tts, "synthesizer", None), "output_sample_rate", None) or COQUI_SAMPLE_RATE
+    return samples, sample_rate
+
+
+def silence_wav(seconds, sample_rate=16000):
+    """WAV mono 16 bits de silence"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\0\0" * int(seconds * sample_rate))
+    return buffer.getvalue()
+
+
+def _run_stub():
+    """Moteur factice : respecte le protocole sans produire de son
+
+    Un texte "__plantage__" fait quitter le processus (test de la relance),
+    "__lent__" met 10 s à être prononcé (test de l'interruption).
+    RENDER renvoie un silence de 60 ms par caractère.
+    """
+    print("READY", flush=True)
+    for line in sys.stdin:
+        parts = line.strip().split(" ", 2)
+        if parts[0] == "QUIT":
+            break
+        if parts[0] == "PING":
+            print("OK 0", flush=True)
+        elif parts[0] in ("SPEAK", "RENDER") and len(parts) == 3:
+            text = base64.b64decode(parts[2]).decode("utf-8")
+            if text == "__plantage__":
+                sys.exit(1)
+            if text == "__lent__":
+                time.sleep(10)
+            if parts[0] == "RENDER":
+                print(f"OK 0 {base64.b64encode(silence_wav(len(text) * 0.06)).decode('ascii')}", flush=True)
+            else:
+                print("OK 0", flush=True)
+        else:
+            print(f"ERR commande inconnue: {parts[0]}", flush=True)
+
+
+if __name__ == "__main__" and "--stub" in sys.argv:
+    _run_stub()
@@ -16,7 +16,7 @@ def test_ai_features():
     assistant = AssistantVocal()
     
     # Désactiver TTS pour les tests
-    def mock_speak(text):
+    def mock_speak(text, wait=True):
         print(f"🔇 [Assistant]: {text}")
     
     assistant.speak = mock_speak
@@ -56,8 +56,11 @@ def test_ai_features():
     
     for cmd in ambiguous_commands:
         print(f"\n📝 Commande ambiguë: '{cmd}'")
-        analysis = assistant.ai_analyze_command(cmd)
-        print(f"   🤖 Analyse IA: {analysis}")
+        # Analyse structurée : intention + application + recherche en un seul appel
+        intent = assistant.ai_parse_intent(cmd)
+        print(f"   🧩 Intention structurée: {intent}")
+        if intent:
+            print(f"   🔧 Action: {assistant.intent_to_action(intent, cmd)}")
     
     print("\n" + "-" * 40)
     print("🧪 Test d'aide contextuelle:")
@@ -0,0 +1,72 @@
+"""
+Test de l'automate de mots-clés
+===============================
+
+Vérifie que l'automate reconnaît exactement les mêmes intentions que les
+tests `mot in commande`, l'ordre de priorité, et que le temps par commande ne
+dépend pas du nombre de mots-clés
+"""
+
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from automate_motscles import AutomateMotsCles
+
+TABLE = {
+    "arret": ['arrêt', 'stop', 'au revoir', 'fermer assistant', 'arrête toi'],
+    "silence": ['silence', 'tais-toi', 'chut'],
+    "aide": ['aide', 'help', 'comment', 'que puis-je', 'guide'],
+    "ouvrir": ["ouvre", "ouvrir", "lance", "lancer", "démarre", "démarrer", "exécute", "exécuter"],
+    "fermer": ["ferme", "fermer", "quitte", "quitter", "arrête", "arrêter", "termine", "terminer"],
+    "naviguer": ["va sur", "navigue", "visite", "site"]
+}
+
+def naive_match(table, command):
+    command_lower = command.lower()
+    return [intent for intent, keywords in table.items() if any(keyword in command_lower for keyword in keywords)]
+
+def test_same_matches_as_substring_search():
+    print("🧪 Test d'équivalence avec la recherche par sous-chaînes...")
+    automaton = AutomateMotsCles(TABLE)
+    commands = ["Ouvre Netflix", "ferme assistant", "arrête toi", "arrête chrome", "comment lancer vlc",
+                "va sur le site de la météo", "quelle heure est-il", "", "Chut !"]
+    for command in commands:
+        assert automaton.match(command) == naive_match(TABLE, command), command
+    assert automaton.first("arrête chrome") == "arret"  # 'arrêt' est prioritaire sur 'arrête'
+    assert automaton.first("quelle heure est-il") is None
+
+    random.seed(0)
+    alphabet = "abc "
+    for _ in range(200):
+        table = {f"intention {i}": ["".join(random.choice(alphabet) for _ in range(random.randint(1, 4)))
+                                    for _ in range(3)] for i in range(6)}
+        automaton.build(table)
+        for _ in range(20):
+            command = "".join(random.choice(alphabet) for _ in range(random.randint(0, 20)))
+            assert automaton.match(command) == naive_match(table, command), (table, command)
+    print("✅ Équivalence OK")
+
+def test_time_independent_of_keyword_count():
+    print("🧪 Test du temps par commande selon le nombre de mots-clés...")
+    command = "est-ce que tu peux ouvrir le lecteur de musique s'il te plaît"
+    random.seed(1)
+    for size in (50, 5000):
+        table = dict(TABLE)
+        for i in range(size // 10):
+            table[f"compétence {i}"] = ["".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8))
+                                        for _ in range(10)]
+        automaton = AutomateMotsCles(table)
+        for label, match in (("automate", automaton.match), ("sous-chaînes", lambda c: naive_match(table, c))):
+            start = time.perf_counter()
+            for _ in range(200):
+                match(command)
+            print(f"   {size:>5} mots-clés, {label:<12}: {(time.perf_counter() - start) / 200 * 1e6:.1f} µs par commande")
+        assert automaton.first(command) == "ouvrir"
+    print("✅ Temps mesuré")
+
+if __name__ == "__main__":
+    test_same_matches_as_substring_search()
+    test_time_independent_of_keyword_count()
@@ -0,0 +1,93 @@
+"""
+Test du cache audio des phrases fixes
+=====================================
+
+Clé de contenu, couches mémoire et disque, éviction LRU bornée en octets,
+rendu au premier usage par le moteur "stub" et temps d'accès à une phrase
+en cache
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from cache_audio import CacheAudio, audio_key
+from sortie_audio import SortieNulle
+from synthese_vocale import ProcessusSynthese, silence_wav
+
+def test_content_key():
+    print("🧪 Test de la clé de contenu...")
+    key = audio_key("Bonjour", "Hortense", 1, "sapi")
+    assert key == audio_key("Bonjour", "Hortense", 1, "sapi")
+    assert len({key, audio_key("Bonsoir", "Hortense", 1, "sapi"), audio_key("Bonjour", "Julie", 1, "sapi"),
+                audio_key("Bonjour", "Hortense", 2, "sapi"), audio_key("Bonjour", "Hortense", 1, "coqui")}) == 5
+    print("✅ Clé OK")
+
+def test_memory_and_disk_layers():
+    print("🧪 Test des couches mémoire et disque...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CacheAudio(directory)
+        wav = silence_wav(0.5)
+        assert cache.get("a") is None
+        cache.put("a", wav)
+        assert cache.get("a") == wav and cache.stats["hits_memoire"] == 1
+
+        reopened = CacheAudio(directory)  # Redémarrage : relu depuis le disque
+        assert reopened.get("a") == wav and reopened.stats["hits_disque"] == 1
+        assert reopened.get("a") == wav and reopened.stats["hits_memoire"] == 1
+    print("✅ Couches OK")
+
+def test_size_capped_lru():
+    print("🧪 Test de l'éviction LRU...")
+    with tempfile.TemporaryDirectory() as directory:
+        wav = silence_wav(0.25)  # ~8 Ko
+        cache = CacheAudio(directory, max_bytes=len(wav) * 3, memory_bytes=len(wav) * 2)
+        for key in "abc":
+            cache.put(key, wav)
+        cache.get("a")  # "b" devient la moins récemment utilisée
+        cache.put("d", wav)
+
+        assert cache.disk_size() <= len(wav) * 3
+        assert sorted(name[:-4] for name in os.listdir(directory)) == ["a", "c", "d"]
+        assert len(cache._memory) == 2
+        assert CacheAudio(directory).get("b") is None
+    print("✅ Éviction OK")
+
+def test_render_on_first_use_and_latency():
+    print("🧪 Test du rendu au premier usage...")
+    synthese = ProcessusSynthese("stub")
+    output = SortieNulle()
+    text = "Traitement terminé avec succès !"
+    renders = []
+
+    def render():
+        renders.append(text)
+        return synthese.render(text, rate=1)[0]
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CacheAudio(directory)
+        key = audio_key(text, "Hortense", 1, synthese.engine)
+        output.play_wav(cache.get_or_render(key, render))
+
+        start = time.perf_counter()
+        output.play_wav(cache.get_or_render(key, render))
+        memory_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        output.play_wav(CacheAudio(directory).get_or_render(key, render))
+        disk_ms = (time.perf_counter() - start) * 1000
+
+        print(f"   début de lecture: mémoire {memory_ms:.2f} ms, disque {disk_ms:.2f} ms")
+        assert renders == [text]  # Un seul rendu
+        assert abs(output.played[0] - len(text) * 0.06) < 0.01
+        assert memory_ms < 20 and disk_ms < 50
+    synthese.close()
+    print("✅ Rendu au premier usage OK")
+
+if __name__ == "__main__":
+    test_content_key()
+    test_memory_and_disk_layers()
+    test_size_capped_lru()
+    test_render_on_first_use_and_latency()
@@ -0,0 +1,66 @@
+"""
+Test du cache des réponses Mistral
+==================================
+
+Vérifie l'éviction LRU, l'expiration par TTL et la persistance SQLite
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from cache_reponses import ReponseCache, make_key
+
+def test_lru_eviction():
+    print("🧪 Test éviction LRU...")
+    cache = ReponseCache(max_entries=2, db_path=None)
+
+    cache.set("a", "réponse A")
+    cache.set("b", "réponse B")
+    cache.get("a")  # "a" devient la plus récente
+    cache.set("c", "réponse C")  # évince "b"
+
+    assert cache.get("a") == "réponse A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "réponse C"
+    print("✅ LRU OK")
+
+def test_ttl_expiration():
+    print("🧪 Test expiration TTL...")
+    cache = ReponseCache(db_path=None, ttl={"analyse": 0.05})
+
+    cache.set("cle", "ACTION_OUVRIR", "analyse")
+    assert cache.get("cle") == "ACTION_OUVRIR"
+    time.sleep(0.1)
+    assert cache.get("cle") is None
+    print("✅ TTL OK")
+
+def test_disk_persistence():
+    print("🧪 Test persistance disque...")
+    db_path = os.path.join(tempfile.mkdtemp(), "cache_test.sqlite")
+    key = make_key("mistral:instruct", "ouvre Netflix")
+
+    ReponseCache(db_path=db_path).set(key, "4df9e0f8.netflix", "recherche_app")
+
+    cache = ReponseCache(db_path=db_path)  # Simule un redémarrage
+    assert cache.get(key) == "4df9e0f8.netflix"
+    assert cache.stats["hits_disque"] == 1
+    assert cache.get(key) == "4df9e0f8.netflix"
+    assert cache.stats["hits_memoire"] == 1
+    cache.print_stats()
+    print("✅ Persistance OK")
+
+def test_key_depends_on_options():
+    print("🧪 Test clé de cache...")
+    assert make_key("mistral", "p") == make_key("mistral", "p", {})
+    assert make_key("mistral", "p") != make_key("mistral", "p", {"temperature": 0})
+    assert make_key("mistral", "p") != make_key("llama2", "p")
+    print("✅ Clés OK")
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_ttl_expiration()
+    test_disk_persistence()
+    test_key_depends_on_options()
@@ -0,0 +1,129 @@
+"""
+Test de la capture micro en tampon circulaire
+=============================================
+
+Faux micro qui rend des trames numérotées (ou une phrase de synthèse) :
+micro ouvert une seule fois, vues sans copie, lecteurs indépendants, retour
+au direct, tampon qui fait le tour, et commande enchaînée après le mot de
+réveil sans trame perdue
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from capture_audio import CaptureMicro
+from fin_de_phrase import DetecteurFinDePhrase
+from fixtures_audio import SAMPLE_RATE, to_pcm16, utterance
+from mot_reveil import DetecteurMotReveil
+
+CHUNK = 512
+
+class FakeSource:
+    CHUNK = CHUNK
+    SAMPLE_RATE = SAMPLE_RATE
+    SAMPLE_WIDTH = 2
+
+    def __init__(self, frames, pace):
+        self.frames = frames
+        self.pace = pace
+        self.stream = self
+        self.count = 0
+
+    def read(self, size):
+        time.sleep(self.pace)
+        self.count += 1
+        if self.frames:
+            return self.frames.pop(0)
+        return np.full(CHUNK, self.count, dtype="<i2").tobytes()  # Trames numérotées
+
+class FakeMicrophone:
+    def __init__(self, frames=None, pace=0.001):
+        self.source = FakeSource(list(frames or []), pace)
+        self.opened = 0
+        self.closed = 0
+
+    def __enter__(self):
+        self.opened += 1
+        return self.source
+
+    def __exit__(self, *args):
+        self.closed += 1
+
+def number(frame):
+    return int(np.frombuffer(frame, dtype="<i2")[0])
+
+def test_readers_and_zero_copy():
+    print("🧪 Test des lecteurs et des vues sans copie...")
+    microphone = FakeMicrophone()
+    capture = CaptureMicro(microphone, seconds=5).start()
+    wake_word, barge_in = capture.reader(), capture.reader()
+
+    first = [wake_word.read(CHUNK) for _ in range(10)]
+    assert all(isinstance(frame, memoryview) and frame.obj is capture.buffer for frame in first)
+    following = [number(wake_word.read(CHUNK)) for _ in range(10)]
+    numbers = [number(frame) for frame in first] + following
+    assert numbers == list(range(numbers[0], numbers[0] + 20))  # Aucune trame perdue entre deux lectures
+
+    time.sleep(0.05)
+    assert number(barge_in.read(CHUNK)) == numbers[0]  # Lecteur indépendant, parti de sa propre position
+    with barge_in as source:
+        assert number(source.stream.read(CHUNK)) > numbers[-1]  # "with" repart du direct
+    position = wake_word.position
+    wake_word.skip_to(position - 5)
+    assert wake_word.position == position  # Jamais en arrière
+    assert len(wake_word.history(0.5)) == int(0.5 * SAMPLE_RATE / CHUNK) * CHUNK * 2
+
+    capture.stop()
+    assert microphone.opened == 1 and microphone.closed == 1
+    wake_word.skip_to_live()
+    try:
+        wake_word.read(CHUNK)
+        assert False, "lecture après l'arrêt"
+    except OSError:
+        pass
+    print("✅ Lecteurs et vues OK")
+
+def test_overrun():
+    print("🧪 Test du tampon qui fait le tour...")
+    capture = CaptureMicro(FakeMicrophone(pace=0.0005), seconds=0.5).start()  # 15 trames
+    reader = capture.reader()
+    time.sleep(0.1)
+    frame = number(reader.read(CHUNK))
+    assert reader.lost_frames >= capture.frame_count - 1
+    assert number(reader.read(CHUNK)) == frame + 1
+    capture.stop()
+    print(f"   {reader.lost_frames} trames perdues par un lecteur en retard, signalées")
+    print("✅ Tampon circulaire OK")
+
+def test_command_right_after_wake_word():
+    print("🧪 Test de la commande enchaînée après le mot de réveil...")
+    wake_word = "a s i s t an"
+    detector = DetecteurMotReveil([(utterance([wake_word], seed=s)[0], SAMPLE_RATE) for s in range(3)])
+    samples, bounds = utterance([wake_word, "u v r", "k r o m"], seed=42, pause=0.15, tail=1.5)
+    pcm = to_pcm16(samples)
+    frames = [pcm[start:start + CHUNK * 2] for start in range(0, len(pcm), CHUNK * 2)]
+    capture = CaptureMicro(FakeMicrophone(frames, pace=0.002)).start()
+    source = capture.reader()
+
+    while not detector.feed(source.stream.read(source.CHUNK)):
+        pass
+    detected = source.position * CHUNK / SAMPLE_RATE
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE, history=source.history(1.0))
+    while not endpoint.feed(source.stream.read(source.CHUNK)):
+        pass
+    capture.stop()
+
+    recorded_from = source.position * CHUNK / SAMPLE_RATE - len(endpoint.audio) / 2 / SAMPLE_RATE
+    print(f"   mot détecté à {detected:.2f}s, commande de {bounds[1][0]:.2f}s à {bounds[2][1]:.2f}s, "
+          f"enregistrée à partir de {recorded_from:.2f}s")
+    assert endpoint.reason == "silence" and recorded_from <= bounds[1][0]  # Début de "ouvre" compris
+    print("✅ Commande enchaînée OK")
+
+if __name__ == "__main__":
+    test_readers_and_zero_copy()
+    test_overrun()
+    test_command_right_after_wake_word()
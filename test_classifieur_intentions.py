@@ -0,0 +1,62 @@
+"""
+Test du classifieur d'intentions hors ligne
+===========================================
+
+Vérifie les prédictions sur des commandes hors corpus, les probabilités, la
+prise en compte du journal des commandes et la latence de prédiction
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+
+from classifieur_intentions import ClassifieurIntentions, load_examples, log_command
+
+def test_predictions():
+    print("🧪 Test des prédictions...")
+    classifier = ClassifieurIntentions.from_files(journal_path=None)
+    for command, expected in [("quelle est la capitale du japon", "question"),
+                              ("quels logiciels sont installés", "lister_applications"),
+                              ("fais une recherche sur les dinosaures", "rechercher_web"),
+                              ("ferme moi spotify tout de suite", "fermer_application"),
+                              ("lance-moi un film ce soir", "ouvrir_application")]:
+        intention, probability = classifier.predict(command)
+        print(f"   '{command}' → {intention} ({probability:.2f})")
+        assert intention == expected
+
+    probabilities = classifier.probabilities("bonjour")
+    assert abs(float(probabilities.sum()) - 1) < 1e-5 and np.all(probabilities > 0)
+    print("✅ Prédictions OK")
+
+def test_journal_examples():
+    print("🧪 Test du journal des commandes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = os.path.join(tmp, "journal.jsonl")
+        corpus_size = len(load_examples(journal_path=None))
+
+        log_command("balance-moi du jazz", "ouvrir_application", "ia", journal)
+        log_command("commande inconnue", "intention inconnue", "ia", journal)  # Ignorée
+        examples = load_examples(journal_path=journal)
+        assert len(examples) == corpus_size + 1
+        assert examples[-1] == ("balance-moi du jazz", "ouvrir_application")
+    print("✅ Journal OK")
+
+def test_prediction_latency():
+    print("🧪 Test de la latence de prédiction...")
+    classifier = ClassifieurIntentions.from_files(journal_path=None)
+    start = time.perf_counter()
+    for _ in range(500):
+        classifier.predict("est-ce que tu pourrais me mettre un film ce soir")
+    duration_ms = (time.perf_counter() - start) / 500 * 1000
+    print(f"   {duration_ms:.3f} ms par prédiction")
+    assert duration_ms < 1
+    print("✅ Latence OK")
+
+if __name__ == "__main__":
+    test_predictions()
+    test_journal_examples()
+    test_prediction_latency()
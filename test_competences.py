@@ -0,0 +1,102 @@
+"""
+Test des compétences locales
+============================
+
+Vérifie les réponses heure / date / calcul / conversion, le refus des
+expressions dangereuses, le renvoi au LLM des questions hors compétence et
+le temps de réponse
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+sys.path.append(os.path.dirname(__file__))
+
+from competences import (Competence, CompetenceCalcul, CompetenceConversion, CompetenceDate,
+                         CompetenceHeure, MoteurCompetences)
+
+NOW = datetime(2026, 10, 18, 9, 5)
+
+def moteur():
+    return MoteurCompetences([CompetenceHeure(lambda: NOW), CompetenceDate(lambda: NOW),
+                              CompetenceConversion(), CompetenceCalcul()])
+
+def test_time_and_date():
+    print("🧪 Test heure et date...")
+    skills = moteur()
+    assert skills.repondre("quelle heure est-il ?") == ("heure", "Il est 9 heures 05.")
+    assert skills.repondre("quel jour on est") == ("date", "Nous sommes le dimanche 18 octobre 2026.")
+    assert skills.repondre("à quelle heure ferme la poste") is None
+    assert skills.repondre("la date de la révolution française") is None
+    assert skills.repondre("quelle est la date de la révolution française") is None
+    assert skills.repondre("quelle heure est-il à Tokyo") is None
+    assert skills.repondre("quelle est la date d'aujourd'hui ?") == ("date", "Nous sommes le dimanche 18 octobre 2026.")
+    assert skills.repondre("dis-moi quelle heure il est maintenant") == ("heure", "Il est 9 heures 05.")
+    print("✅ Heure et date OK")
+
+def test_arithmetic():
+    print("🧪 Test du calcul...")
+    skills = moteur()
+    for command, expected in [("combien font 12 fois 7", "12 fois 7 font 84."),
+                              ("calcule 3,5 plus 2", "3,5 plus 2 font 5,5."),
+                              ("combien font (2 plus 3) fois 4", "(2 plus 3) fois 4 font 20."),
+                              ("combien fait 2 puissance 10", "2 puissance 10 font 1024."),
+                              ("racine carrée de 16", "Le résultat est 4."),
+                              ("20 % de 150", "Le résultat est 30."),
+                              ("20 pour cent de 150", "Le résultat est 30."),
+                              ("combien font 3 x 4", "3 x 4 font 12."),
+                              ("combien font 10 divisé par 0", "Division par zéro impossible.")]:
+        assert skills.repondre(command) == ("calcul", expected), (command, skills.repondre(command))
+
+    calculator = CompetenceCalcul()
+    assert calculator.repondre("2 puissance 99999") is None  # Exposant borné
+    assert calculator.repondre("combien font (99**99)**99") is None  # Résultat borné
+    assert "calcul" not in skills.automate.match("lance la xbox")  # "x" seul ne déclenche plus le calcul
+    for dangerous in ["__import__('os').system('dir')", "(1).__class__", "[1] * 3", "abs(-1)"]:
+        try:
+            calculator.evaluer(dangerous)
+            assert False, dangerous
+        except (ValueError, SyntaxError):
+            pass
+    assert skills.repondre("je ne veux plus de musique") is None
+    print("✅ Calcul OK")
+
+def test_unit_conversion():
+    print("🧪 Test des conversions...")
+    skills = moteur()
+    assert skills.repondre("convertis 10 kilomètres en miles") == ("conversion", "10 kilomètres font 6,2137 miles.")
+    assert skills.repondre("100 degrés fahrenheit en celsius")[1] == "100 degrés fahrenheit font 37,7778 degrés celsius."
+    assert skills.repondre("2 heures en minutes")[1] == "2 heures font 120 minutes."
+    assert skills.repondre("10 litres en kilomètres")[1] == "Impossible de convertir des litres en kilomètres."
+    assert skills.repondre("ouvre netflix en plein écran") is None
+    print("✅ Conversions OK")
+
+def test_pluggable_skill_and_latency():
+    print("🧪 Test d'ajout de compétence et du temps de réponse...")
+    class CompetenceMeteo(Competence):
+        nom = "météo"
+        mots_cles = ["météo"]
+
+        def repondre(self, commande):
+            return "Il fait beau."
+
+    skills = moteur()
+    skills.ajouter(CompetenceMeteo())
+    assert skills.repondre("quelle est la météo") == ("météo", "Il fait beau.")
+
+    commands = ["quelle heure est-il", "combien font 12 fois 7", "5 kg en livres", "qui a écrit les misérables"]
+    start = time.perf_counter()
+    for _ in range(200):
+        for command in commands:
+            skills.repondre(command)
+    duration_ms = (time.perf_counter() - start) / (200 * len(commands)) * 1000
+    print(f"   {duration_ms:.3f} ms par commande")
+    assert duration_ms < 10
+    print("✅ Compétences OK")
+
+if __name__ == "__main__":
+    test_time_and_date()
+    test_arithmetic()
+    test_unit_conversion()
+    test_pluggable_skill_and_latency()
@@ -0,0 +1,80 @@
+"""
+Test de la détection d'activité vocale
+======================================
+
+Phrases de synthèse (fixtures_audio) contre bruits qui dépassent un seuil
+d'énergie fixe : ventilateur, ventilateur qui accélère, claquements,
+ronflement grave, porte. Compte les reconnaissances évitées et le temps
+d'analyse d'un segment
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from detection_voix import DetecteurActiviteVocale, frame_features, pcm_to_float
+from fixtures_audio import SAMPLE_RATE, background_noise, to_pcm16, utterance
+
+def noises():
+    rng = np.random.default_rng(0)
+    n = 2 * SAMPLE_RATE
+    clicks = background_noise(2, 0.005)
+    for start in range(0, n, int(0.3 * SAMPLE_RATE)):
+        clicks[start:start + 80] += 0.8 * np.exp(-np.arange(80) / 10)
+    door = background_noise(2, 0.005)
+    door[SAMPLE_RATE:SAMPLE_RATE + 2400] += 0.3 * rng.standard_normal(2400) * np.exp(-np.arange(2400) / 800)
+    return {
+        "ventilateur": background_noise(2, 0.05),
+        "ventilateur qui accélère": background_noise(2, 0.01) * np.linspace(1, 10, n),
+        "claquements": clicks,
+        "ronflement": np.sin(2 * np.pi * 100 * np.arange(n) / SAMPLE_RATE) * np.linspace(0.01, 0.3, n),
+        "porte": door,
+    }
+
+def test_frame_features():
+    print("🧪 Test des caractéristiques par trame...")
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    rms, zcr, flatness = frame_features(0.5 * np.sin(2 * np.pi * 200 * t), SAMPLE_RATE)
+    assert len(rms) == 50 and np.allclose(rms, 0.5 / np.sqrt(2), atol=1e-3)
+    assert np.allclose(zcr, 400 / SAMPLE_RATE, atol=0.01) and flatness.max() < 0.01
+    _, _, noise_flatness = frame_features(np.random.default_rng(0).standard_normal(SAMPLE_RATE), SAMPLE_RATE)
+    assert noise_flatness.mean() > 0.4
+    assert np.allclose(pcm_to_float(to_pcm16(np.array([0.5, -0.5]))), [0.5, -0.5], atol=1e-4)
+    print("✅ Caractéristiques OK")
+
+def test_speech_versus_noise():
+    print("🧪 Test parole / bruit...")
+    vad = DetecteurActiviteVocale()
+    for seed, words in enumerate([["a s i s t an"], ["u v r", "k r o m"], ["k e l", "eu r"], ["o"]]):
+        samples, _ = utterance(words, seed=seed)
+        assert vad.is_speech(to_pcm16(samples), SAMPLE_RATE), words
+    for name, samples in noises().items():
+        assert not vad.is_speech(to_pcm16(samples), SAMPLE_RATE), name
+    assert vad.stats == {"segments": 9, "rejetes": 5}
+    vad.print_stats()
+    print("✅ Parole / bruit OK")
+
+def test_without_flatness_and_speed():
+    print("🧪 Test sans platitude spectrale et temps d'analyse...")
+    vad = DetecteurActiviteVocale(use_flatness=False)
+    samples, _ = utterance(["a s i s t an", "u v r", "k r o m"], seed=9)
+    assert vad.is_speech(samples, SAMPLE_RATE)
+    assert not vad.is_speech(noises()["ventilateur"], SAMPLE_RATE)
+
+    vad = DetecteurActiviteVocale()
+    pcm = to_pcm16(np.tile(samples, 3))  # ~9 s
+    start = time.perf_counter()
+    for _ in range(20):
+        vad.is_speech(pcm, SAMPLE_RATE)
+    duration_ms = (time.perf_counter() - start) / 20 * 1000
+    print(f"   {duration_ms:.2f} ms pour {len(pcm) / 2 / SAMPLE_RATE:.1f}s d'audio")
+    assert duration_ms < 50
+    print("✅ Sans platitude et temps OK")
+
+if __name__ == "__main__":
+    test_frame_features()
+    test_speech_versus_noise()
+    test_without_flatness_and_speed()
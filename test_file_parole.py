@@ -0,0 +1,82 @@
+"""
+Test de la file de parole asynchrone
+====================================
+
+Avec une synthèse factice de 50 ms par phrase : dépôt non bloquant, ordre
+conservé, traitement en parallèle de la parole, wait/flush et erreurs
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from file_parole import FileParole
+
+PHRASE_SECONDS = 0.05
+
+def fake_speaker(spoken):
+    def speak(text):
+        if text == "__erreur__":
+            raise RuntimeError("synthèse en panne")
+        time.sleep(PHRASE_SECONDS)
+        spoken.append(text)
+        return True
+    return speak
+
+def test_non_blocking_and_ordered():
+    print("🧪 Test du dépôt non bloquant...")
+    spoken = []
+    parole = FileParole(fake_speaker(spoken))
+
+    start = time.perf_counter()
+    for text in ["Compris !", "Action détectée.", "Netflix est ouvert."]:
+        parole.put(text)
+    queued_ms = (time.perf_counter() - start) * 1000
+
+    time.sleep(PHRASE_SECONDS)  # "Traitement" pendant que les phrases sont prononcées
+    parole.wait()
+    total = time.perf_counter() - start
+    print(f"   dépôt {queued_ms:.2f} ms, total {total:.2f}s (séquentiel: {PHRASE_SECONDS * 4:.2f}s)")
+
+    assert queued_ms < PHRASE_SECONDS * 1000
+    assert spoken == ["Compris !", "Action détectée.", "Netflix est ouvert."]
+    assert total < PHRASE_SECONDS * 4  # Le traitement a recouvert la parole
+    assert parole.pending() == 0
+    parole.close()
+    print("✅ Dépôt non bloquant OK")
+
+def test_wait_for_one_phrase():
+    print("🧪 Test de l'attente d'une phrase...")
+    spoken = []
+    parole = FileParole(fake_speaker(spoken))
+    parole.put("Première")
+    enonce = parole.put("Deuxième")
+    assert enonce.wait() is True
+    assert spoken == ["Première", "Deuxième"]
+    parole.close()
+    print("✅ Attente OK")
+
+def test_flush_and_errors():
+    print("🧪 Test de flush et des erreurs...")
+    spoken = []
+    parole = FileParole(fake_speaker(spoken))
+
+    assert parole.put("__erreur__").wait() is False  # Le thread survit à l'erreur
+    parole.put("En cours")
+    time.sleep(PHRASE_SECONDS / 2)
+    dropped = [parole.put(f"Abandonnée {i}") for i in range(3)]
+    assert parole.flush() == 3
+    assert all(enonce.done.is_set() and enonce.result is False for enonce in dropped)
+    parole.wait()
+    assert spoken == ["En cours"]
+
+    parole.put("Après flush")
+    parole.close()  # Les phrases déjà déposées sont prononcées avant l'arrêt
+    assert spoken == ["En cours", "Après flush"]
+    print("✅ Flush et erreurs OK")
+
+if __name__ == "__main__":
+    test_non_blocking_and_ordered()
+    test_wait_for_one_phrase()
+    test_flush_and_errors()
@@ -0,0 +1,94 @@
+"""
+Test de la détection adaptative de fin de phrase
+================================================
+
+Phrases de synthèse (fixtures_audio) rejouées par morceaux de 32 ms :
+commande courte, longue question avec pauses, fin anticipée sur une
+commande complète, transcription périmée quand la parole reprend, bruit seul
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from fin_de_phrase import MAX_SILENCE, DetecteurFinDePhrase
+from fixtures_audio import SAMPLE_RATE, background_noise, to_pcm16, utterance
+
+CHUNK = 1024  # octets : 512 échantillons de 16 bits
+
+def replay(endpoint, samples, pace=0.0):
+    """Instant (s) où la fin de phrase est décidée, ou None"""
+    pcm = to_pcm16(samples)
+    for start in range(0, len(pcm), CHUNK):
+        if endpoint.feed(pcm[start:start + CHUNK]):
+            return (start + CHUNK) / 2 / SAMPLE_RATE
+        time.sleep(pace)
+    return None
+
+def test_short_command_and_long_question():
+    print("🧪 Test commande courte et longue question...")
+    samples, bounds = utterance(["u v r", "k r o m"], seed=3, tail=2.0)
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE)
+    delay = replay(endpoint, samples) - bounds[-1][1]
+    print(f"   commande courte : fin {delay * 1000:.0f} ms après la parole")
+    assert endpoint.reason == "silence" and 0.25 < delay < 0.6
+
+    # Hésitation de 450 ms au milieu de la question : plus courte que le silence exigé après 1.5 s de parole
+    first, _ = utterance(["k e l", "è", "l a", "k a p i t a l"], seed=4, tail=0.45)
+    rest, bounds = utterance(["d y", "k a n a d a", "e", "k o m b i a n", "d a b i t an"], seed=8, lead=0.0, tail=2.0)
+    samples = np.concatenate([first, rest])
+    offset = len(first) / SAMPLE_RATE
+    bounds = [(start + offset, end + offset) for start, end in bounds]
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE)
+    end = replay(endpoint, samples)
+    print(f"   longue question : fin {(end - bounds[-1][1]) * 1000:.0f} ms après le dernier mot")
+    assert end > bounds[-1][1] and end - bounds[-1][1] <= MAX_SILENCE + 0.1
+    assert len(endpoint.audio) / 2 / SAMPLE_RATE > bounds[-1][1] - offset  # Pas coupée à l'hésitation
+    print("✅ Commande courte et longue question OK")
+
+def test_early_commit_on_complete_command():
+    print("🧪 Test de la fin anticipée...")
+    samples, bounds = utterance(["u v r", "k r o m"], seed=5, pause=0.1, tail=2.0)
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE, transcribe=lambda pcm: "ouvre chrome",
+                                    is_complete=lambda text: "chrome" in text)
+    delay = replay(endpoint, samples, pace=0.002) - bounds[-1][1]
+    pcm, transcript = endpoint.result()
+    print(f"   fin {delay * 1000:.0f} ms après la parole ({endpoint.reason})")
+    assert endpoint.reason == "commande complète" and transcript == "ouvre chrome"
+    assert delay < 0.35 and pcm
+    print("✅ Fin anticipée OK")
+
+def test_stale_transcription_is_dropped():
+    print("🧪 Test de la transcription périmée...")
+    calls = []
+
+    def transcribe(pcm):
+        calls.append(len(pcm))
+        return "ouvre" if len(calls) == 1 else "ouvre chrome"
+
+    samples, _ = utterance(["u v r", "k r o m"], seed=6, tail=2.0)
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE, transcribe=transcribe, is_complete=lambda text: False)
+    replay(endpoint, samples, pace=0.002)
+    pcm, transcript = endpoint.result()
+    assert endpoint.reason == "silence" and len(calls) == 2 and calls[0] < calls[1] <= len(pcm)
+    assert transcript == "ouvre chrome"  # La transcription de "ouvre" seul n'est pas reprise
+    print("✅ Transcription périmée OK")
+
+def test_noise_and_max_duration():
+    print("🧪 Test du bruit seul et de la durée maximale...")
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE)
+    assert replay(endpoint, background_noise(3, 0.05)) is None and not endpoint.started
+
+    samples, _ = utterance(["a s i s t an"] * 6, seed=7, pause=0.05)
+    endpoint = DetecteurFinDePhrase(SAMPLE_RATE, max_seconds=1.0)
+    assert replay(endpoint, samples) is not None and endpoint.reason == "durée max"
+    print("✅ Bruit et durée maximale OK")
+
+if __name__ == "__main__":
+    test_short_command_and_long_question()
+    test_early_commit_on_complete_command()
+    test_stale_transcription_is_dropped()
+    test_noise_and_max_duration()
@@ -0,0 +1,165 @@
+"""
+Test de l'index du catalogue d'applications
+===========================================
+
+Vérifie les recherches de l'index sur le catalogue scanné, le classement par
+trigrammes, les mises à jour incrémentales et que le temps de recherche reste
+stable quand le catalogue grossit
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(__file__))
+
+import index_applications
+from index_applications import CatalogueIndex
+
+def load_catalog():
+    """Charge applications_assistant.json au format interne de l'assistant"""
+    return index_applications.load_catalog(os.path.join(os.path.dirname(__file__), "applications_assistant.json"))
+
+def synthetic_catalog(size):
+    """Catalogue artificiel de size applications"""
+    applications = {}
+    app_commands_map = {}
+    for i in range(size):
+        app_key = f"application {i} outil"
+        applications[app_key] = {"nom": f"Application {i} Outil", "chemin": f"app{i}.exe", "processus": f"app{i}.exe"}
+        app_commands_map[app_key] = app_key
+        app_commands_map[f"app{i}"] = app_key
+    return applications, app_commands_map
+
+def test_lookups():
+    print("🧪 Test des recherches de l'index...")
+    applications, app_commands_map = load_catalog()
+    index = CatalogueIndex(applications, app_commands_map)
+
+    assert index.exact_command("audacity") == "audacity"
+    assert index.exact_command("application inexistante") is None
+
+    command = index.command_containing("docker desktop")
+    assert app_commands_map[command] == "docker desktop"
+
+    app_key, keyword, exact = index.specific_mapping("netflix")
+    print(f"   netflix → {app_key} (exacte: {exact})")
+
+    assert index.first_contained_in("ferme docker desktop") == "docker desktop"
+    assert index.phonetic_match("discorde")[0] == "discord"
+    assert index.phonetic_match("vé elle cé")[0] == "vlc"
+    print("✅ Recherches OK")
+
+def test_fuzzy_ranking():
+    print("🧪 Test du classement par trigrammes...")
+    applications, app_commands_map = load_catalog()
+    index = CatalogueIndex(applications, app_commands_map)
+
+    for query, expected in [("discorde", "discord"), ("visual studio", "visual studio code"), ("netflx", "netflix")]:
+        matches = index.fuzzy_matches(query, k=3)
+        print(f"   '{query}' → {[(key, round(score, 2)) for key, score in matches]}")
+        assert matches[0][0] == expected
+        assert [score for _, score in matches] == sorted((score for _, score in matches), reverse=True)
+
+    assert index.fuzzy_matches("zzzzzz") == []
+    print("✅ Classement OK")
+
+def test_retrieval():
+    print("🧪 Test de la présélection pour le prompt IA...")
+    applications, app_commands_map = load_catalog()
+    index = CatalogueIndex(applications, app_commands_map)
+
+    for query, expected in [("je veux que tu ouvres netflix", "netflix"), ("ouvre discorde", "discord"),
+                            ("lance visual studio", "visual studio code"), ("démarre docker", "docker desktop")]:
+        retrieved = [key for key, _ in index.retrieve(query, k=10)]
+        print(f"   '{query}' → {retrieved[:3]}")
+        assert expected in retrieved
+        assert len(retrieved) <= 10
+
+    # Noms accentués : les tokens sont normalisés comme les mots de la requête
+    index.add_application("ms-settings", {"nom": "Paramètres", "chemin": "ms-settings:", "processus": "SystemSettings.exe"},
+                          ["réglages système"])
+    assert "ms-settings" in index.tokens["parametres"] and "ms-settings" in index.tokens["reglages"]
+    assert index.retrieve("ouvre les paramètres", k=3)[0][0] == "ms-settings"
+    assert "ms-settings" in [key for key, _ in index.retrieve("les réglages", k=3)]
+
+    popular = index.popular_apps(["netflix", "chrome", "vlc", "application inexistante"])
+    assert popular[:3] == ["netflix", "google chrome", "vlc media player"]
+    print("✅ Présélection OK")
+
+def test_incremental_update():
+    print("🧪 Test des mises à jour incrémentales...")
+    index = CatalogueIndex(*synthetic_catalog(100))
+
+    index.add_application("spotify", {"nom": "Spotify", "chemin": "spotify.exe", "processus": "Spotify.exe"}, ["spotify", "musique"])
+    assert index.exact_command("musique") == "spotify"
+    assert index.fuzzy_matches("spotifi")[0][0] == "spotify"
+
+    index.remove_application("spotify")
+    assert index.exact_command("musique") is None
+    assert "spotify" not in index.tokens["musique"] and "spotify" not in index.tokens_by_app
+    assert all(key != "spotify" for key, _ in index.fuzzy_matches("spotifi"))
+
+    for i in range(80):  # Force le compactage de l'index des trigrammes
+        index.remove_application(f"application {i} outil")
+    assert index.fuzzy.dead_rows < len(index.fuzzy.row_alive) // 2  # Compactage fait
+    assert index.fuzzy_matches("application 90 outil")[0][0] == "application 90 outil"
+    print("✅ Mises à jour OK")
+
+def test_rescan_matches_rebuild():
+    print("🧪 Test d'un nouveau scan appliqué application par application...")
+    applications, app_commands_map = load_catalog()
+    start = time.perf_counter()
+    index = CatalogueIndex(dict(applications), dict(app_commands_map))
+    build_time = time.perf_counter() - start
+
+    commands_by_app = {}
+    for command, app_key in app_commands_map.items():
+        commands_by_app.setdefault(app_key, []).append(command)
+    rank = index.app_rank["netflix"]
+    start = time.perf_counter()
+    for app_key, app_data in applications.items():  # Scan qui touche toutes les applications
+        index.add_application(app_key, dict(app_data), commands_by_app.get(app_key, []))
+    update_time = time.perf_counter() - start
+    print(f"   reconstruction {build_time * 1000:.0f} ms, mise à jour de {len(applications)} applications "
+          f"{update_time * 1000:.0f} ms")
+
+    fresh = CatalogueIndex(dict(applications), dict(app_commands_map))
+    assert index.app_rank["netflix"] == rank  # Une application modifiée garde son rang
+    assert list(index.applications) == list(fresh.applications)
+    assert index.specific_matches == fresh.specific_matches
+    assert sorted(index.app_rank, key=index.app_rank.get) == sorted(fresh.app_rank, key=fresh.app_rank.get)
+    assert len(set(index.app_rank.values())) == len(index.app_rank)  # Aucun rang en double
+    assert update_time < build_time * 5
+    print("✅ Nouveau scan OK")
+
+def test_lookup_time_by_catalog_size():
+    print("🧪 Test du temps de recherche selon la taille du catalogue...")
+    queries = ["application 42 outil", "outil inconnu", "app123", "zzzzzz"]
+
+    durations = []
+    for size in (1000, 10000):
+        index = CatalogueIndex(*synthetic_catalog(size))
+        runs = []
+        for _ in range(3):  # Meilleure de trois mesures, moins sensible à la charge de la machine
+            start = time.perf_counter()
+            for _ in range(50):
+                for query in queries:
+                    index.exact_command(query)
+                    index.command_containing(query)
+                    index.fuzzy_matches(query)
+            runs.append((time.perf_counter() - start) / (50 * len(queries)) * 1000)
+        durations.append(min(runs))
+        print(f"   {size:>6} applications: {durations[-1]:.3f} ms par requête")
+
+    # Dictionnaires en temps constant, trigrammes vectorisés : 10 fois plus d'applications coûtent bien moins de 10 fois plus
+    assert durations[1] < durations[0] * 8, f"{durations[1] / durations[0]:.1f}x plus lent pour 10x plus d'applications"
+    assert durations[1] < 5.0
+    print("✅ Temps de recherche OK")
+
+if __name__ == "__main__":
+    test_lookups()
+    test_fuzzy_ranking()
+    test_retrieval()
+    test_incremental_update()
+    test_rescan_matches_rebuild()
+    test_lookup_time_by_catalog_size()
@@ -0,0 +1,183 @@
+"""
+Test de l'interruption vocale (barge-in)
+========================================
+
+Micro simulé (trames PCM synthétiques) : jeton d'annulation, détection de
+parole et temps de réaction, enregistrement de la nouvelle phrase, arrêt de
+la sortie audio, du processus de synthèse et du pipeline
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+
+from interruption import DetecteurParole, EcouteInterruption, JetonAnnulation, NiveauEcho, OperationAnnulee, frame_rms
+from pipeline_synthese import PipelineSynthese
+from sortie_audio import SortieNulle
+from synthese_vocale import ProcessusSynthese
+
+RATE = 16000
+CHUNK = 512  # 32 ms
+
+def frame(amplitude):
+    t = np.arange(CHUNK) / RATE
+    return (amplitude * np.sin(2 * np.pi * 200 * t)).astype("<i2").tobytes()
+
+class FakeSource:
+    CHUNK = CHUNK
+    SAMPLE_RATE = RATE
+    SAMPLE_WIDTH = 2
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.stream = self
+
+    def read(self, size):
+        time.sleep(CHUNK / RATE)  # Rythme d'une vraie carte son
+        return self.frames.pop(0) if self.frames else frame(0)
+
+class FakeMicrophone:
+    def __init__(self, frames):
+        self.source = FakeSource(frames)
+
+    def __enter__(self):
+        return self.source
+
+    def __exit__(self, *args):
+        pass
+
+def test_token():
+    print("🧪 Test du jeton d'annulation...")
+    token = JetonAnnulation()
+    calls = []
+    token.on_cancel(lambda: calls.append("sortie"))
+    token.on_cancel(lambda: 1 / 0)  # Une erreur n'empêche pas les autres étages de s'arrêter
+    token.on_cancel(lambda: calls.append("flux"))
+    token.check()
+    token.cancel()
+    token.cancel()
+    assert calls == ["sortie", "flux"] and token.cancelled
+    token.on_cancel(lambda: calls.append("tardif"))  # Déjà annulé : appel immédiat
+    assert calls[-1] == "tardif"
+    try:
+        token.check()
+        assert False
+    except OperationAnnulee:
+        pass
+    print("✅ Jeton OK")
+
+def test_detector():
+    print("🧪 Test du détecteur d'énergie...")
+    assert frame_rms(frame(0)) == 0 and abs(frame_rms(frame(1000)) - 1000 / np.sqrt(2)) < 20
+    detector = DetecteurParole(threshold=500, min_frames=3)
+    results = [detector.feed(frame(amplitude)) for amplitude in [3000, 3000, 0, 3000, 3000, 3000]]
+    assert results == [False, False, False, False, False, True]  # Pics isolés ignorés
+    print("✅ Détecteur OK")
+
+def test_barge_in_listener():
+    print("🧪 Test de l'écoute d'interruption...")
+    speech = [frame(5000)] * 15  # ~0,5 s de parole forte
+    microphone = FakeMicrophone([frame(100)] * 10 + speech + [frame(0)] * 40)
+    token = JetonAnnulation()
+    output = SortieNulle(realtime=True)
+    token.on_cancel(output.stop)
+    received = []
+
+    listener = EcouteInterruption(microphone, threshold=300, factor=3.0, min_speech=0.1, pause=0.3,
+                                  on_interrupt=lambda pcm, rate, width: received.append((pcm, rate, width)))
+    listener.start(token)
+    speech_start = time.perf_counter() + 10 * CHUNK / RATE
+    start = time.perf_counter()
+    output.play(np.zeros(5 * RATE, dtype=np.float32), RATE)  # Réponse de 5 s en cours
+    playback = time.perf_counter() - start
+    listener.stop()
+
+    reaction_ms = (listener.detection_time - speech_start) * 1000
+    print(f"   interruption {reaction_ms:.0f} ms après le début de la parole, lecture coupée après {playback:.2f}s")
+    assert token.cancelled and playback < 1.0
+    assert reaction_ms < 250
+    pcm, rate, width = received[0]
+    assert rate == RATE and width == 2
+    assert len(pcm) // (CHUNK * 2) >= len(speech)  # Début de la phrase conservé
+    print("✅ Écoute d'interruption OK")
+
+def test_echo_does_not_interrupt():
+    print("🧪 Test de l'écho de la réponse...")
+    echo = NiveauEcho()
+    echo_frames = [frame(amplitude) for amplitude in [1500, 2000, 2500] * 15]  # Bien au-dessus de 3 x 300
+    playing = threading.Event()
+
+    def answer(frames, seconds):
+        token = JetonAnnulation()
+        output = SortieNulle(realtime=True)
+        token.on_cancel(output.stop)
+        listener = EcouteInterruption(FakeMicrophone(frames), threshold=300, factor=3.0, min_speech=0.1, pause=0.3,
+                                      on_interrupt=lambda *audio: None, is_playing=playing.is_set, echo=echo)
+        listener.start(token)
+        playing.set()
+        output.play(np.zeros(int(seconds * RATE), dtype=np.float32), RATE)
+        playing.clear()
+        listener.stop()
+        return token.cancelled
+
+    assert not answer(list(echo_frames), 1.5)  # Sa propre voix ne coupe pas la réponse
+    print(f"   écho mesuré : {echo.level:.0f} (seuil ambiant 300)")
+    assert echo.level is not None and echo.level > 300
+    assert answer(echo_frames[:10] + [frame(15000)] * 15, 3.0)  # L'utilisateur, plus fort que l'écho, interrompt
+    print("✅ Écho OK")
+
+def test_listener_stops_without_speech():
+    print("🧪 Test de l'arrêt sans parole...")
+    token = JetonAnnulation()
+    listener = EcouteInterruption(FakeMicrophone([]), threshold=300, on_interrupt=lambda *audio: None)
+    listener.start(token)
+    time.sleep(0.1)
+    start = time.perf_counter()
+    listener.stop()
+    assert not token.cancelled and time.perf_counter() - start < 0.2
+    print("✅ Arrêt OK")
+
+def test_stages_stop_on_cancel():
+    print("🧪 Test de l'arrêt des étages...")
+    synthese = ProcessusSynthese("stub")
+    synthese.start()
+    token = JetonAnnulation()
+    token.on_cancel(synthese.interrupt)
+    threading.Timer(0.2, token.cancel).start()
+    start = time.perf_counter()
+    try:
+        synthese.speak("__lent__")
+        assert False
+    except OperationAnnulee:
+        pass
+    assert time.perf_counter() - start < 2
+    assert synthese.speak("Phrase suivante") >= 0  # Processus relancé
+    synthese.close()
+
+    token = JetonAnnulation()
+    synthesized = []
+    def synthesize(sentence):
+        synthesized.append(sentence)
+        time.sleep(0.05)
+        return sentence
+    threading.Timer(0.12, token.cancel).start()
+    try:
+        PipelineSynthese(synthesize, lambda buffer: time.sleep(0.05)).speak(" ".join(["Phrase."] * 40), token)
+        assert False
+    except OperationAnnulee:
+        pass
+    time.sleep(0.1)
+    assert len(synthesized) < 10  # La synthèse s'est arrêtée aussi
+    print("✅ Étages arrêtés OK")
+
+if __name__ == "__main__":
+    test_token()
+    test_detector()
+    test_barge_in_listener()
+    test_echo_does_not_interrupt()
+    test_listener_stops_without_speech()
+    test_stages_stop_on_cancel()
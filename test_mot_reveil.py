@@ -0,0 +1,90 @@
+"""
+Test du détecteur local de mot de réveil
+========================================
+
+Fixtures WAV écrites dans un dossier temporaire (voix de synthèse) : MFCC,
+DTW, chargement des modèles, détection en flux, mots proches rejetés et
+retard de détection
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from fixtures_audio import SAMPLE_RATE, synthesize_word, utterance, write_wav
+from mot_reveil import DetecteurMotReveil, dtw_cost, mfcc, read_wav, trim_silence
+
+WAKE_WORD = "a s i s t an"
+
+def replay(detector, samples, chunk=512):
+    detector.reset()
+    return [(start + chunk) / SAMPLE_RATE for start in range(0, len(samples), chunk)
+            if detector.feed(samples[start:start + chunk])]
+
+def test_features():
+    print("🧪 Test des MFCC et de la DTW...")
+    word = synthesize_word(WAKE_WORD, seed=1)
+    features = mfcc(word, SAMPLE_RATE)
+    assert features.shape == (1 + (len(word) - 400) // 160, 12)
+    assert dtw_cost(features, features) < 1e-6
+    slow = mfcc(synthesize_word(WAKE_WORD, seed=1, speed=0.7), SAMPLE_RATE)
+    other = mfcc(synthesize_word("m y z i k", seed=1), SAMPLE_RATE)
+    assert dtw_cost(features, slow) < dtw_cost(features, other)  # Débit différent, même mot
+
+    padded, _ = utterance([WAKE_WORD], seed=2)
+    assert len(trim_silence(padded, SAMPLE_RATE)) < len(padded) - SAMPLE_RATE
+    print("✅ MFCC et DTW OK")
+
+def test_detection_from_wav_fixtures():
+    print("🧪 Test de la détection sur fixtures WAV...")
+    with tempfile.TemporaryDirectory() as directory:
+        assert DetecteurMotReveil.from_directory(directory) is None  # Pas de modèle : repli sur Google
+        for seed in range(3):
+            write_wav(os.path.join(directory, f"assistant_{seed}.wav"), utterance([WAKE_WORD], seed=seed, lead=0.2, tail=0.2)[0])
+        detector = DetecteurMotReveil.from_directory(directory, sample_rate=SAMPLE_RATE)
+
+        fixture = os.path.join(directory, "commande.wav")
+        samples, bounds = utterance([WAKE_WORD, "u v r", "k r o m"], seed=42)
+        write_wav(fixture, samples)
+        samples, rate = read_wav(fixture)
+        assert rate == SAMPLE_RATE
+
+    hits = replay(detector, samples)
+    latency_ms = (hits[0] - bounds[0][1]) * 1000
+    print(f"   seuil {detector.threshold:.2f}, détection {latency_ms:.0f} ms après la fin du mot, "
+          f"{detector.last_check_ms:.1f} ms de calcul")
+    assert len(hits) == 1 and latency_ms < 300
+
+    for phonemes in ["d i s t an", "in s t an", "a s i è t", "b on j u r"]:
+        assert replay(detector, utterance([phonemes], seed=7)[0]) == [], phonemes
+    print("✅ Détection OK")
+
+def test_float_and_pcm_frames():
+    print("🧪 Test des trames PCM 16 bits...")
+    detector = DetecteurMotReveil([(utterance([WAKE_WORD], seed=s)[0], SAMPLE_RATE) for s in range(3)])
+    samples, _ = utterance([WAKE_WORD], seed=50)
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes()
+    detector.reset()
+    assert any(detector.feed(pcm[start:start + 1024]) for start in range(0, len(pcm), 1024))
+    print("✅ Trames PCM OK")
+
+def test_clipped_template_and_explicit_threshold():
+    print("🧪 Test d'un modèle coupé et d'un seuil explicite...")
+    templates = [(utterance([WAKE_WORD], seed=s)[0], SAMPLE_RATE) for s in range(3)]
+    word = trim_silence(templates[0][0], SAMPLE_RATE)
+    clipped = (word[:len(word) // 3], SAMPLE_RATE)  # Enregistrement interrompu trop tôt
+    detector = DetecteurMotReveil(templates + [clipped])
+    assert len(detector.templates) == 3 and np.isfinite(detector.threshold)
+    assert replay(detector, utterance(["b on j u r"], seed=7)[0]) == []  # Pas de réveil à chaque vérification
+
+    assert DetecteurMotReveil(templates, threshold=0).threshold == 0  # SEUIL_MOT_REVEIL = 0 respecté
+    print("✅ Modèle coupé et seuil explicite OK")
+
+if __name__ == "__main__":
+    test_features()
+    test_detection_from_wav_fixtures()
+    test_float_and_pcm_frames()
+    test_clipped_template_and_explicit_threshold()
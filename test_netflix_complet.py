@@ -16,7 +16,7 @@ def test_netflix_final():
     assistant = AssistantVocal()
     
     # Désactiver TTS pour les tests
-    def mock_speak(text):
+    def mock_speak(text, wait=True):
         print(f"🔇 [TTS désactivé] {text}")
     
     assistant.speak = mock_speak
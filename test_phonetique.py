@@ -0,0 +1,55 @@
+"""
+Test des clés phonétiques françaises
+====================================
+
+Vérifie que les homophones produits par la reconnaissance vocale retrouvent
+le nom d'application correspondant
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from phonetique import phonetic_key, phonetic_variants
+
+# (transcription de la reconnaissance vocale, nom de l'application)
+HOMOPHONES = [
+    ("spotifaille", "spotify"),
+    ("discorde", "discord"),
+    ("vé elle cé", "vlc"),
+    ("nette flix", "netflix"),
+    ("skaïpe", "skype"),
+    ("fotochope", "photoshop"),
+    ("crome", "chrome"),
+    ("audassiti", "audacity"),
+    ("ouatsape", "whatsapp"),
+    ("calculatrisse", "calculatrice"),
+]
+
+def test_homophones():
+    print("🧪 Test des homophones...")
+    for heard, app_name in HOMOPHONES:
+        key = phonetic_key(heard)
+        variants = phonetic_variants(app_name)
+        print(f"   '{heard}' [{key}] → '{app_name}' {sorted(variants)}")
+        assert key in variants
+    print("✅ Homophones OK")
+
+def test_distinct_names():
+    print("🧪 Test des noms distincts...")
+    assert not phonetic_variants("discord") & phonetic_variants("docker")
+    assert not phonetic_variants("steam") & phonetic_variants("teams")
+    print("✅ Noms distincts OK")
+
+def test_encoding_speed():
+    print("🧪 Test de la vitesse d'encodage...")
+    start = time.perf_counter()
+    for _ in range(1000):
+        phonetic_key("spotifaille")
+    print(f"   {(time.perf_counter() - start) * 1000:.3f} µs par clé")
+
+if __name__ == "__main__":
+    test_homophones()
+    test_distinct_names()
+    test_encoding_speed()
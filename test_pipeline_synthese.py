@@ -0,0 +1,102 @@
+"""
+Test de la synthèse en pipeline
+===============================
+
+Synthèse et lecture simulées (sleep) : ordre des phrases, texte jamais
+tronqué, recouvrement synthèse / lecture, file bornée et erreurs
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from pipeline_synthese import PipelineSynthese, split_text
+
+SYNTHESIS_SECONDS = 0.04
+PLAY_SECONDS = 0.05
+
+LONG_TEXT = " ".join(f"Phrase numéro {i} de la réponse, assez longue pour dépasser l'ancienne limite." for i in range(12))
+
+def test_split_text():
+    print("🧪 Test du découpage d'un texte complet...")
+    assert split_text("Bonjour. Il fait beau !\nFin sans point") == ["Bonjour.", "Il fait beau !", "Fin sans point"]
+    sentences = split_text(LONG_TEXT)
+    assert len(LONG_TEXT) > 400 and " ".join(sentences) == LONG_TEXT  # Rien n'est coupé
+    print("✅ Découpage OK")
+
+def test_overlap_and_order():
+    print("🧪 Test du recouvrement synthèse / lecture...")
+    played = []
+
+    def synthesize(sentence):
+        time.sleep(SYNTHESIS_SECONDS)
+        return sentence.upper()
+
+    def play(buffer):
+        time.sleep(PLAY_SECONDS)
+        played.append(buffer)
+
+    sentences = split_text(LONG_TEXT)
+    stats = PipelineSynthese(synthesize, play).speak(LONG_TEXT)
+    sequential = len(sentences) * (SYNTHESIS_SECONDS + PLAY_SECONDS)
+    print(f"   premier son {stats['premier_son']:.3f}s, total {stats['total']:.2f}s (séquentiel {sequential:.2f}s)")
+
+    assert played == [sentence.upper() for sentence in sentences]
+    assert stats["phrases"] == len(sentences)
+    assert stats["premier_son"] < SYNTHESIS_SECONDS * 2
+    assert stats["total"] < len(sentences) * PLAY_SECONDS + SYNTHESIS_SECONDS + 0.1
+    print("✅ Recouvrement OK")
+
+def test_bounded_queue():
+    print("🧪 Test de la file bornée...")
+    synthesized, played = [], []
+    max_ahead = []
+
+    def synthesize(sentence):
+        synthesized.append(sentence)
+        max_ahead.append(len(synthesized) - len(played))
+        return sentence
+
+    def play(buffer):
+        time.sleep(0.01)
+        played.append(buffer)
+
+    PipelineSynthese(synthesize, play, max_buffers=2).speak(LONG_TEXT)
+    assert max(max_ahead) <= 2 + 2  # File pleine + phrase en lecture + phrase en synthèse
+    print(f"   au plus {max(max_ahead)} phrases synthétisées d'avance")
+    print("✅ File bornée OK")
+
+def test_errors():
+    print("🧪 Test des erreurs...")
+    def failing_synthesize(sentence):
+        if "3" in sentence:
+            raise RuntimeError("modèle en panne")
+        return sentence
+
+    played = []
+    try:
+        PipelineSynthese(failing_synthesize, played.append).speak(LONG_TEXT)
+        assert False
+    except RuntimeError:
+        pass
+    assert len(played) == 3  # Les phrases précédentes ont été jouées
+
+    def failing_play(buffer):
+        raise OSError("carte son débranchée")
+
+    threads_before = threading.active_count()
+    try:
+        PipelineSynthese(lambda sentence: sentence, failing_play, max_buffers=1).speak(LONG_TEXT)
+        assert False
+    except OSError:
+        pass
+    assert threading.active_count() == threads_before  # Le thread de synthèse s'est arrêté
+    print("✅ Erreurs OK")
+
+if __name__ == "__main__":
+    test_split_text()
+    test_overlap_and_order()
+    test_bounded_queue()
+    test_errors()
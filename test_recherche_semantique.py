@@ -0,0 +1,219 @@
+"""
+Test de la recherche sémantique d'applications
+==============================================
+
+Vérifie le classement cosinus et les mises à jour incrémentales du magasin
+memmap avec un client d'embeddings local (sacs de trigrammes), puis les
+phrases d'intention sur le vrai catalogue si Ollama est joignable
+"""
+
+import os
+import sys
+import tempfile
+import time
+import zlib
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+
+import index_applications
+from client_ollama import get_client
+from index_applications import CatalogueIndex, trigram_profile
+from magasin_vecteurs import MagasinVecteurs, content_hash
+from recherche_semantique import EMBEDDING_MODEL, MIN_SIMILARITY, IndexSemantique, app_document
+
+class TrigramEmbeddingClient:
+    """Répond comme /api/embeddings avec un sac de trigrammes haché"""
+
+    def __init__(self, dim=256):
+        self.dim = dim
+        self.calls = 0
+
+    def post(self, path, payload):
+        self.calls += 1
+        vector = np.zeros(self.dim)
+        for trigram in trigram_profile(payload["prompt"].lower()):
+            vector[zlib.crc32(trigram.encode("utf-8")) % self.dim] += 1
+        return FakeResponse({"embedding": vector.tolist()})
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+def skip(reason):
+    """Test ignoré : signalé comme tel sous pytest, affiché en exécution directe"""
+    if "pytest" in sys.modules:
+        import pytest
+        pytest.skip(reason)
+    print(f"⚠️ {reason} - test ignoré")
+
+DOCUMENTS = {
+    "calc": "Calculatrice, calc, calculs",
+    "netflix": "Netflix, films, séries",
+    "discord": "Discord, discussion",
+    "vlc media player": "VLC media player, vlc, vidéo",
+}
+
+def test_cosine_ranking():
+    print("🧪 Test du classement cosinus...")
+    with tempfile.TemporaryDirectory() as tmp:
+        index = IndexSemantique(TrigramEmbeddingClient(), store_path=os.path.join(tmp, "embeddings"))
+        index.build(DOCUMENTS)
+
+        matches = index.search("une app pour les calculs", k=2)
+        print(f"   'une app pour les calculs' → {[(key, round(score, 2)) for key, score in matches]}")
+        assert matches[0][0] == "calc"
+        assert len(matches) == 2 and matches[0][1] >= matches[1][1]
+        assert index.search("regarder des films", k=1)[0][0] == "netflix"
+    print("✅ Classement OK")
+
+def test_incremental_store():
+    print("🧪 Test du magasin d'embeddings incrémental...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "embeddings")
+        client = TrigramEmbeddingClient()
+        IndexSemantique(client, store_path=path).build(DOCUMENTS)
+        assert client.calls == len(DOCUMENTS)
+
+        reloaded = IndexSemantique(client, store_path=path)
+        reloaded.build(DOCUMENTS)
+        assert client.calls == len(DOCUMENTS)  # Aucun nouvel embedding au redémarrage
+        assert isinstance(reloaded.store.matrix, np.memmap) and reloaded.store.matrix.dtype == np.float16
+        assert reloaded.search("calculs", k=1)[0][0] == "calc"
+
+        # Nouveau scan : une application modifiée, une ajoutée, une supprimée
+        rescanned = dict(DOCUMENTS, netflix="Netflix, films, séries, documentaires", spotify="Spotify, musique")
+        del rescanned["discord"]
+        calls_before = client.calls
+        rescan = IndexSemantique(client, store_path=path)
+        rescan.build(rescanned)
+        assert client.calls == calls_before + 2
+        assert rescan.store.rows["spotify"][0] == reloaded.store.rows["discord"][0]  # Ligne libérée réutilisée
+        assert all(key != "discord" for key, _ in rescan.search("discord", k=4))
+        assert rescan.search("musique", k=1)[0][0] == "spotify"
+
+        # Dépassement de la capacité initiale : la matrice est agrandie
+        many = dict(rescanned, **{f"outil {i}": f"Outil numéro {i}" for i in range(40)})
+        rescan.build(many)
+        assert len(rescan.store) == len(many) <= rescan.store.matrix.shape[0]
+        assert rescan.search("outil numéro 33", k=1)[0][0] == "outil 33"
+        assert rescan.search("calculs", k=1)[0][0] == "calc"
+    print("✅ Magasin incrémental OK")
+
+def test_interrupted_sync():
+    print("🧪 Test d'un scan interrompu par une erreur d'embedding...")
+
+    class FailingClient(TrigramEmbeddingClient):
+        def post(self, path, payload):
+            if "panne" in payload["prompt"]:
+                raise TimeoutError("Ollama ne répond plus")
+            return super().post(path, payload)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "embeddings")
+        client = FailingClient()
+        IndexSemantique(client, store_path=path).build(DOCUMENTS)
+
+        # discord supprimé (ligne réutilisée par spotify), netflix modifié, puis panne au milieu du scan
+        rescanned = {"calc": DOCUMENTS["calc"], "spotify": "Spotify, musique",
+                     "netflix": "Netflix, documentaires", "panne": "Outil en panne",
+                     "vlc media player": DOCUMENTS["vlc media player"], "zoom": "Zoom, visioconférence"}
+        try:
+            IndexSemantique(client, store_path=path).build(rescanned)
+            assert False, "l'erreur d'embedding doit remonter"
+        except TimeoutError:
+            pass
+
+        # Sur disque, chaque ligne avec une empreinte valide contient bien le vecteur de ce texte
+        store = MagasinVecteurs(path, EMBEDDING_MODEL)
+        assert "discord" not in store.rows and store.rows["spotify"][1] is not None
+        for key, (row, digest) in store.rows.items():
+            if digest is None:
+                continue
+            assert digest == content_hash(rescanned[key]), key
+            expected = np.asarray(client.post("", {"prompt": rescanned[key]}).json()["embedding"])
+            expected = expected / np.linalg.norm(expected)
+            assert np.allclose(store.matrix[row].astype(np.float32), expected, atol=1e-2), key
+
+        # Le scan suivant recalcule ce qui manque et ne recalcule pas le reste
+        rescanned["panne"] = "Outil réparé"
+        calls_before = client.calls
+        retry = IndexSemantique(client, store_path=path)
+        retry.build(rescanned)
+        assert client.calls == calls_before + 2  # "panne" et "zoom"
+        assert retry.search("visioconférence", k=1)[0][0] == "zoom"
+    print("✅ Scan interrompu OK")
+
+def test_rescans_during_build():
+    print("🧪 Test des scans arrivés pendant un calcul d'embeddings...")
+
+    class SlowClient(TrigramEmbeddingClient):
+        def __init__(self):
+            super().__init__()
+            self.active = self.max_active = 0
+
+        def post(self, path, payload):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            time.sleep(0.01)
+            try:
+                return super().post(path, payload)
+            finally:
+                self.active -= 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "embeddings")
+        client = SlowClient()
+        index = IndexSemantique(client, store_path=path)
+        versions = [DOCUMENTS, {**DOCUMENTS, "zoom": "Zoom, visioconférence"},
+                    {**DOCUMENTS, "zoom": "Zoom, réunions", "spotify": "Spotify, musique"}]
+        for documents in versions:
+            index.build_async(documents)
+        index.wait()
+
+        assert client.max_active == 1  # Jamais deux sync() en même temps
+        assert client.calls == len(DOCUMENTS) + 2  # Version intermédiaire remplacée par la dernière
+        store = MagasinVecteurs(path, EMBEDDING_MODEL)
+        assert set(store.rows) == set(versions[-1])
+        for key, (row, digest) in store.rows.items():
+            assert digest == content_hash(versions[-1][key]), key
+        assert index.search("réunions", k=1)[0][0] == "zoom"
+    print("✅ Scans pendant un calcul OK")
+
+def test_intent_phrases_ollama():
+    print("🧪 Test des phrases d'intention (Ollama)...")
+    client = get_client()
+    try:
+        client.get("/api/version", timeout=2).raise_for_status()
+    except Exception:
+        skip("Ollama non joignable")
+        return
+
+    applications, app_commands_map = index_applications.load_catalog(
+        os.path.join(os.path.dirname(__file__), "applications_assistant.json"))
+    catalog = CatalogueIndex(applications, app_commands_map)
+    documents = {key: app_document(data, catalog.commands_by_app.get(key, [])) for key, data in applications.items()}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = IndexSemantique(client, store_path=os.path.join(tmp, "embeddings"))
+        index.build(documents)
+        for phrase in ["je veux regarder un film", "démarre une app pour les calculs", "lance le navigateur"]:
+            start = time.perf_counter()
+            matches = index.search(phrase, k=3)
+            retained = "retenue" if matches and matches[0][1] >= MIN_SIMILARITY else "sous le seuil"
+            print(f"   '{phrase}' → {[(key, round(score, 2)) for key, score in matches]} "
+                  f"en {(time.perf_counter() - start) * 1000:.1f} ms ({retained}, seuil {MIN_SIMILARITY})")
+            assert len(matches) == 3 and all(-1.0 <= score <= 1.0 for _, score in matches)
+
+if __name__ == "__main__":
+    test_cosine_ranking()
+    test_incremental_store()
+    test_interrupted_sync()
+    test_rescans_during_build()
+    test_intent_phrases_ollama()
@@ -16,7 +16,7 @@ def test_search_improvements():
     assistant = AssistantVocal()
     
     # Mock speak pour la démo
-    def mock_speak(text):
+    def mock_speak(text, wait=True):
         print(f"🔊 [Assistant]: {text}")
     assistant.speak = mock_speak
     
@@ -77,7 +77,7 @@ def test_complete_workflow():
     assistant = AssistantVocal()
     
     # Mock speak
-    def mock_speak(text):
+    def mock_speak(text, wait=True):
         print(f"🔊 [Assistant]: {text}")
     assistant.speak = mock_speak
     
@@ -87,7 +87,7 @@ def test_complete_workflow():
     
     # 1. Analyse de la commande
     print("\n🔍 Étape 1: Analyse de commande")
-    analysis = assistant.ai_analyze_command(test_query)
+    analysis = assistant.ai_parse_intent(test_query)
     print(f"   🤖 Analyse: {analysis}")
     
     # 2. Recherche d'application
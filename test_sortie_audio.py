@@ -0,0 +1,80 @@
+"""
+Test des sorties audio et de la synthèse Coqui en mémoire
+=========================================================
+
+Avec un faux modèle Coqui (pas de téléchargement) et la sortie nulle :
+conversion WAV aller-retour, lecture d'échantillons, aucun fichier écrit
+même quand deux phrases sont synthétisées en même temps
+"""
+
+import os
+import sys
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from sortie_audio import SortieNulle, get_sortie_audio, samples_to_wav, wav_duration, wav_to_samples
+from synthese_vocale import coqui_synthesize
+
+class FakeSynthesizer:
+    output_sample_rate = 16000
+
+class FakeCoqui:
+    """Imite TTS.api.TTS : tts() retourne une liste de floats, 10 ms par caractère"""
+
+    synthesizer = FakeSynthesizer()
+
+    def tts(self, text):
+        t = np.arange(len(text) * 160) / 16000
+        return list(0.5 * np.sin(2 * np.pi * 440 * t))
+
+def test_wav_roundtrip():
+    print("🧪 Test de la conversion WAV...")
+    samples = np.linspace(-1, 1, 1600, dtype=np.float32)
+    wav = samples_to_wav(samples, 16000)
+    assert wav[:4] == b"RIFF" and abs(wav_duration(wav) - 0.1) < 1e-6
+    decoded, sample_rate = wav_to_samples(wav)
+    assert sample_rate == 16000 and np.abs(decoded - samples).max() < 1e-3
+    print("✅ Conversion OK")
+
+def test_coqui_in_memory():
+    print("🧪 Test de la synthèse Coqui en mémoire...")
+    output = SortieNulle()
+    with tempfile.TemporaryDirectory() as directory:
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            def speak(text):
+                output.play(*coqui_synthesize(FakeCoqui(), text))
+
+            threads = [threading.Thread(target=speak, args=(text,)) for text in ["Bonjour !", "Au revoir et à bientôt"]]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert os.listdir(directory) == []  # Aucun fichier temporaire
+        finally:
+            os.chdir(previous)
+    assert sorted(round(duration, 3) for duration in output.played) == [0.09, 0.22]
+    print("✅ Synthèse en mémoire OK")
+
+def test_unavailable_output_falls_back():
+    print("🧪 Test du repli sur la sortie nulle...")
+    try:
+        import winsound  # noqa: F401
+        print("   winsound disponible - test ignoré")
+    except ImportError:
+        assert isinstance(get_sortie_audio("winsound"), SortieNulle)
+    try:
+        get_sortie_audio("inexistante")
+        assert False
+    except ValueError as e:
+        print(f"   {e}")
+    print("✅ Repli OK")
+
+if __name__ == "__main__":
+    test_wav_roundtrip()
+    test_coqui_in_memory()
+    test_unavailable_output_falls_back()
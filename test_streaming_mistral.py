@@ -0,0 +1,52 @@
+"""
+Test du streaming Mistral avec découpage en phrases
+===================================================
+
+Vérifie que les phrases sont transmises à la synthèse vocale pendant la génération
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from assistant_vocal import AssistantVocal, split_sentences
+
+def test_split_sentences():
+    print("🧪 Test du découpage en phrases...")
+
+    sentences, rest = split_sentences("Bonjour. Il fait beau aujourd'hui ! Il fera 3.5 degrés")
+    assert sentences == ["Bonjour.", "Il fait beau aujourd'hui !"]
+    assert rest == "Il fera 3.5 degrés"
+
+    sentences, rest = split_sentences("Première ligne\n\nDeuxième phrase. ")
+    assert sentences == ["Première ligne", "Deuxième phrase."]
+    assert rest == ""
+
+    print("✅ Découpage correct")
+
+def test_streaming_time_to_first_sentence():
+    print("🧪 Test du temps avant la première phrase...")
+
+    assistant = AssistantVocal()
+    start_time = time.time()
+    timings = []
+
+    def mock_speak(text):
+        timings.append(time.time() - start_time)
+        print(f"🔊 [{timings[-1]:.2f}s] {text}")
+
+    response = assistant.query_mistral(
+        "Explique en trois phrases ce qu'est un assistant vocal.",
+        stream=True,
+        on_sentence=mock_speak
+    )
+    total = time.time() - start_time
+
+    print(f"📄 Réponse complète: {response}")
+    if timings:
+        print(f"⚡ Première phrase: {timings[0]:.2f}s / génération totale: {total:.2f}s")
+
+if __name__ == "__main__":
+    test_split_sentences()
+    test_streaming_time_to_first_sentence()
@@ -0,0 +1,72 @@
+"""
+Test du processus de synthèse vocale persistant
+===============================================
+
+Utilise le moteur "stub" (sans audio) : protocole, rendu WAV, réutilisation du même
+processus, relance après un plantage et moteur inconnu
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from synthese_vocale import ProcessusSynthese
+
+def test_persistent_process():
+    print("🧪 Test du processus persistant...")
+    synthese = ProcessusSynthese("stub")
+    synthese.start()
+    pid = synthese.process.pid
+
+    assert synthese.ping()
+    for text in ["Bonjour !", "Texte avec \"guillemets\", 'apostrophes' : et ; ponctuation", "Ligne 1\nLigne 2", "x" * 2000]:
+        assert synthese.speak(text, rate=1) >= 0
+    wav, _ = synthese.render("Bonjour !")
+    assert wav[:4] == b"RIFF" and len(wav) > 44  # WAV en mémoire
+    assert synthese.process.pid == pid  # Toujours le même processus
+    synthese.close()
+    assert synthese.process is None
+    print("✅ Processus persistant OK")
+
+def test_restart_after_crash():
+    print("🧪 Test de la relance après plantage...")
+    synthese = ProcessusSynthese("stub")
+    synthese.start()
+    pid = synthese.process.pid
+
+    synthese.process.kill()
+    synthese.process.wait()
+    assert synthese.speak("Toujours là ?") >= 0  # Relancé automatiquement
+    assert synthese.process.pid != pid and synthese.restarts == 1
+
+    try:
+        synthese.speak("__plantage__")  # Plante aussi après la relance
+        assert False
+    except RuntimeError:
+        pass
+    assert synthese.speak("Encore là") >= 0
+
+    restarts = synthese.restarts
+    try:
+        synthese.speak("__lent__", timeout=0.5)  # Processus vivant mais en retard
+        assert False
+    except RuntimeError:
+        pass
+    assert synthese.restarts == restarts  # Pas renvoyée : elle serait prononcée deux fois
+    assert synthese.speak("Après le délai") >= 0
+    synthese.close()
+    print("✅ Relance OK")
+
+def test_unknown_engine():
+    print("🧪 Test du moteur inconnu...")
+    try:
+        ProcessusSynthese("inexistant")
+        assert False
+    except ValueError as e:
+        print(f"   {e}")
+    print("✅ Moteur inconnu OK")
+
+if __name__ == "__main__":
+    test_persistent_process()
+    test_restart_after_crash()
+    test_unknown_engine()